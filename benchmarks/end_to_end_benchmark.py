@@ -0,0 +1,261 @@
+"""
+End-to-end throughput of ApiClient, DataScraper.scrape_all_rounds, FileStorage and DatabaseStorage against a local
+fake TheSportsDB server (see fake_sportsdb.py), compared with a stored baseline.
+
+Usage: PYTHONPATH=. python benchmarks/end_to_end_benchmark.py [--leagues 2] [--seasons 2] [--teams 20]
+       [--latency 0.005] [--error-rate 0.0] [--workers 4] [--database config/config.yaml] [--save-baseline]
+       [--tolerance 0.25]
+
+Run it from the repository root with the root on PYTHONPATH, so that the sports_api package can be imported.
+Results are only compared with a baseline recorded with the same dataset, latency, error rate and workers.
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import psycopg
+import yaml
+
+from fake_sportsdb import FakeSportsDB, SyntheticDataset
+from sports_api.api_client import ApiClient
+from sports_api.config import Config
+from sports_api.data_scraper import DataScraper
+from sports_api.metrics import MetricsRegistry
+from sports_api.storage.db_storage import DatabaseStorage
+from sports_api.storage.file_storage import FileStorage
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'end_to_end_baseline.json')
+
+# Metrics where a higher value is better; for the others (latency, memory) lower is better
+HIGHER_IS_BETTER = ('requests_per_second', 'rows_per_second')
+# Arguments that change the workload, so results are only comparable when they match the baseline's
+WORKLOAD_PARAMETERS = ('leagues', 'seasons', 'teams', 'latency', 'error_rate', 'workers')
+
+
+class RequestRecorder:
+    """
+    Collects the latency of every API call of a client through its request hooks.
+    """
+
+    def __init__(self, api_client: ApiClient):
+        self.latencies = []
+        self.errors = 0
+        self._lock = threading.Lock()
+        api_client.hooks.after_response(self._record)
+        api_client.hooks.on_error(self._record)
+
+    def _record(self, context: Any) -> None:
+        with self._lock:
+            self.latencies.append(context.elapsed)
+            self.errors += context.error is not None
+
+
+def percentile(values: list, fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def make_config(base_url: str, output_path: str, workers: int, database: Dict[str, Any] = None) -> Config:
+    config = Config(api_key='3', base_url=base_url)
+    config.config_data = {'data': {'output_path': output_path},
+                          'rate_limit': {'max_requests': 1_000_000, 'period': 1, 'max_workers': workers}}
+    if database is not None:
+        config.config_data['database'] = database
+    return config
+
+
+def make_scraper(config: Config, storage: Any) -> DataScraper:
+    scraper = DataScraper(config, api_client=ApiClient(config, metrics=MetricsRegistry()), storage=storage)
+    scraper.ROUND_DELAY = 0
+    return scraper
+
+
+def measure(run: Callable[[], int], recorder: RequestRecorder) -> Dict[str, Any]:
+    start = time.perf_counter()
+    rows = run()
+    seconds = time.perf_counter() - start
+    latencies = recorder.latencies
+    return {
+        'seconds': round(seconds, 3),
+        'requests': len(latencies),
+        'errors': recorder.errors,
+        'rows': rows,
+        'requests_per_second': round(len(latencies) / seconds, 1),
+        'rows_per_second': round(rows / seconds, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2) if latencies else None,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+def bench_api_client(dataset: SyntheticDataset, config: Config, workers: int) -> Dict[str, Any]:
+    api_client = ApiClient(config, metrics=MetricsRegistry())
+    recorder = RequestRecorder(api_client)
+
+    def fetch(key: tuple) -> int:
+        league_id, season, round_num = key
+        try:
+            return len(api_client.get_events_by_round(league_id, round_num, season).get('events') or [])
+        except Exception:
+            return 0
+
+    def run() -> int:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(fetch, list(dataset.events)))
+
+    return measure(run, recorder)
+
+
+def scrape_all(scraper: DataScraper, dataset: SyntheticDataset) -> int:
+    rows = 0
+    for league in dataset.leagues:
+        for season in dataset.seasons:
+            rows += len(scraper.scrape_all_rounds(int(league['idLeague']), season, save_individual_rounds=True,
+                                                  save_all_rounds=True) or [])
+    return rows
+
+
+def bench_file_storage(dataset: SyntheticDataset, config: Config) -> Dict[str, Any]:
+    scraper = make_scraper(config, FileStorage(config, metrics=MetricsRegistry()))
+    recorder = RequestRecorder(scraper.api_client)
+    return measure(lambda: scrape_all(scraper, dataset), recorder)
+
+
+def bench_database_storage(dataset: SyntheticDataset, config: Config) -> Optional[Dict[str, Any]]:
+    storage = DatabaseStorage(config, skip_unchanged_writes=False, metrics=MetricsRegistry())
+    try:
+        storage.db_manager.get_connection()
+    except psycopg.Error as e:
+        print(f'Skipping database_storage: {e}'.strip())
+        return None
+
+    scraper = make_scraper(config, storage)
+    recorder = RequestRecorder(scraper.api_client)
+
+    def run() -> int:
+        # Referenced rows first, so the foreign keys of teams and matches are satisfied
+        scraper.scrape_countries()
+        scraper.scrape_leagues()
+        storage.save({'venues': list(dataset.venues.values())}, 'venues')
+        for league in dataset.leagues:
+            scraper.scrape_teams_by_league(int(league['idLeague']))
+        return scrape_all(scraper, dataset)
+
+    try:
+        return measure(run, recorder)
+    finally:
+        storage.close()
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerance: float) -> list:
+    """
+    Print the change of every metric against the baseline.
+
+    :return: Regressions beyond the tolerance, as 'scenario.metric' names
+    """
+    regressions = []
+    for scenario, metrics in results.items():
+        for metric in (*HIGHER_IS_BETTER, 'p50_ms', 'p99_ms', 'peak_rss_mb'):
+            current, previous = metrics.get(metric), baseline.get(scenario, {}).get(metric)
+            if not current or not previous:
+                continue
+            change = (current - previous) / previous
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            flag = '  REGRESSION' if worse > tolerance else ''
+            if flag:
+                regressions.append(f'{scenario}.{metric}')
+            print(f'{scenario:18} {metric:20} {previous:>10} -> {current:>10} ({change:+.1%}){flag}')
+    return regressions
+
+
+def parameter_mismatches(parameters: Dict[str, Any], baseline_parameters: Dict[str, Any]) -> list:
+    """
+    Get the workload parameters that differ from the ones the baseline was recorded with.
+
+    :return: Descriptions like 'teams: 20 (baseline) != 4'
+    """
+    return [f'{name}: {baseline_parameters.get(name)} (baseline) != {parameters.get(name)}'
+            for name in WORKLOAD_PARAMETERS if parameters.get(name) != baseline_parameters.get(name)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--leagues', type=int, default=2)
+    parser.add_argument('--seasons', type=int, default=2)
+    parser.add_argument('--teams', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.005, help='Seconds added to every response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent requests in the api_client scenario')
+    parser.add_argument('--database', help='YAML config whose database section is used (skipped if unreachable)')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help='Store the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Relative change reported as a regression')
+    args = parser.parse_args()
+
+    dataset = SyntheticDataset(args.leagues, args.seasons, args.teams)
+    database = None
+    if args.database:
+        with open(args.database, 'r') as f:
+            database = (yaml.safe_load(f) or {}).get('database', {})
+
+    results = {}
+    with FakeSportsDB(dataset, latency=args.latency, error_rate=args.error_rate) as server, \
+            tempfile.TemporaryDirectory() as output_path:
+        print(f'{dataset.total_events} events in {len(dataset.events)} rounds, served at {server.base_url}')
+        results['api_client'] = bench_api_client(
+            dataset, make_config(server.base_url, os.path.join(output_path, 'api'), args.workers), args.workers)
+        results['file_storage'] = bench_file_storage(
+            dataset, make_config(server.base_url, os.path.join(output_path, 'files'), args.workers))
+        if database is not None:
+            result = bench_database_storage(
+                dataset, make_config(server.base_url, os.path.join(output_path, 'db'), args.workers, database))
+            if result is not None:
+                results['database_storage'] = result
+
+    print(f'{"scenario":18} {"req/s":>9} {"rows/s":>10} {"p50 ms":>8} {"p99 ms":>8} {"RSS MB":>8} {"errors":>7}')
+    for scenario, metrics in results.items():
+        print(f'{scenario:18} {metrics["requests_per_second"]:>9} {metrics["rows_per_second"]:>10} '
+              f'{metrics["p50_ms"]:>8} {metrics["p99_ms"]:>8} {metrics["peak_rss_mb"]:>8} {metrics["errors"]:>7}')
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            parameters = {key: value for key, value in vars(args).items() if key not in ('baseline', 'save_baseline')}
+            json.dump({'parameters': parameters, 'results': results}, f, indent=4)
+            f.write('\n')
+        print(f'Baseline saved to {args.baseline}')
+        return
+
+    if not os.path.exists(args.baseline):
+        print('No baseline to compare with (run with --save-baseline).')
+        return
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    mismatches = parameter_mismatches(vars(args), baseline.get('parameters', {}))
+    if mismatches:
+        print(f'Not compared with {args.baseline}, it was recorded with other parameters: {"; ".join(mismatches)}')
+        print('Rerun with the baseline parameters, or record a new baseline with --save-baseline.')
+        sys.exit(2)
+    print(f'Compared with {args.baseline}:')
+    regressions = compare(results, baseline['results'], args.tolerance)
+    if regressions:
+        print(f'Regressions beyond {args.tolerance:.0%}: {", ".join(regressions)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
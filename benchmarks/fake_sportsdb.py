@@ -0,0 +1,234 @@
+"""
+Local fake of the TheSportsDB v1 API serving synthetic data, for benchmarks.
+
+Usage: python benchmarks/fake_sportsdb.py [--leagues 2] [--seasons 2] [--teams 20] [--latency 0.01] [--error-rate 0.05]
+"""
+import argparse
+import datetime
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+class SyntheticDataset:
+    """
+    Deterministic leagues, seasons, teams, venues and double round-robin fixtures in the API's format.
+    """
+
+    def __init__(self, leagues: int = 2, seasons: int = 2, teams_per_league: int = 20, first_season: int = 2020,
+                 seed: int = 42):
+        """
+        :param leagues: Number of leagues (IDs 5001, 5002, ...)
+        :param seasons: Number of seasons per league ('2020-2021', ...)
+        :param teams_per_league: Number of teams per league (even); a season has 2 * (teams - 1) rounds
+        :param first_season: Start year of the first season
+        :param seed: Seed of the generated scores
+        """
+        if teams_per_league < 2 or teams_per_league % 2:
+            raise ValueError('teams_per_league must be an even number of at least 2.')
+        self.teams_per_league = teams_per_league
+        self.rounds_per_season = 2 * (teams_per_league - 1)
+        self.seasons = [f'{year}-{year + 1}' for year in range(first_season, first_season + seasons)]
+        self.countries = [{'name_en': f'Country {number}'} for number in range(1, leagues + 1)]
+        self.leagues = [{'idLeague': str(5000 + number), 'strLeague': f'Synthetic League {number}',
+                         'strSport': 'Soccer', 'strLeagueAlternate': f'SL{number}'}
+                        for number in range(1, leagues + 1)]
+        self.teams: Dict[str, list] = {}
+        self.venues: Dict[str, dict] = {}
+        self.events: Dict[tuple, list] = {}  # (league ID, season, round) -> events
+
+        rng = random.Random(seed)
+        for number, league in enumerate(self.leagues, start=1):
+            league_id = league['idLeague']
+            teams = []
+            for team_number in range(1, teams_per_league + 1):
+                team_id = str(number * 100000 + team_number)
+                venue = {'idVenue': team_id, 'strVenue': f'Stadium {team_id}', 'strCountry': f'Country {number}',
+                         'strLocation': f'City {team_id}', 'intCapacity': str(20000 + team_number * 1000)}
+                self.venues[team_id] = venue
+                teams.append({'idTeam': team_id, 'strTeam': f'Team {team_id}', 'strTeamShort': f'T{team_number:02}',
+                              'strTeamAlternate': '', 'intFormedYear': '1900', 'strSport': 'Soccer',
+                              'idLeague': league_id, 'strLeague': league['strLeague'], 'idVenue': team_id,
+                              'strLocation': venue['strLocation'], 'strCountry': f'Country {number}'})
+            self.teams[league_id] = teams
+
+            for season_index, season in enumerate(self.seasons):
+                for round_num, pairs in enumerate(self._fixtures(teams), start=1):
+                    kickoff = datetime.datetime(first_season + season_index, 8, 1, 15) + \
+                        datetime.timedelta(days=7 * (round_num - 1))
+                    self.events[(league_id, season, round_num)] = [
+                        self._event(league, season, round_num, index, home, away, kickoff, rng)
+                        for index, (home, away) in enumerate(pairs)]
+
+    @staticmethod
+    def _fixtures(teams: list) -> list:
+        # Circle method: every team plays every other team once per half of the season
+        rotation = list(teams)
+        first_half = []
+        for _ in range(len(teams) - 1):
+            half = len(rotation) // 2
+            first_half.append(list(zip(rotation[:half], reversed(rotation[half:]))))
+            rotation = [rotation[0], rotation[-1]] + rotation[1:-1]
+        return first_half + [[(away, home) for home, away in pairs] for pairs in first_half]
+
+    @staticmethod
+    def _event(league: dict, season: str, round_num: int, index: int, home: dict, away: dict,
+               kickoff: datetime.datetime, rng: random.Random) -> dict:
+        event_id = f'{league["idLeague"]}{season[:4]}{round_num:03}{index:02}'
+        return {
+            'idEvent': event_id, 'strEvent': f'{home["strTeam"]} vs {away["strTeam"]}',
+            'idLeague': league['idLeague'], 'strLeague': league['strLeague'], 'strSeason': season,
+            'intRound': str(round_num), 'idHomeTeam': home['idTeam'], 'strHomeTeam': home['strTeam'],
+            'idAwayTeam': away['idTeam'], 'strAwayTeam': away['strTeam'],
+            'intHomeScore': str(rng.choice((0, 0, 1, 1, 1, 2, 2, 3, 4))),
+            'intAwayScore': str(rng.choice((0, 0, 0, 1, 1, 2, 3))),
+            'strTimestamp': kickoff.strftime('%Y-%m-%dT%H:%M:%S'), 'dateEvent': kickoff.strftime('%Y-%m-%d'),
+            'strTime': kickoff.strftime('%H:%M:%S'), 'idVenue': home['idVenue'],
+            'strVenue': f'Stadium {home["idVenue"]}', 'strStatus': 'Match Finished', 'strSport': 'Soccer',
+        }
+
+    @property
+    def total_events(self) -> int:
+        return sum(len(events) for events in self.events.values())
+
+    def respond(self, endpoint: str, params: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Build the response body of an endpoint (unknown endpoints and IDs return the API's empty responses).
+        """
+        if endpoint == 'all_countries.php':
+            return {'countries': self.countries}
+        if endpoint == 'all_leagues.php':
+            return {'leagues': self.leagues}
+        if endpoint == 'lookupleague.php':
+            return {'leagues': [league for league in self.leagues if league['idLeague'] == params.get('id')] or None}
+        if endpoint == 'lookup_all_teams.php':
+            return {'teams': self.teams.get(params.get('id')) or None}
+        if endpoint == 'search_all_teams.php':
+            teams = [team for teams in self.teams.values() for team in teams if team['strLeague'] == params.get('l')]
+            return {'teams': teams or None}
+        if endpoint == 'lookupteam.php':
+            teams = [team for teams in self.teams.values() for team in teams if team['idTeam'] == params.get('id')]
+            return {'teams': teams or None}
+        if endpoint == 'lookupvenue.php':
+            venue = self.venues.get(params.get('id'))
+            return {'venues': [venue] if venue else None}
+        if endpoint == 'eventsround.php':
+            round_num = int(params['r']) if params.get('r', '').isdigit() else None
+            return {'events': self.events.get((params.get('id'), params.get('s'), round_num)) or None}
+        if endpoint == 'eventsseason.php':
+            events = [event for (league_id, season, _), round_events in self.events.items()
+                      if league_id == params.get('id') and season == params.get('s') for event in round_events]
+            return {'events': events[:100] or None}  # The free tier returns at most 100 events
+        return {}
+
+
+class FakeSportsDB:
+    """
+    HTTP server answering `/{api_key}/{endpoint}?{query}` requests from a SyntheticDataset on a background thread,
+    with optional per-request latency and injected 429 (Too Many Requests) responses.
+    """
+
+    def __init__(self, dataset: SyntheticDataset, latency: float = 0.0, error_rate: float = 0.0,
+                 host: str = '127.0.0.1', port: int = 0, seed: int = 42):
+        """
+        :param dataset: Data to serve
+        :param latency: Seconds added to every response
+        :param error_rate: Fraction of requests answered with 429
+        :param host: Address to listen on
+        :param port: Port to listen on (0 picks a free port)
+        :param seed: Seed of the injected errors
+        """
+        self.dataset = dataset
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests = 0
+        self.rejected = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/api/v1/json'
+
+    def start(self) -> 'FakeSportsDB':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'FakeSportsDB':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _reject(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            rejected = self._rng.random() < self.error_rate
+            self.rejected += rejected
+        return rejected
+
+    def _handler(self) -> type:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if fake.latency:
+                    time.sleep(fake.latency)
+                if fake._reject():
+                    self._send(429, b'Too Many Requests', {'Retry-After': '1'})
+                    return
+
+                url = urlsplit(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                body = json.dumps(fake.dataset.respond(url.path.rsplit('/', 1)[-1], params)).encode('utf-8')
+                self._send(200, body, {'Content-Type': 'application/json'})
+
+            def _send(self, status: int, body: bytes, headers: Dict[str, str]):
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--leagues', type=int, default=2)
+    parser.add_argument('--seasons', type=int, default=2)
+    parser.add_argument('--teams', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    dataset = SyntheticDataset(args.leagues, args.seasons, args.teams)
+    server = FakeSportsDB(dataset, args.latency, args.error_rate, port=args.port)
+    print(f'Serving {dataset.total_events} events at {server.base_url}/<api key>/ (Ctrl+C to stop)')
+    server.start()
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
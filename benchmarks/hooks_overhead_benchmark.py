@@ -0,0 +1,60 @@
+"""
+Measure the per-request overhead of the hook registry (requests.get is replaced by an in-memory stub).
+
+Usage: python benchmarks/hooks_overhead_benchmark.py [--requests 200000]
+"""
+import argparse
+import time
+from unittest.mock import patch
+
+from sports_api.config import Config
+from sports_api.metrics import MetricsRegistry
+from sports_api.services.base_service import BaseService
+from sports_api.services.hooks import HookRegistry
+
+
+class StubResponse:
+    status_code = 200
+    content = b'{"events": null}'
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {'events': None}
+
+
+def time_requests(service: BaseService, count: int) -> float:
+    response = StubResponse()
+    with patch('sports_api.services.base_service.requests.get', lambda url, **kwargs: response):
+        start = time.perf_counter()
+        for _ in range(count):
+            service._make_request('eventsround.php?id=4328&r=1&s=2024-2025')
+        return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=200000)
+    args = parser.parse_args()
+
+    config = Config(api_key='3', base_url='https://www.thesportsdb.com/api/v1/json')
+    no_op = HookRegistry()
+    for event in ('before_request', 'after_response', 'on_error'):
+        no_op.register(event, lambda context: None)
+
+    variants = {
+        'no registry': BaseService(config, metrics=MetricsRegistry()),
+        'empty registry': BaseService(config, metrics=MetricsRegistry(), hooks=HookRegistry()),
+        'no-op hooks': BaseService(config, metrics=MetricsRegistry(), hooks=no_op),
+    }
+    timings = {name: min(time_requests(service, args.requests) for _ in range(3))
+               for name, service in variants.items()}
+
+    baseline = timings['no registry']
+    for name, timing in timings.items():
+        print(f'{name:15} {timing * 1e9:8.0f} ns/request ({(timing - baseline) * 1e9:+6.0f} ns)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare the memory of events held as API dicts with compact Event records.
+
+Usage: python benchmarks/records_memory_benchmark.py [--events 50000]
+"""
+import argparse
+import json
+import tracemalloc
+
+from sports_api.models import Event, iter_records
+
+# Fields of an eventsround.php/eventsseason.php event
+EVENT_FIELDS = (
+    'idEvent', 'idAPIfootball', 'strEvent', 'strEventAlternate', 'strFilename', 'strSport', 'idLeague', 'strLeague',
+    'strLeagueBadge', 'strSeason', 'strDescriptionEN', 'strHomeTeam', 'strAwayTeam', 'intHomeScore', 'intRound',
+    'intAwayScore', 'intSpectators', 'strOfficial', 'strTimestamp', 'dateEvent', 'dateEventLocal', 'strTime',
+    'strTimeLocal', 'strGroup', 'idHomeTeam', 'strHomeTeamBadge', 'idAwayTeam', 'strAwayTeamBadge', 'intScore',
+    'intScoreVotes', 'strResult', 'idVenue', 'strVenue', 'strCountry', 'strCity', 'strPoster', 'strSquare',
+    'strFanart', 'strThumb', 'strBanner', 'strMap', 'strTweet1', 'strTweet2', 'strTweet3', 'strVideo', 'strStatus',
+    'strPostponed', 'strLocked',
+)
+
+
+def generate_events(count: int) -> list:
+    """
+    Generate events decoded from JSON, as the API client returns them.
+    """
+    events = []
+    for event_id in range(count):
+        event = {field: f'{field}-{event_id}' for field in EVENT_FIELDS}
+        event.update({'idEvent': str(event_id), 'idLeague': '4335', 'idHomeTeam': str(event_id % 20),
+                      'idAwayTeam': str((event_id + 1) % 20), 'intHomeScore': '1', 'intAwayScore': '0',
+                      'intRound': str(event_id % 38 + 1), 'strTimestamp': '2024-08-15T17:00:00',
+                      'strStatus': 'Match Finished'})
+        events.append(event)
+    return events
+
+
+def measure(build) -> tuple:
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--events', type=int, default=50000)
+    args = parser.parse_args()
+
+    body = json.dumps({'events': generate_events(args.events)})
+    response, dict_size = measure(lambda: json.loads(body))
+    del response
+    records, record_size = measure(lambda: list(iter_records(json.loads(body), Event)))
+
+    print(f'{len(records)} events')
+    print(f'API dicts:     {dict_size / 2 ** 20:8.1f} MiB ({dict_size / len(records):6.0f} B/event)')
+    print(f'Event records: {record_size / 2 ** 20:8.1f} MiB ({record_size / len(records):6.0f} B/event, '
+          f'{dict_size / record_size:.1f}x smaller)')
+
+
+if __name__ == '__main__':
+    main()
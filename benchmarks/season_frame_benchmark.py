@@ -0,0 +1,92 @@
+"""
+Benchmark SeasonFrame aggregates against plain loops over API-style events (dicts of strings).
+
+Usage: python benchmarks/season_frame_benchmark.py [--leagues 5] [--seasons 10] [--repeat 5]
+"""
+import argparse
+import random
+import time
+
+from sports_api.analytics.season_frame import SeasonFrame
+
+
+def generate_events(leagues: int, seasons: int, teams: int = 20, seed: int = 1) -> list:
+    """
+    Generate double round-robin seasons of events with the field format returned by the API.
+    """
+    rng = random.Random(seed)
+    events, event_id = [], 1
+    for league in range(leagues):
+        team_ids = [1000 * (league + 1) + team for team in range(teams)]
+        for season in range(seasons):
+            fixtures = [(home, away) for home in team_ids for away in team_ids if home != away]
+            rng.shuffle(fixtures)
+            for index, (home, away) in enumerate(fixtures):
+                round_num = index // (teams // 2) + 1
+                events.append({
+                    'idEvent': str(event_id), 'idLeague': str(4328 + league), 'strSeason': f'{2000 + season}-{2001 + season}',
+                    'intRound': str(round_num), 'strTimestamp': f'{2000 + season}-08-01T{index % 24:02d}:00:00',
+                    'idHomeTeam': str(home), 'idAwayTeam': str(away),
+                    'intHomeScore': str(rng.randint(0, 4)), 'intAwayScore': str(rng.randint(0, 3)),
+                })
+                event_id += 1
+    return events
+
+
+def baseline(events: list) -> tuple:
+    """
+    Goals per team, home/away splits and 5-match form with per-event Python loops.
+    """
+    goals, splits, history = {}, {}, {}
+    for event in sorted(events, key=lambda e: (e['strTimestamp'], int(e['idEvent']))):
+        if event['intHomeScore'] in (None, '') or event['intAwayScore'] in (None, ''):
+            continue
+        home, away = int(event['idHomeTeam']), int(event['idAwayTeam'])
+        home_score, away_score = int(event['intHomeScore']), int(event['intAwayScore'])
+        for team, scored, conceded, side in ((home, home_score, away_score, 'home'),
+                                             (away, away_score, home_score, 'away')):
+            team_goals = goals.setdefault(team, [0, 0, 0])
+            team_goals[0] += 1
+            team_goals[1] += scored
+            team_goals[2] += conceded
+            team_splits = splits.setdefault((team, side), [0, 0, 0])
+            team_splits[0 if scored > conceded else 1 if scored == conceded else 2] += 1
+            points = 3 if scored > conceded else 1 if scored == conceded else 0
+            history.setdefault(team, []).append(sum(history.get(team, [])[-4:]) + points)
+    return goals, splits, history
+
+
+def vectorised(frame: SeasonFrame) -> tuple:
+    return frame.goals_per_team(), frame.home_away_splits(), frame.rolling_form(5)
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--leagues', type=int, default=5)
+    parser.add_argument('--seasons', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    events = generate_events(args.leagues, args.seasons)
+    load_time = best_of(lambda: SeasonFrame.from_events(events), args.repeat)
+    frame = SeasonFrame.from_events(events)
+    baseline_time = best_of(lambda: baseline(events), args.repeat)
+    frame_time = best_of(lambda: vectorised(frame), args.repeat)
+
+    print(f'{len(events)} events ({args.leagues} leagues x {args.seasons} seasons)')
+    print(f'dict-of-strings loops: {baseline_time * 1000:8.1f} ms')
+    print(f'SeasonFrame load:      {load_time * 1000:8.1f} ms (once per dataset)')
+    print(f'SeasonFrame aggregates:{frame_time * 1000:8.1f} ms ({baseline_time / frame_time:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
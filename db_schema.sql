@@ -58,3 +58,9 @@ CREATE TABLE matches (
     round_number INTEGER,
     status VARCHAR(50)
 );
+
+CREATE TABLE content_hashes (
+    key VARCHAR(200) PRIMARY KEY,
+    hash CHAR(64) NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
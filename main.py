@@ -2,9 +2,11 @@ from sports_api.config import Config
 from sports_api.data_scraper import DataScraper
 from sports_api.storage.file_storage import FileStorage
 from sports_api.storage.db_storage import DatabaseStorage
+from sports_api.utils.logging_utils import configure_logging_from_config
 
 if __name__ == '__main__':
     config = Config()
+    configure_logging_from_config(config)
 
     # Test with file storage (default)
     print("=== Testing with File Storage ===")
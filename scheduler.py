@@ -1,28 +1,52 @@
-import datetime
+import logging
 
 import schedule
 from sports_api.config import Config
 from sports_api.data_scraper import DataScraper
+from sports_api.metrics import REGISTRY
+from sports_api.profiling import ScrapeProfiler
+from sports_api.utils.logging_utils import configure_logging_from_config
+
+logger = logging.getLogger('sports_api.scheduler')
+
+
+def export_metrics(config: Config):
+    metrics_file = config.get_metrics_settings()['file']
+    if metrics_file:
+        logger.info('Metrics written to %s', REGISTRY.write(metrics_file))
+
+
+def finish_profile(profiler: ScrapeProfiler):
+    if profiler is not None:
+        logger.info('Profile written to %s', profiler.finish()['report'])
 
 
 def job_scrape_league_table():
-    print(f"Starting job at {datetime.datetime.now()}...")
-    print("Scraping league table...")
+    logger.info('Starting job: scraping league table...')
     config = Config()
-    scraper = DataScraper(config)
+    profiler = ScrapeProfiler.from_config(config, 'scrape_league_table')
+    scraper = DataScraper(config, profiler=profiler)
+    if profiler is not None:
+        profiler.start()
     scraper.scrape_league_table(
         league_id=4335,  # Spanish La Liga
         season='2024-2025',
         save_data=True,
     )
-    print(f"Finished job at {datetime.datetime.now()}.", end="\n\n\n")
+    logger.info('Skipped unchanged saves: %s', scraper.storage.skip_counts)
+    scraper.storage.flush()
+    finish_profile(profiler)
+    export_metrics(config)
+    logger.info('Finished job.')
 
 
 def job_scrape_all_rounds():
-    print(f"Starting job at {datetime.datetime.now()}...")
-    print("Scraping all rounds...")
+    logger.info('Starting job: scraping all rounds...')
     config = Config()
-    scraper = DataScraper(config)
+    profiler = ScrapeProfiler.from_config(config, 'scrape_all_rounds')
+    scraper = DataScraper(config, profiler=profiler)
+    if profiler is not None:
+        profiler.start()
     scraper.scrape_all_rounds(
         league_id=4335,  # Spanish La Liga
         season='2024-2025',
@@ -30,10 +54,21 @@ def job_scrape_all_rounds():
         save_all_rounds=True,
         save_individual_rounds=True,
     )
-    print(f"Finished job at {datetime.datetime.now()}.", end="\n\n\n")
+    logger.info('Skipped unchanged saves: %s', scraper.storage.skip_counts)
+    scraper.storage.flush()
+    finish_profile(profiler)
+    export_metrics(config)
+    logger.info('Finished job.')
 
 
 def main():
+    config = Config()
+    configure_logging_from_config(config)
+    metrics_port = config.get_metrics_settings()['port']
+    if metrics_port:
+        REGISTRY.serve(metrics_port)
+        logger.info('Serving metrics on http://127.0.0.1:%s/metrics', metrics_port)
+
     schedule.every().sunday.at("23:30").do(job_scrape_league_table)
     schedule.every().sunday.at("23:30").do(job_scrape_all_rounds)
 
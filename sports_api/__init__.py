@@ -1,5 +1,10 @@
 """Sports API client for accessing the Sports DB API."""
 
+import logging
+
 from sports_api.api_client import ApiClient
 
+# Library logging is silent until the application configures it (e.g. sports_api.utils.logging_utils.configure_logging)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __all__ = ['ApiClient']
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+Analytics computed locally from stored match data.
+"""
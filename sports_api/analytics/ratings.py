@@ -0,0 +1,153 @@
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from sports_api.analytics.standings import FINISHED_STATUSES
+from sports_api.utils.file_utils import load_json_file, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class EloRatings:
+    """
+    Elo-style team ratings updated incrementally from finished matches.
+
+    The IDs of the applied matches are kept per league, so feeding a whole season again only processes the
+    matches that were not applied before, whatever order rounds are saved in (e.g. rescheduled games are
+    applied when they are played). New matches of a batch are applied in kick-off order.
+    Ratings are persisted to a JSON file and the IDs of newly applied matches are appended to a journal next to it
+    (e.g. ratings_applied.log), so a weekly run costs O(teams + new matches) rather than O(all matches ever).
+    """
+
+    FILE_NAME = 'ratings.json'
+
+    def __init__(self, file_path: Optional[str] = None, k_factor: float = 20.0, home_advantage: float = 60.0,
+                 initial_rating: float = 1500.0):
+        """
+        Initialize the ratings, loading the persisted state if it exists.
+
+        :param file_path: Optional path of the JSON file the ratings are persisted to
+        :param k_factor: Maximum rating change for a one-goal result
+        :param home_advantage: Rating points added to the home team when computing the expected result
+        :param initial_rating: Rating of teams without matches
+        """
+        self.file_path = file_path
+        self.applied_path = f'{os.path.splitext(file_path)[0]}_applied.log' if file_path else None
+        self.k_factor = k_factor
+        self.home_advantage = home_advantage
+        self.initial_rating = initial_rating
+
+        saved = load_json_file(file_path, default={}) if file_path else {}
+        self.ratings: Dict[str, float] = saved.get('ratings', {})
+        self.matches_played: Dict[str, int] = saved.get('matches_played', {})
+        self.applied: Dict[str, set] = {}
+        if self.applied_path:
+            self._replay_applied()
+
+    @classmethod
+    def from_config(cls, config: Any, **kwargs) -> 'EloRatings':
+        """
+        Create ratings persisted in the configured output directory.
+        """
+        return cls(os.path.join(config.get_output_settings()['output_path'], cls.FILE_NAME), **kwargs)
+
+    def update(self, events: Optional[Iterable[Dict[str, Any]]]) -> int:
+        """
+        Apply the finished matches that were not applied before and persist the ratings.
+
+        :param events: Events as returned by the API (any order, already applied ones are skipped)
+        :return: Number of matches applied
+        """
+        new_matches = {}
+        for event in events or []:
+            match = self._parse(event)
+            if match is None:
+                continue
+            league_key, position = match[0], match[1]
+            if position[1] in self.applied.get(league_key, ()):
+                continue
+            # The same event seen twice in one batch is applied once
+            new_matches[(league_key, position[1])] = match
+
+        for league_key, position, home_id, away_id, home_score, away_score in sorted(
+                new_matches.values(), key=lambda match: match[1]):
+            self._apply(home_id, away_id, home_score, away_score)
+            self.applied.setdefault(league_key, set()).add(position[1])
+
+        if new_matches and self.file_path:
+            write_json_atomic({'ratings': self.ratings, 'matches_played': self.matches_played}, self.file_path)
+            newly_applied = {}
+            for league_key, event_id in new_matches:
+                newly_applied.setdefault(league_key, []).append(event_id)
+            with open(self.applied_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(newly_applied) + '\n')
+        return len(new_matches)
+
+    def rating(self, team_id: Any) -> float:
+        """
+        Get the rating of a team (the initial rating if it has not played yet).
+        """
+        return self.ratings.get(str(team_id), self.initial_rating)
+
+    def expected_score(self, home_id: Any, away_id: Any) -> float:
+        """
+        Get the expected result of the home team (1 win, 0.5 draw, 0 loss).
+        """
+        difference = self.rating(away_id) - self.rating(home_id) - self.home_advantage
+        return 1 / (1 + 10 ** (difference / 400))
+
+    def ranking(self) -> List[Dict[str, Any]]:
+        """
+        Get the rated teams ordered by rating.
+
+        :return: List of {'idTeam', 'rating', 'matches'}
+        """
+        return [{'idTeam': team_id, 'rating': round(rating, 1), 'matches': self.matches_played.get(team_id, 0)}
+                for team_id, rating in sorted(self.ratings.items(), key=lambda item: -item[1])]
+
+    def _replay_applied(self) -> None:
+        """
+        Load the applied match IDs from the journal.
+        """
+        if not os.path.exists(self.applied_path):
+            return
+        with open(self.applied_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    newly_applied = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash while it was written
+                    logger.warning('Skipping invalid line in %s.', self.applied_path)
+                    continue
+                for league_key, event_ids in newly_applied.items():
+                    self.applied.setdefault(league_key, set()).update(event_ids)
+
+    def _apply(self, home_id: str, away_id: str, home_score: int, away_score: int) -> None:
+        expected = self.expected_score(home_id, away_id)
+        actual = 1.0 if home_score > away_score else 0.5 if home_score == away_score else 0.0
+        # Larger wins move ratings more (goal difference multiplier of the World Football Elo ratings)
+        margin = abs(home_score - away_score)
+        multiplier = 1.0 if margin <= 1 else 1.5 if margin == 2 else (11 + margin) / 8
+        change = self.k_factor * multiplier * (actual - expected)
+
+        self.ratings[home_id] = self.rating(home_id) + change
+        self.ratings[away_id] = self.rating(away_id) - change
+        for team_id in (home_id, away_id):
+            self.matches_played[team_id] = self.matches_played.get(team_id, 0) + 1
+
+    @staticmethod
+    def _parse(event: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Turn a finished event into (league key, (kick-off, idEvent), home, away, home score, away score).
+        """
+        home_score, away_score = event.get('intHomeScore'), event.get('intAwayScore')
+        if not event.get('idEvent') or not event.get('idHomeTeam') or not event.get('idAwayTeam') or \
+                home_score in (None, '') or away_score in (None, ''):
+            return None
+        if event.get('strStatus') and event['strStatus'] not in FINISHED_STATUSES:
+            return None
+        kickoff = str(event.get('strTimestamp') or event.get('dateEvent') or '')
+        position = (kickoff, f"{int(event['idEvent']):012d}")
+        return (str(event.get('idLeague') or ''), position, str(event['idHomeTeam']), str(event['idAwayTeam']),
+                int(home_score), int(away_score))
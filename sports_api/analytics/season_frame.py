@@ -0,0 +1,228 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+# Scores of matches without a result (not started, postponed)
+MISSING_SCORE = -1
+
+
+class SeasonFrame:
+    """
+    Typed, columnar view of stored matches for vectorised analytics.
+
+    Events returned by the API keep every field as a string inside a dict, so aggregates need a Python loop
+    per match. A SeasonFrame parses them once into NumPy columns (one array per field, one row per match),
+    and team-level aggregates are computed with bincount/cumsum over those columns.
+
+    Columns: event_id, league_id, round, timestamp (datetime64[s]), home_id, away_id, home_score, away_score
+    (MISSING_SCORE without a result) and season (indices into `seasons`).
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], seasons: List[str] = None, team_names: Dict[int, str] = None):
+        """
+        Initialize the frame from already typed columns (use from_events or from_storage to build one).
+
+        :param columns: Column arrays of equal length
+        :param seasons: Season names referenced by the 'season' column
+        :param team_names: Team names by team ID
+        """
+        self.columns = columns
+        self.seasons = seasons or []
+        self.team_names = team_names or {}
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]]) -> 'SeasonFrame':
+        """
+        Build a frame from events as returned by the API (duplicates by idEvent are kept once).
+
+        :param events: Events from rounds, season matches or several seasons
+        :return: SeasonFrame ordered by kick-off
+        """
+        unique = {}
+        for event in events:
+            if event.get('idEvent') and event.get('idHomeTeam') and event.get('idAwayTeam'):
+                unique[event['idEvent']] = event
+        rows = list(unique.values())
+
+        seasons, season_index, team_names = [], {}, {}
+        for event in rows:
+            season = event.get('strSeason') or ''
+            if season not in season_index:
+                season_index[season] = len(seasons)
+                seasons.append(season)
+            for id_field, name_field in (('idHomeTeam', 'strHomeTeam'), ('idAwayTeam', 'strAwayTeam')):
+                if event.get(name_field):
+                    team_names[int(event[id_field])] = event[name_field]
+
+        columns = {
+            'event_id': np.array([int(event['idEvent']) for event in rows], dtype=np.int64),
+            'league_id': np.array([int(event.get('idLeague') or 0) for event in rows], dtype=np.int64),
+            'season': np.array([season_index[event.get('strSeason') or ''] for event in rows], dtype=np.int16),
+            'round': np.array([int(event.get('intRound') or 0) for event in rows], dtype=np.int32),
+            'timestamp': np.array([_parse_timestamp(event) for event in rows], dtype='datetime64[s]'),
+            'home_id': np.array([int(event['idHomeTeam']) for event in rows], dtype=np.int64),
+            'away_id': np.array([int(event['idAwayTeam']) for event in rows], dtype=np.int64),
+            'home_score': np.array([_parse_score(event.get('intHomeScore')) for event in rows], dtype=np.int16),
+            'away_score': np.array([_parse_score(event.get('intAwayScore')) for event in rows], dtype=np.int16),
+        }
+        order = np.lexsort((columns['event_id'], columns['timestamp']))
+        return cls({name: column[order] for name, column in columns.items()}, seasons, team_names)
+
+    @classmethod
+    def from_storage(cls, storage: Any, league_id: int = None, season: str = None) -> 'SeasonFrame':
+        """
+        Build a frame from stored matches.
+
+        :param storage: FileStorage (any saved rounds, matches and season matches, optionally filtered) or
+                        DatabaseStorage (league_id and season are required)
+        :param league_id: Optional league ID
+        :param season: Optional season (e.g. '2024-2025')
+        :return: SeasonFrame
+        """
+        events = []
+        if hasattr(storage, 'load_events'):
+            events = storage.load_events(league_id, season)
+        elif hasattr(storage, 'matches_dao'):
+            events = storage.matches_dao.get_matches(league_id, season)
+        return cls.from_events(events)
+
+    def __len__(self) -> int:
+        return len(self.columns['event_id'])
+
+    @property
+    def finished(self) -> np.ndarray:
+        """
+        Boolean mask of matches with a result.
+        """
+        return (self.columns['home_score'] != MISSING_SCORE) & (self.columns['away_score'] != MISSING_SCORE)
+
+    def filter(self, mask: np.ndarray) -> 'SeasonFrame':
+        """
+        Get the matches selected by a boolean mask, e.g. frame.filter(frame.columns['round'] <= 10).
+        """
+        return SeasonFrame({name: column[mask] for name, column in self.columns.items()}, self.seasons,
+                           self.team_names)
+
+    def team_ids(self) -> np.ndarray:
+        """
+        Get the sorted IDs of all teams in the frame.
+        """
+        return np.unique(np.concatenate((self.columns['home_id'], self.columns['away_id'])))
+
+    def goals_per_team(self) -> Dict[str, np.ndarray]:
+        """
+        Get matches played, goals scored and conceded per team (finished matches only).
+
+        :return: Columns idTeam, played, goals_for, goals_against, aligned by team
+        """
+        frame = self.filter(self.finished)
+        team_ids, home, away = frame._team_positions()
+        size = len(team_ids)
+        home_score, away_score = frame.columns['home_score'], frame.columns['away_score']
+        return {
+            'idTeam': team_ids,
+            'played': np.bincount(home, minlength=size) + np.bincount(away, minlength=size),
+            'goals_for': np.bincount(home, home_score, size).astype(np.int64) +
+                         np.bincount(away, away_score, size).astype(np.int64),
+            'goals_against': np.bincount(home, away_score, size).astype(np.int64) +
+                             np.bincount(away, home_score, size).astype(np.int64),
+        }
+
+    def home_away_splits(self) -> Dict[str, np.ndarray]:
+        """
+        Get results and goals per team, split into home and away matches (finished matches only).
+
+        :return: Columns idTeam and {home,away}_{played,win,draw,loss,goals_for,goals_against}, aligned by team
+        """
+        frame = self.filter(self.finished)
+        team_ids, home, away = frame._team_positions()
+        size = len(team_ids)
+        home_score, away_score = frame.columns['home_score'], frame.columns['away_score']
+        splits = {'idTeam': team_ids}
+        for side, positions, scored, conceded in (('home', home, home_score, away_score),
+                                                  ('away', away, away_score, home_score)):
+            splits[f'{side}_played'] = np.bincount(positions, minlength=size)
+            splits[f'{side}_win'] = np.bincount(positions, scored > conceded, size).astype(np.int64)
+            splits[f'{side}_draw'] = np.bincount(positions, scored == conceded, size).astype(np.int64)
+            splits[f'{side}_loss'] = np.bincount(positions, scored < conceded, size).astype(np.int64)
+            splits[f'{side}_goals_for'] = np.bincount(positions, scored, size).astype(np.int64)
+            splits[f'{side}_goals_against'] = np.bincount(positions, conceded, size).astype(np.int64)
+        return splits
+
+    def rolling_form(self, window: int = 5) -> Dict[str, np.ndarray]:
+        """
+        Get each team's points over its last `window` matches after every finished match.
+
+        :param window: Number of matches in the rolling window
+        :return: Columns idTeam, idEvent, timestamp, points and form_points, one row per team and match,
+                 ordered by team and kick-off
+        """
+        frame = self.filter(self.finished)
+        home_score, away_score = frame.columns['home_score'], frame.columns['away_score']
+        home_points = np.where(home_score > away_score, 3, np.where(home_score == away_score, 1, 0))
+        away_points = np.where(away_score > home_score, 3, np.where(home_score == away_score, 1, 0))
+
+        team = np.concatenate((frame.columns['home_id'], frame.columns['away_id']))
+        event = np.concatenate((frame.columns['event_id'], frame.columns['event_id']))
+        timestamp = np.concatenate((frame.columns['timestamp'], frame.columns['timestamp']))
+        points = np.concatenate((home_points, away_points)).astype(np.int64)
+
+        order = np.lexsort((event, timestamp, team))
+        team, event, timestamp, points = team[order], event[order], timestamp[order], points[order]
+
+        # Rolling sums from cumulative sums, restarted at each team's first match
+        cumulative = np.cumsum(points)
+        group_start = np.flatnonzero(np.r_[True, team[1:] != team[:-1]])
+        starts = np.repeat(group_start, np.diff(np.r_[group_start, len(team)]))
+        window_start = np.maximum(np.arange(len(team)) - window + 1, starts)
+        before_window = np.where(window_start > 0, cumulative[window_start - 1], 0)
+        return {
+            'idTeam': team,
+            'idEvent': event,
+            'timestamp': timestamp,
+            'points': points,
+            'form_points': cumulative - before_window,
+        }
+
+    def head_to_head(self, team_a: int, team_b: int) -> Dict[str, int]:
+        """
+        Summarise the finished matches between two teams (home and away).
+
+        :param team_a: Team ID
+        :param team_b: Team ID
+        :return: Matches, wins of each team, draws and goals of each team
+        """
+        home_id, away_id = self.columns['home_id'], self.columns['away_id']
+        mask = self.finished & (((home_id == team_a) & (away_id == team_b)) | ((home_id == team_b) & (away_id == team_a)))
+        a_home = home_id[mask] == team_a
+        home_score = self.columns['home_score'][mask].astype(np.int64)
+        away_score = self.columns['away_score'][mask].astype(np.int64)
+        goals_a = np.where(a_home, home_score, away_score)
+        goals_b = np.where(a_home, away_score, home_score)
+        return {
+            'matches': int(mask.sum()),
+            'team_a_wins': int((goals_a > goals_b).sum()),
+            'team_b_wins': int((goals_b > goals_a).sum()),
+            'draws': int((goals_a == goals_b).sum()),
+            'team_a_goals': int(goals_a.sum()),
+            'team_b_goals': int(goals_b.sum()),
+        }
+
+    def _team_positions(self) -> tuple:
+        """
+        Map the home and away team columns to positions in the sorted team IDs.
+        """
+        team_ids = self.team_ids()
+        return (team_ids, np.searchsorted(team_ids, self.columns['home_id']),
+                np.searchsorted(team_ids, self.columns['away_id']))
+
+
+def _parse_score(value: Optional[str]) -> int:
+    return int(value) if value not in (None, '') else MISSING_SCORE
+
+
+def _parse_timestamp(event: Dict[str, Any]) -> Any:
+    value = event.get('strTimestamp') or event.get('dateEvent')
+    if not value:
+        return 'NaT'
+    return str(value)[:19].replace(' ', 'T').rstrip('Z')
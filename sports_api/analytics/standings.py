@@ -0,0 +1,198 @@
+import bisect
+from typing import Any, Dict, Iterable, List, Optional
+
+# Statuses of matches whose result is final (other statuses with scores are still in play)
+FINISHED_STATUSES = {'Match Finished', 'FT', 'AET', 'PEN', 'AP'}
+
+
+class StandingsEngine:
+    """
+    Computes league tables (points, goal difference, form) from finished matches without calling lookuptable.php.
+
+    Matches can be added incrementally as results arrive. Cumulative per-round snapshots are cached, so a table
+    for any round (including historical ones) only aggregates the rounds added since the last cached snapshot.
+    """
+
+    def __init__(self, points_for_win: int = 3, points_for_draw: int = 1, form_length: int = 5):
+        """
+        Initialize an empty engine.
+
+        :param points_for_win: Points awarded for a win
+        :param points_for_draw: Points awarded for a draw
+        :param form_length: Number of most recent results shown as form
+        """
+        self.points_for_win = points_for_win
+        self.points_for_draw = points_for_draw
+        self.form_length = form_length
+        self.team_names: Dict[str, str] = {}
+        self._matches: Dict[str, tuple] = {}
+        self._rounds: Dict[int, Dict[str, tuple]] = {}
+        self._round_numbers: List[int] = []
+        self._snapshots: Dict[int, Dict[str, dict]] = {}
+
+    @classmethod
+    def from_storage(cls, storage: Any, league_id: int, season: str, **kwargs) -> 'StandingsEngine':
+        """
+        Create an engine from the matches held by a storage.
+
+        :param storage: FileStorage (saved season matches and rounds) or DatabaseStorage (matches table)
+        :param league_id: League ID
+        :param season: Season (e.g. '2024-2025')
+        :param kwargs: Engine settings
+        :return: StandingsEngine with the stored finished matches
+        """
+        engine = cls(**kwargs)
+        if hasattr(storage, 'load_events'):
+            engine.add_matches(storage.load_events(league_id, season))
+        elif hasattr(storage, 'matches_dao'):
+            engine.add_matches(storage.matches_dao.get_matches(league_id, season))
+        return engine
+
+    def add_matches(self, matches: Optional[Iterable[Dict[str, Any]]]) -> int:
+        """
+        Add or update matches. Matches without a final result are ignored, and removed if they were added as
+        finished before (e.g. a result that was corrected back to in play).
+
+        :param matches: Events as returned by the API (or by MatchesDAO.get_matches)
+        :return: Number of finished matches added, changed or removed
+        """
+        changed = 0
+        first_changed_round = None
+        for match in matches or []:
+            normalized = self._normalize(match)
+            match_id = normalized[0] if normalized is not None else \
+                (str(match['idEvent']) if match.get('idEvent') is not None else None)
+            previous = self._matches.get(match_id)
+            if previous == normalized:
+                continue
+
+            changed_rounds = []
+            if previous is not None:
+                self._remove(previous)
+                changed_rounds.append(previous[1])
+            if normalized is not None:
+                round_num = normalized[1]
+                self._matches[match_id] = normalized
+                if round_num not in self._rounds:
+                    self._rounds[round_num] = {}
+                    bisect.insort(self._round_numbers, round_num)
+                self._rounds[round_num][match_id] = normalized
+                changed_rounds.append(round_num)
+
+            for round_num in changed_rounds:
+                first_changed_round = round_num if first_changed_round is None else min(first_changed_round, round_num)
+            changed += 1
+
+        if first_changed_round is not None:
+            # Cached snapshots from the first changed round onwards are stale
+            for round_num in [r for r in self._snapshots if r >= first_changed_round]:
+                del self._snapshots[round_num]
+        return changed
+
+    def table(self, round_num: int = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the league table after a round.
+
+        :param round_num: Last round included (None for all finished matches)
+        :return: {'table': [rows ordered by rank]} with the fields used by lookuptable.php (form most recent first)
+        """
+        stats = self._snapshot(round_num)
+        rows = []
+        for team_id, team in stats.items():
+            rows.append({
+                'idTeam': team_id,
+                'strTeam': self.team_names.get(team_id),
+                'intPlayed': team['played'],
+                'intWin': team['win'],
+                'intDraw': team['draw'],
+                'intLoss': team['loss'],
+                'intGoalsFor': team['goals_for'],
+                'intGoalsAgainst': team['goals_against'],
+                'intGoalDifference': team['goals_for'] - team['goals_against'],
+                'intPoints': team['points'],
+                'strForm': ''.join(team['form'][-self.form_length:][::-1]),
+            })
+
+        rows.sort(key=lambda row: (-row['intPoints'], -row['intGoalDifference'], -row['intGoalsFor'],
+                                   row['strTeam'] or row['idTeam']))
+        for rank, row in enumerate(rows, start=1):
+            row['intRank'] = rank
+        return {'table': rows}
+
+    def rounds(self) -> List[int]:
+        """
+        Get the rounds with finished matches.
+        """
+        return list(self._round_numbers)
+
+    def _remove(self, match: tuple) -> None:
+        match_id, round_num = match[0], match[1]
+        del self._matches[match_id]
+        del self._rounds[round_num][match_id]
+        if not self._rounds[round_num]:
+            del self._rounds[round_num]
+            self._round_numbers.remove(round_num)
+
+    def _snapshot(self, round_num: Optional[int]) -> Dict[str, dict]:
+        position = bisect.bisect_right(self._round_numbers, round_num) if round_num is not None \
+            else len(self._round_numbers)
+        if position == 0:
+            return {}
+        last_round = self._round_numbers[position - 1]
+        if last_round in self._snapshots:
+            return self._snapshots[last_round]
+
+        # Start from the latest cached snapshot before the requested round
+        start = position - 1
+        while start > 0 and self._round_numbers[start - 1] not in self._snapshots:
+            start -= 1
+        base = self._snapshots.get(self._round_numbers[start - 1], {}) if start > 0 else {}
+        stats = {team_id: dict(team, form=list(team['form'])) for team_id, team in base.items()}
+
+        for index in range(start, position):
+            current_round = self._round_numbers[index]
+            matches = sorted(self._rounds[current_round].values(), key=lambda match: (match[2], match[0]))
+            for _, _, _, home_id, away_id, home_score, away_score in matches:
+                self._apply(stats, home_id, home_score, away_score)
+                self._apply(stats, away_id, away_score, home_score)
+            self._snapshots[current_round] = {team_id: dict(team, form=list(team['form']))
+                                              for team_id, team in stats.items()}
+        return self._snapshots[last_round]
+
+    def _apply(self, stats: Dict[str, dict], team_id: str, scored: int, conceded: int) -> None:
+        team = stats.setdefault(team_id, {'played': 0, 'win': 0, 'draw': 0, 'loss': 0, 'goals_for': 0,
+                                          'goals_against': 0, 'points': 0, 'form': []})
+        team['played'] += 1
+        team['goals_for'] += scored
+        team['goals_against'] += conceded
+        if scored > conceded:
+            team['win'] += 1
+            team['points'] += self.points_for_win
+            team['form'].append('W')
+        elif scored == conceded:
+            team['draw'] += 1
+            team['points'] += self.points_for_draw
+            team['form'].append('D')
+        else:
+            team['loss'] += 1
+            team['form'].append('L')
+        del team['form'][:-self.form_length]
+
+    def _normalize(self, match: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Turn an event into (id, round, kick-off, home, away, home score, away score), or None if it is not finished.
+        """
+        match_id, home_id, away_id = match.get('idEvent'), match.get('idHomeTeam'), match.get('idAwayTeam')
+        home_score, away_score, status = match.get('intHomeScore'), match.get('intAwayScore'), match.get('strStatus')
+        if None in (match_id, home_id, away_id) or home_score in (None, '') or away_score in (None, ''):
+            return None
+        if status and status not in FINISHED_STATUSES:
+            return None
+
+        if match.get('strHomeTeam'):
+            self.team_names[str(home_id)] = match['strHomeTeam']
+        if match.get('strAwayTeam'):
+            self.team_names[str(away_id)] = match['strAwayTeam']
+        kickoff = match.get('strTimestamp') or match.get('dateEvent') or ''
+        return (str(match_id), int(match.get('intRound') or 0), str(kickoff), str(home_id), str(away_id),
+                int(home_score), int(away_score))
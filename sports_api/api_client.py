@@ -1,9 +1,17 @@
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Iterable
 
+from sports_api.metrics import MetricsRegistry, REGISTRY
+from sports_api.models import Event, League, Player, Team, Venue, iter_records
+from sports_api.services.batch import run_batch
+from sports_api.services.hooks import HookRegistry
 from sports_api.services.list_service import ListService
 from sports_api.services.lookup_service import LookupService
+from sports_api.services.quota import QuotaTracker
+from sports_api.services.rate_limiter import RateLimiter
+from sports_api.services.replay import ReplayTransport
 from sports_api.services.rounds_service import RoundsService
 from sports_api.services.schedule_service import ScheduleService
+from sports_api.services.search_index import SearchIndex
 from sports_api.services.search_service import SearchService
 from sports_api.config import Config
 
@@ -14,25 +22,66 @@ class ApiClient:
     This is the only class that users should interact with directly.
     """
 
-    def __init__(self, config: Optional[Config] = None, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(self, config: Optional[Config] = None, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 raw: bool = False, search_index: Optional[SearchIndex] = None,
+                 metrics: Optional[MetricsRegistry] = None, hooks: Optional[HookRegistry] = None,
+                 quota: Optional[QuotaTracker] = None, rate_limiter: Optional[RateLimiter] = None,
+                 transport: Optional[ReplayTransport] = None):
         """
         Initialize the API client.
 
         :param config: Optional Config object. If not provided, one will be created using api_key and base_url.
         :param api_key: Optional API key. Used only if config is not provided.
         :param base_url: Optional base URL. Used only if config is not provided.
+        :param raw: Whether to return undecoded response bodies (RawResponse) that are parsed only when accessed
+        :param search_index: Optional local SearchIndex that answers team/player/venue searches before the API
+        :param metrics: Optional MetricsRegistry for request metrics (defaults to the shared REGISTRY)
+        :param hooks: Optional HookRegistry (a new empty one by default); callbacks registered on client.hooks
+                      run around every API call
+        :param quota: Optional QuotaTracker counting the requests per API key (by default one from the 'quota'
+                      config section, if enabled)
+        :param rate_limiter: Optional RateLimiter shared with other clients, e.g. an interactive client and the
+                             client of a background DataScraper (a new one from the config by default)
+        :param transport: Optional ReplayTransport serving calls from recorded or stored responses, or recording
+                          live ones (by default one from the 'replay' config section, if a mode is set)
         """
         if config:
             self.config = config
         else:
             self.config = Config(api_key, base_url)
 
+        # All services share one rate limiter, so concurrent calls stay within the API limit
+        rate_limit = self.config.get_rate_limit_settings()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else \
+            RateLimiter(rate_limit['max_requests'], rate_limit['period'], rate_limit['aging'])
+        self.max_workers = rate_limit['max_workers']
+        self.metrics = metrics if metrics is not None else REGISTRY
+        self.hooks = hooks if hooks is not None else HookRegistry()
+        self.quota = quota if quota is not None else QuotaTracker.from_config(self.config)
+        self.transport = transport if transport is not None else ReplayTransport.from_config(self.config)
+
         # Initialize services
         self._rounds_service = RoundsService(self.config)
-        self._search_service = SearchService(self.config)
-        self._list_service = ListService(self.config)
-        self._lookup_service = LookupService(self.config)
-        self._schedule_service = ScheduleService(self.config)
+        self._search_service = SearchService(self.config, raw=raw, rate_limiter=self.rate_limiter,
+                                             search_index=search_index, metrics=self.metrics, hooks=self.hooks,
+                                             quota=self.quota, transport=self.transport)
+        self._list_service = ListService(self.config, raw=raw, rate_limiter=self.rate_limiter, metrics=self.metrics,
+                                         hooks=self.hooks, quota=self.quota, transport=self.transport)
+        self._lookup_service = LookupService(self.config, raw=raw, rate_limiter=self.rate_limiter,
+                                             metrics=self.metrics, hooks=self.hooks, quota=self.quota,
+                                             transport=self.transport)
+        self._schedule_service = ScheduleService(self.config, raw=raw, rate_limiter=self.rate_limiter,
+                                                 metrics=self.metrics, hooks=self.hooks, quota=self.quota,
+                                                 transport=self.transport)
+
+    @staticmethod
+    def _project(data: Any, record_type: type, as_records: bool) -> Any:
+        """
+        Return the response as is, or (opt-in) as a list of compact records.
+        """
+        if not as_records:
+            return data
+        return list(iter_records(data, record_type))
 
     def get_all_rounds(self, league_id: int, season: str, start_round: int, end_round: int,
                        output_path: str = None, output_file: str = None, save_data: bool = False) -> \
@@ -60,41 +109,45 @@ class ApiClient:
         )
 
     # Search methods
-    def search_team(self, name: str) -> Dict[str, Any]:
+    def search_team(self, name: str, as_records: bool = False) -> Dict[str, Any]:
         """
         Search for a team by name.
 
         :param name: Team name to search for, e.g. 'Arsenal'
+        :param as_records: Whether to return a list of compact Team records instead of the response
         :return: Search results
         """
-        return self._search_service.search_team_by_name(name)
+        return self._project(self._search_service.search_team_by_name(name), Team, as_records)
 
-    def search_player(self, name: str) -> Dict[str, Any]:
+    def search_player(self, name: str, as_records: bool = False) -> Dict[str, Any]:
         """
         Search for a player by name.
 
         :param name: Player name to search for (e.g. 'Danny'/'Welbeck'/'Danny_Welbeck')
+        :param as_records: Whether to return a list of compact Player records instead of the response
         :return: Search results
         """
-        return self._search_service.search_player_by_name(name)
+        return self._project(self._search_service.search_player_by_name(name), Player, as_records)
 
-    def search_event(self, event_name: str) -> Dict[str, Any]:
+    def search_event(self, event_name: str, as_records: bool = False) -> Dict[str, Any]:
         """
         Search for an event by name.
 
         :param event_name: Event name to search for (e.g. 'Arsenal_vs_Chelsea', 'Arsenal_vs_Chelsea&s=2016-2017')
+        :param as_records: Whether to return a list of compact Event records instead of the response
         :return: Search results
         """
-        return self._search_service.search_event_by_name(event_name)
+        return self._project(self._search_service.search_event_by_name(event_name), Event, as_records)
 
     # List methods
-    def get_all_leagues(self) -> Dict[str, Any]:
+    def get_all_leagues(self, as_records: bool = False) -> Dict[str, Any]:
         """
         Get a list of all leagues (limited to 50 on free tier).
 
+        :param as_records: Whether to return a list of compact League records instead of the response
         :return: List of leagues
         """
-        return self._list_service.get_all_leagues()
+        return self._project(self._list_service.get_all_leagues(), League, as_records)
 
     def get_all_countries(self) -> Dict[str, Any]:
         """
@@ -104,27 +157,31 @@ class ApiClient:
         """
         return self._list_service.get_all_countries()
 
-    def get_leagues_in_country(self, country: str, sport: Optional[str] = None) -> Dict[str, Any]:
+    def get_leagues_in_country(self, country: str, sport: Optional[str] = None, as_records: bool = False) -> Dict[
+        str, Any]:
         """
         Get a list of all leagues in a country (limited to 50 on free tier).
 
         :param country: Country name, e.g. 'England'
         :param sport: Optional sport name to filter by, e.g 'Soccer'
+        :param as_records: Whether to return a list of compact League records instead of the response
         :return: List of leagues in the country
         """
-        return self._list_service.get_all_leagues_in_country(country, sport)
+        return self._project(self._list_service.get_all_leagues_in_country(country, sport), League, as_records)
 
-    def get_teams_in_league(self, league_name: str, sport: Optional[str] = None, country: Optional[str] = None) -> Dict[
-        str, Any]:
+    def get_teams_in_league(self, league_name: str, sport: Optional[str] = None, country: Optional[str] = None,
+                            as_records: bool = False) -> Dict[str, Any]:
         """
         Get a list of all teams in a league.
 
         :param league_name: League name
         :param sport: Optional sport name, e.g 'Soccer'
         :param country: Optional country name, e.g. 'Spain'
+        :param as_records: Whether to return a list of compact Team records instead of the response
         :return: List of teams in the league
         """
-        return self._list_service.get_all_teams_in_league(league_name, sport, country)
+        return self._project(self._list_service.get_all_teams_in_league(league_name, sport, country), Team,
+                             as_records)
 
     def get_seasons_in_league(self, league_id: int, poster: Optional[int] = None, badge: Optional[int] = None) -> Dict[
         str, Any]:
@@ -166,33 +223,70 @@ class ApiClient:
         """
         return self._search_service.search_event_by_file_name(file_name)
 
-    def search_venue(self, name: str) -> Dict[str, Any]:
+    def search_venue(self, name: str, as_records: bool = False) -> Dict[str, Any]:
         """
         Search for a venue by name.
 
         :param name: Venue name to search for, e.g. 'Wembley'
+        :param as_records: Whether to return a list of compact Venue records instead of the response
         :return: Search results
         """
-        return self._search_service.search_venue_by_name(name)
+        return self._project(self._search_service.search_venue_by_name(name), Venue, as_records)
 
     # Lookup methods
-    def get_player_details(self, player_id: int) -> Dict[str, Any]:
+    def get_player_details(self, player_id: int, as_records: bool = False) -> Dict[str, Any]:
         """
         Get details for a player.
 
         :param player_id: Player ID, e.g. 34145937
+        :param as_records: Whether to return a list of compact Player records instead of the response
         :return: Player details
         """
-        return self._lookup_service.get_player_details(player_id)
+        return self._project(self._lookup_service.get_player_details(player_id), Player, as_records)
 
-    def get_venue_details(self, venue_id: int) -> Dict[str, Any]:
+    def get_venue_details(self, venue_id: int, as_records: bool = False) -> Dict[str, Any]:
         """
         Get details for a venue.
 
         :param venue_id: Venue ID, e.g. 16163
+        :param as_records: Whether to return a list of compact Venue records instead of the response
         :return: Venue details
         """
-        return self._lookup_service.get_venue_details(venue_id)
+        return self._project(self._lookup_service.get_venue_details(venue_id), Venue, as_records)
+
+    # Batch lookup methods
+    def get_players_details_many(self, player_ids: Iterable[int], max_workers: Optional[int] = None) -> Dict[
+        str, Dict[Any, Any]]:
+        """
+        Get details for many players concurrently (within the rate limit).
+
+        :param player_ids: Player IDs (duplicates are looked up once)
+        :param max_workers: Optional maximum number of concurrent requests (defaults to config)
+        :return: {'results': {player_id: details}, 'errors': {player_id: error message}}
+        """
+        return run_batch(self._lookup_service.get_player_details, player_ids, max_workers or self.max_workers)
+
+    def get_venues_details_many(self, venue_ids: Iterable[int], max_workers: Optional[int] = None) -> Dict[
+        str, Dict[Any, Any]]:
+        """
+        Get details for many venues concurrently (within the rate limit).
+
+        :param venue_ids: Venue IDs (duplicates are looked up once)
+        :param max_workers: Optional maximum number of concurrent requests (defaults to config)
+        :return: {'results': {venue_id: details}, 'errors': {venue_id: error message}}
+        """
+        return run_batch(self._lookup_service.get_venue_details, venue_ids, max_workers or self.max_workers)
+
+    def get_events_player_results_many(self, event_ids: Iterable[int], max_workers: Optional[int] = None) -> Dict[
+        str, Dict[Any, Any]]:
+        """
+        Get player results for many events concurrently (within the rate limit).
+
+        :param event_ids: Event IDs (duplicates are looked up once)
+        :param max_workers: Optional maximum number of concurrent requests (defaults to config)
+        :return: {'results': {event_id: player results}, 'errors': {event_id: error message}}
+        """
+        return run_batch(self._lookup_service.get_event_player_results, event_ids, max_workers or self.max_workers)
 
     def get_player_honours(self, player_id: int) -> Dict[str, Any]:
         """
@@ -259,22 +353,25 @@ class ApiClient:
         return self._lookup_service.get_team_equipment(team_id)
 
     # Schedule methods
-    def get_last_5_events_by_team(self, team_id: int) -> Dict[str, Any]:
+    def get_last_5_events_by_team(self, team_id: int, as_records: bool = False) -> Dict[str, Any]:
         """
         Get the last 5 events for a team (limited to home team for free tier).
 
         :param team_id: Team ID, e.g. 133602
+        :param as_records: Whether to return a list of compact Event records instead of the response
         :return: Last 5 events
         """
-        return self._schedule_service.get_last_5_events_by_team(team_id)
+        return self._project(self._schedule_service.get_last_5_events_by_team(team_id), Event, as_records)
 
-    def get_events_by_round(self, league_id: int, round_number: int, season: str) -> Dict[str, Any]:
+    def get_events_by_round(self, league_id: int, round_number: int, season: str, as_records: bool = False) -> Dict[
+        str, Any]:
         """
         Get events for a specific round in a league by league id/round/season.
 
         :param league_id: League ID, e.g. 4328
         :param round_number: Round number, e.g. 38
         :param season: Season, e.g. '2014-2015'
+        :param as_records: Whether to return a list of compact Event records instead of the response
         :return: Events in the round
 
         \n Note: Special round numbers:
@@ -286,14 +383,18 @@ class ApiClient:
           - Round 200 = Final
           - Round 500 = Pre-Season
         """
-        return self._schedule_service.get_events_by_round(league_id, round_number, season)
+        return self._project(self._schedule_service.get_events_by_round(league_id, round_number, season), Event,
+                             as_records)
 
-    def get_events_in_league_by_season(self, league_id: int, season: str) -> Dict[str, Any]:
+    def get_events_in_league_by_season(self, league_id: int, season: str, as_records: bool = False) -> Dict[
+        str, Any]:
         """
         Get all events in a league for a season (Free tier limited to 100 events).
 
         :param league_id: League ID, e.g. 4328
         :param season: Season, e.g. '2014-2015'
+        :param as_records: Whether to return a list of compact Event records instead of the response
         :return: Events in the league for the season
         """
-        return self._schedule_service.get_events_in_league_by_season(league_id, season)
+        return self._project(self._schedule_service.get_events_in_league_by_season(league_id, season), Event,
+                             as_records)
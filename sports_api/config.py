@@ -1,3 +1,4 @@
+import logging
 import os
 import yaml
 from typing import Optional
@@ -5,6 +6,11 @@ import requests
 
 from requests import RequestException
 
+logger = logging.getLogger(__name__)
+
+# Public keys of the free tier
+FREE_API_KEYS = ('3', '123')
+
 
 class Config:
     def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
@@ -16,6 +22,8 @@ class Config:
         :param base_url: Optional base URL
         :param config_path: Optional path to YAML config file
         """
+        self.config_data = {}
+
         if api_key and base_url:
             self.api_key = api_key
             self.base_url = base_url
@@ -25,10 +33,8 @@ class Config:
             # Always mask API key with at least 4 asterisks
             api_display = 'Not set' if not self.api_key else ('*' * max(4, len(str(self.api_key))))
 
-            print(f"""Configuration loaded successfully:
-            - API Key  : {api_display}
-            - Base URL : {self.base_url}
-            - Storage Path : {self.get_output_settings()['output_path']}\n""")
+            logger.info('Configuration loaded successfully: API key %s, base URL %s, storage path %s',
+                        api_display, self.base_url, self.get_output_settings()['output_path'])
 
     def _load_yaml_config(self, config_path: Optional[str] = None) -> bool:
         """
@@ -49,30 +55,30 @@ class Config:
                         self.config_data = yaml.safe_load(f)
 
                         if 'api' not in self.config_data:
-                            print(f"Error in {path}: 'api' section is missing")
+                            logger.error("Error in %s: 'api' section is missing", path)
                             continue
 
                         if 'key' not in self.config_data['api']:
-                            print(f"Error in {path}: 'api.key' is missing")
+                            logger.error("Error in %s: 'api.key' is missing", path)
                             continue
 
                         if 'base_url' not in self.config_data['api']:
-                            print(f"Error in {path}: 'api.base_url' is missing")
+                            logger.error("Error in %s: 'api.base_url' is missing", path)
                             continue
 
                         if not self.config_data['api']['key']:
-                            print(f"Error in {path}: 'api.key' is empty")
+                            logger.error("Error in %s: 'api.key' is empty", path)
                             continue
 
                         if not self.config_data['api']['base_url']:
-                            print(f"Error in {path}: 'api.base_url' is empty")
+                            logger.error("Error in %s: 'api.base_url' is empty", path)
                             continue
 
                     self.api_key = self.config_data['api']['key']
                     self.base_url = self.config_data['api']['base_url']
                     return True
                 except (yaml.YAMLError, KeyError) as e:
-                    print(f"Error loading YAML config from {path}: {e}")
+                    logger.error('Error loading YAML config from %s: %s', path, e)
 
         return False
 
@@ -89,14 +95,14 @@ class Config:
             #
             if response.status_code == 403:
                 # Status code 403 (Forbidden) is returned when the request is not allowed but credentials are correct
-                print("API connection verified successfully")
+                logger.info('API connection verified successfully')
                 return True
             else:
-                print(f"API connection failed with status code: {response.status_code}")
+                logger.error('API connection failed with status code: %s', response.status_code)
                 return False
 
         except RequestException as e:
-            print(f"API connection failed: {e}")
+            logger.error('API connection failed: %s', e)
             return False
 
     def _load_config(self, config_path: Optional[str] = None) -> None:
@@ -110,6 +116,16 @@ class Config:
     def get_credentials(self):
         return self.api_key, self.base_url
 
+    def is_premium(self) -> bool:
+        """
+        Whether the API key has premium access: 'api.premium' from the config file if set, otherwise any key
+        other than the public free-tier keys.
+        """
+        premium = (self.config_data.get('api') or {}).get('premium')
+        if premium is not None:
+            return bool(premium)
+        return str(self.api_key) not in FREE_API_KEYS
+
     def get_output_settings(self) -> dict:
         """
         Get output-related configuration.
@@ -148,3 +164,170 @@ class Config:
         config = defaults.copy()
         config.update(self.config_data['database'])
         return config
+
+    def get_freshness_settings(self) -> dict:
+        """
+        Get time-to-live (in hours) of scraped datasets per data type.
+        Data types without a TTL are always scraped from the API.
+        Returns merged configuration with defaults for missing values.
+        """
+        defaults = {
+            'countries': 720,
+            'leagues': 168,
+            'teams': 168
+        }
+
+        if 'freshness' not in self.config_data:
+            return defaults
+
+        # Merge defaults with values from config file
+        config = defaults.copy()
+        config.update(self.config_data['freshness'])
+        return config
+
+    def get_rate_limit_settings(self) -> dict:
+        """
+        Get API rate limit settings (requests allowed per period in seconds, workers for batch lookups, seconds
+        after which a waiting bulk request is promoted to interactive priority).
+        Returns merged configuration with defaults for missing values.
+        """
+        defaults = {
+            'max_requests': 30,
+            'period': 60,
+            'max_workers': 4,
+            'aging': 10
+        }
+
+        if 'rate_limit' not in self.config_data:
+            return defaults
+
+        # Merge defaults with values from config file
+        config = defaults.copy()
+        config.update(self.config_data['rate_limit'])
+        return config
+
+    def get_metrics_settings(self) -> dict:
+        """
+        Get metrics export settings (file the Prometheus text is written to after each job, port of the local
+        HTTP endpoint; None disables either).
+        Returns merged configuration with defaults for missing values.
+        """
+        defaults = {
+            'file': None,
+            'port': None
+        }
+
+        if 'metrics' not in self.config_data:
+            return defaults
+
+        # Merge defaults with values from config file
+        config = defaults.copy()
+        config.update(self.config_data['metrics'])
+        return config
+
+    def get_profiling_settings(self) -> dict:
+        """
+        Get profiling settings for scheduled jobs (stage timings, optional cProfile and tracemalloc; reports are
+        written to output_path, by default the 'profiles' directory of the data output path).
+        Returns merged configuration with defaults for missing values.
+        """
+        defaults = {
+            'enabled': False,
+            'cprofile': False,
+            'tracemalloc': False,
+            'output_path': None
+        }
+
+        if 'profiling' not in self.config_data:
+            return defaults
+
+        # Merge defaults with values from config file
+        config = defaults.copy()
+        config.update(self.config_data['profiling'])
+        return config
+
+    def get_quota_settings(self) -> dict:
+        """
+        Get quota accounting settings (requests per API key counted per minute, hour and day in a JSON file,
+        by default quota.json in the data output path; the optional limits are the budget used for planning).
+        Returns merged configuration with defaults for missing values.
+        """
+        defaults = {
+            'enabled': False,
+            'file': None,
+            'minute': None,
+            'hour': None,
+            'day': None
+        }
+
+        if 'quota' not in self.config_data:
+            return defaults
+
+        # Merge defaults with values from config file
+        config = defaults.copy()
+        config.update(self.config_data['quota'])
+        return config
+
+    def get_replay_settings(self) -> dict:
+        """
+        Get offline replay settings (mode 'replay', 'record' or 'auto', None to always call the API; the cassette
+        file, by default cassettes/cassette.jsonl in the data output path; whether saved data answers replays).
+        Returns merged configuration with defaults for missing values.
+        """
+        defaults = {
+            'mode': None,
+            'cassette': None,
+            'use_storage': True
+        }
+
+        if 'replay' not in self.config_data:
+            return defaults
+
+        # Merge defaults with values from config file
+        config = defaults.copy()
+        config.update(self.config_data['replay'])
+        return config
+
+    def get_proxy_settings(self) -> dict:
+        """
+        Get caching proxy settings (address to listen on, upstream API URL, cache TTLs in seconds per endpoint
+        name on top of the built-in ones, TTL of other endpoints and maximum number of cached responses).
+        Returns merged configuration with defaults for missing values.
+        """
+        defaults = {
+            'host': '127.0.0.1',
+            'port': 8089,
+            'upstream': 'https://www.thesportsdb.com/api/v1/json',
+            'ttl': {},
+            'default_ttl': 900,
+            'max_entries': 10000
+        }
+
+        if 'proxy' not in self.config_data:
+            return defaults
+
+        # Merge defaults with values from config file
+        config = defaults.copy()
+        config.update(self.config_data['proxy'])
+        return config
+
+    def get_logging_settings(self) -> dict:
+        """
+        Get logging settings (level, 'text' or 'json' format, and the rate limit of repeated messages:
+        burst messages with the same template per interval seconds).
+        Returns merged configuration with defaults for missing values.
+        """
+        defaults = {
+            'level': 'INFO',
+            'format': 'text',
+            'burst': 10,
+            'interval': 60
+        }
+
+        if 'logging' not in self.config_data:
+            return defaults
+
+        # Merge defaults with values from config file
+        config = defaults.copy()
+        config.update(self.config_data['logging'])
+        return config
@@ -0,0 +1,147 @@
+from typing import Any, Dict, Iterable, List
+
+from sports_api.storage.storage_interface import StorageInterface
+from sports_api.utils.league_resolver import LeagueResolver
+
+
+class CrawlPlanner:
+    """
+    Fills the gaps in the entity graph referenced by scraped events.
+
+    Leagues, teams and venues referenced by events (idLeague, idHomeTeam, idAwayTeam, idVenue) are checked
+    against the storage, and only the missing ones are fetched with as few requests as the free tier allows:
+    one all_leagues.php call for leagues, one search_all_teams.php call per league for teams, and one
+    lookupvenue.php call per venue. Entities are saved in foreign-key order (leagues -> venues -> teams),
+    so the events themselves can be saved afterwards.
+    """
+
+    def __init__(self, api_client: Any, storage: StorageInterface, league_resolver: LeagueResolver = None):
+        """
+        Initialize the crawl planner.
+
+        :param api_client: API client used to fetch missing entities
+        :param storage: Storage checked for existing entities and used to save fetched ones
+        :param league_resolver: Optional LeagueResolver used to find league names for team searches
+        """
+        self.api_client = api_client
+        self.storage = storage
+        self.league_resolver = league_resolver if league_resolver is not None else LeagueResolver()
+
+    @staticmethod
+    def collect_references(events: Iterable[Dict[str, Any]]) -> Dict[str, Dict[int, Any]]:
+        """
+        Collect the leagues, teams and venues referenced by events.
+
+        :param events: Events as returned by the API
+        :return: {'leagues': {league_id: league_name}, 'teams': {team_id: league_id}, 'venues': {venue_id: None}}
+        """
+        references = {'leagues': {}, 'teams': {}, 'venues': {}}
+        for event in events:
+            league_id = int(event['idLeague']) if event.get('idLeague') else None
+            if league_id:
+                references['leagues'][league_id] = event.get('strLeague')
+            for field in ('idHomeTeam', 'idAwayTeam'):
+                if event.get(field):
+                    references['teams'][int(event[field])] = league_id
+            if event.get('idVenue'):
+                references['venues'][int(event['idVenue'])] = None
+        return references
+
+    def plan(self, events: Iterable[Dict[str, Any]]) -> Dict[str, Dict[int, Any]]:
+        """
+        Find the referenced entities that are not stored yet.
+
+        :param events: Events as returned by the API
+        :return: Missing references in the same format as collect_references
+        """
+        return self._missing(self.collect_references(events))
+
+    def _missing(self, references: Dict[str, Dict[int, Any]]) -> Dict[str, Dict[int, Any]]:
+        missing = {}
+        for entity_type, referenced in references.items():
+            existing = self.storage.existing_ids(entity_type, referenced) if referenced else set()
+            missing[entity_type] = {item_id: value for item_id, value in referenced.items() if item_id not in existing}
+        return missing
+
+    def crawl(self, events: Iterable[Dict[str, Any]], save_data: bool = True) -> Dict[str, Any]:
+        """
+        Fetch the missing entities referenced by events and save them in foreign-key order.
+
+        :param events: Events as returned by the API
+        :param save_data: Whether to save the fetched entities
+        :return: Summary with the number of requests made, fetched entity counts and unresolved IDs
+        """
+        references = self.collect_references(events)
+        missing = self._missing(references)
+        requests_made = 0
+        unresolved = {'leagues': set(), 'teams': set(), 'venues': set()}
+
+        # Leagues: a single request returns every league available to the key
+        leagues_data = None
+        if missing['leagues']:
+            leagues_data = self.api_client.get_all_leagues()
+            requests_made += 1
+            self.league_resolver.update_from_response(leagues_data)
+            fetched = {int(league['idLeague']) for league in (leagues_data or {}).get('leagues') or []}
+            unresolved['leagues'] = set(missing['leagues']) - fetched
+
+        # Teams: one search per league of the missing teams, which also reveals the teams' venues
+        teams_by_league = {}
+        for team_id, league_id in missing['teams'].items():
+            teams_by_league.setdefault(league_id, set()).add(team_id)
+
+        teams_data = []
+        venue_ids = dict(missing['venues'])
+        for league_id, team_ids in teams_by_league.items():
+            league_name = (self.league_resolver.name(league_id) if league_id else None) or \
+                references['leagues'].get(league_id)
+            if not league_name:
+                unresolved['teams'].update(team_ids)
+                continue
+            data = self.api_client.get_teams_in_league(league_name)
+            requests_made += 1
+            teams = (data or {}).get('teams') or []
+            teams_data.append((league_id, data))
+            unresolved['teams'].update(team_ids - {int(team['idTeam']) for team in teams})
+            for team in teams:
+                if team.get('idVenue'):
+                    venue_ids.setdefault(int(team['idVenue']), None)
+
+        # Venues: only those not stored yet
+        existing_venues = self.storage.existing_ids('venues', venue_ids) if venue_ids else set()
+        venues = []
+        missing_venue_ids = [venue_id for venue_id in venue_ids if venue_id not in existing_venues]
+        if missing_venue_ids:
+            batch = self.api_client.get_venues_details_many(missing_venue_ids)
+            requests_made += len(missing_venue_ids)
+            for venue_id, data in batch['results'].items():
+                venues.extend((data or {}).get('venues') or [])
+            unresolved['venues'] = set(missing_venue_ids) - {int(venue['idVenue']) for venue in venues}
+
+        if save_data:
+            if leagues_data:
+                self.storage.save(leagues_data, 'leagues')
+            if venues:
+                self.storage.save({'venues': self._merge_stored('venues', 'idVenue', venues)}, 'venues')
+            for league_id, data in teams_data:
+                self.storage.save(data, 'teams', league_id=league_id)
+
+        return {
+            'requests': requests_made,
+            'fetched': {
+                'leagues': len(missing['leagues']) - len(unresolved['leagues']),
+                'teams': sum(len((data or {}).get('teams') or []) for _, data in teams_data),
+                'venues': len(venues),
+            },
+            'unresolved': {entity_type: sorted(ids) for entity_type, ids in unresolved.items()},
+        }
+
+    def _merge_stored(self, entity_type: str, id_field: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge fetched records with those already stored under the same data type (so file storage keeps
+        a single complete file instead of overwriting it with the new records only).
+        """
+        stored = self.storage.load(entity_type)
+        merged = {record[id_field]: record for record in (stored or {}).get(entity_type) or []}
+        merged.update((record[id_field], record) for record in records)
+        return list(merged.values())
@@ -1,12 +1,36 @@
+import itertools
+import logging
+import os
+import re
+from collections.abc import Mapping
+from contextlib import nullcontext
 from time import sleep
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from sports_api import ApiClient
+from sports_api.analytics.ratings import EloRatings
+from sports_api.analytics.standings import StandingsEngine
 from sports_api.config import Config
+from sports_api.crawl_planner import CrawlPlanner
+from sports_api.live_poller import LivePoller
+from sports_api.profiling import ScrapeProfiler
+from sports_api.request_planner import RequestPlanner, ScrapeTask
+from sports_api.storage.content_hash import make_content_key
 from sports_api.storage.file_storage import FileStorage
+from sports_api.services.batch import run_batch
+from sports_api.services.rate_limiter import BULK, request_priority
+from sports_api.services.raw_response import RawResponse
+from sports_api.services.schedule_service import FREE_TIER_SEASON_EVENTS_LIMIT
+from sports_api.storage.freshness_registry import FreshnessRegistry
+from sports_api.storage.round_range_cache import RoundRangeCache, SPECIAL_ROUNDS, is_season_complete
 from sports_api.storage.storage_interface import StorageInterface
 from sports_api.storage.db_storage import DatabaseStorage
-from sports_api.utils.datascraper_utils import league_id_to_name
+from sports_api.utils.league_resolver import LeagueResolver
+
+logger = logging.getLogger(__name__)
+
+# Raw body whose keys are all null or empty, e.g. b'{"countries": null}'
+EMPTY_RAW_RESPONSE = re.compile(rb'\s*\{\s*(?:"[^"]*"\s*:\s*(?:null|\[\s*\]|\{\s*\}|"")\s*,?\s*)*\}\s*')
 
 
 class DataScraper:
@@ -14,16 +38,36 @@ class DataScraper:
     Responsible for scraping data from the API and saving it to disk.
     """
 
-    def __init__(self, config: Config = None, api_client: Any = None, storage: StorageInterface = None):
+    LEAGUE_DATA_TYPES = ('leagues', 'teams', 'rounds', 'season_matches')
+    EVENT_DATA_TYPES = ('rounds', 'matches', 'season_matches')
+    # Pause after every round request, in seconds (on top of the API client's rate limiter)
+    ROUND_DELAY = 1
+    # Priority of the scraper's API calls, so interactive calls sharing the rate limiter are served first
+    REQUEST_PRIORITY = BULK
+
+    def __init__(self, config: Config = None, api_client: Any = None, storage: StorageInterface = None,
+                 raw: bool = False, league_resolver: LeagueResolver = None, ratings: EloRatings = None,
+                 profiler: ScrapeProfiler = None):
         """
         Initialize the data scraper.
 
         :param config: Config object
         :param api_client: Any API client that provides data retrieval methods
         :param storage: StorageInterface object to use for saving data (defaults to FileStorage)
+        :param raw: Whether the default API client should return undecoded response bodies, so that
+                    FileStorage writes them without parsing and re-serialising (ignored if api_client is given)
+        :param league_resolver: LeagueResolver for league names and slugs (defaults to one persisted in the
+                                output directory)
+        :param ratings: Optional EloRatings updated with every saved batch of events (e.g.
+                        EloRatings.from_config(config))
+        :param profiler: Optional ScrapeProfiler timing the fetch, decode, transform and save stages
         """
         self.config = config
-        self.api_client = api_client or (ApiClient(config) if config else None)
+        if league_resolver is not None:
+            self.league_resolver = league_resolver
+        else:
+            self.league_resolver = LeagueResolver.from_config(config) if config else LeagueResolver()
+        self.api_client = api_client or (ApiClient(config, raw=raw) if config else None)
 
         if not self.api_client:
             raise ValueError("Either valid config or api_client must be provided.")
@@ -35,88 +79,278 @@ class DataScraper:
             self.storage = DatabaseStorage(self.config)
         else:
             # Default to FileStorage
-            self.storage = FileStorage(config)
+            self.storage = FileStorage(config, league_resolver=self.league_resolver)
+
+        if isinstance(self.storage, FileStorage) and self.storage.league_resolver is None:
+            self.storage.league_resolver = self.league_resolver
+
+        # Last successful scrape per dataset, used to serve still-fresh data from storages that can load it back
+        if self.config:
+            output_path = self.config.get_output_settings()['output_path']
+            self.freshness = None
+            if self.storage.supports_load:
+                self.freshness = FreshnessRegistry(os.path.join(output_path, 'freshness.json'),
+                                                   self.config.get_freshness_settings())
+            self.round_ranges = RoundRangeCache(os.path.join(output_path, 'round_ranges.json'))
+        else:
+            self.freshness = None
+            self.round_ranges = RoundRangeCache()
+
+        # Standings engines per (league_id, season), kept up to date with every retrieved round
+        self.standings = {}
+
+        self.ratings = ratings
 
-    def scrape_data(self, scraper_func: Callable, save_data: bool = False, data_type: str = None, **kwargs) -> Any:
+        self.profiler = profiler
+        if self.profiler is not None:
+            self.profiler.attach(self.api_client)
+
+    def _stage(self, stage: str, label: Any):
+        """
+        Profile a stage of the job (no-op without a profiler).
+        """
+        return self.profiler.stage(stage, label) if self.profiler is not None else nullcontext()
+
+    def _request_stage(self, label: Any):
+        """
+        Profile an API call as fetch and decode stages (no-op without a profiler).
+        """
+        return self.profiler.request(label) if self.profiler is not None else nullcontext()
+
+    def scrape_data(self, scraper_func: Callable, save_data: bool = False, data_type: str = None,
+                    force_refresh: bool = False, single_request: bool = True, **kwargs) -> Any:
         """
         Generic method to scrape data using the provided scraper function.
+        Datasets whose data type has a TTL policy are returned from storage without calling the API
+        while they are still fresh.
 
         :param scraper_func: Function that will be called to retrieve data
         :param save_data: Whether to save the data
         :param data_type: Type of data for automatic file naming
+        :param force_refresh: Whether to call the API even if stored data is still fresh
+        :param single_request: Whether scraper_func is a single API call, profiled as one request (functions making
+                               several calls profile each of them)
         :param kwargs: Additional arguments to pass to the scraper function and storage
         :return: The scraped data
         """
-        data = scraper_func(**kwargs)
+        dataset_key = make_content_key(data_type, **kwargs) if data_type else None
+
+        if dataset_key and self.freshness and not force_refresh and self.freshness.is_fresh(dataset_key, data_type):
+            data = self.storage.load(data_type, **kwargs) if self.storage else None
+            if data:
+                logger.info('Stored %s data is still fresh, skipping API call.', data_type)
+                return data
+
+        request_stage = self._request_stage(data_type) if single_request else nullcontext()
+        with request_stage, request_priority(self.REQUEST_PRIORITY):
+            data = scraper_func(**kwargs)
+
+        if data_type in self.LEAGUE_DATA_TYPES and data and not isinstance(data, RawResponse):
+            # League IDs and names come with these responses, so the resolver learns them without extra requests
+            # (raw responses are saved as they are, so they are not decoded for it)
+            with self._stage('transform', data_type):
+                self.league_resolver.update_from_response(data)
 
         if data and save_data and self.storage:
-            self.storage.save(data, data_type, **kwargs)
+            self._save(data, data_type, **kwargs)
+            # Only complete, non-empty datasets are fresh, so an empty response (e.g. during an outage) is not served
+            # from storage for the whole TTL
+            if dataset_key and self.freshness and self.freshness.ttl_hours.get(data_type) and \
+                    getattr(self.storage, 'last_save_complete', True) and self._has_records(data):
+                self.freshness.mark_scraped(dataset_key)
 
         return data
 
-    def _retrieve_all_rounds(self, league_id: int, season: str, start_round: int, end_round: int,
-                             save_individual_rounds: bool = False) -> list[Any]:
+    @staticmethod
+    def _has_records(data: Any) -> bool:
+        """
+        Check that a response holds records (e.g. not {'countries': None}).
+        Raw responses are checked on their body, so they are not decoded.
+        """
+        if isinstance(data, RawResponse):
+            return EMPTY_RAW_RESPONSE.fullmatch(data.content) is None
+        if isinstance(data, Mapping):
+            return any(data.values())
+        return bool(data)
+
+    def _save(self, data: Any, data_type: str, **kwargs) -> Any:
+        """
+        Save data to storage; saved events also update the ratings, if any (only matches not applied to the
+        ratings before are processed).
+        """
+        label = f"round {kwargs['round_num']}" if kwargs.get('round_num') is not None else data_type
+        with self._stage('save', label):
+            result = self.storage.save(data, data_type, **kwargs)
+        if self.ratings is not None and data_type in self.EVENT_DATA_TYPES:
+            with self._stage('transform', label):
+                events = data.get('events') if isinstance(data, Mapping) else data
+                self.ratings.update(events)
+        return result
+
+    def _retrieve_all_rounds(self, league_id: int, season: str, start_round: int, end_round: int = None,
+                             save_individual_rounds: bool = False, rounds: list[int] = None,
+                             max_empty_rounds: int = 2, include_special_rounds: bool = False,
+                             max_errors: int = 3) -> list[Any]:
         """
         Retrieve data for all rounds in the specified range.
+        Without an end round (or explicit list of rounds), rounds are requested until max_empty_rounds
+        consecutive rounds have no matches, and the discovered rounds are cached for later runs.
+        Discovery gives up after max_errors consecutive failed rounds (e.g. during an API outage).
 
         :param league_id: League ID (e.g. 4335 for Spanish La Liga)
         :param season: Season (e.g. '2024-2025')
         :param start_round: Number of the first round to retrieve
-        :param end_round: Number of the last round to retrieve (inclusive)
+        :param end_round: Number of the last round to retrieve (inclusive), None to discover it
         :param save_individual_rounds: Whether to save each round to a separate file
+        :param rounds: Optional explicit round numbers to retrieve (overrides the range)
+        :param max_empty_rounds: Number of consecutive empty rounds after which discovery stops
+        :param include_special_rounds: Whether discovery also probes the special cup/playoff rounds
+        :param max_errors: Number of consecutive failed rounds after which discovery stops
         :return: List of all matches from the specified rounds
         """
         all_rounds_data = []
+        discovering = rounds is None and end_round is None
+        if rounds is None:
+            rounds = range(start_round, end_round + 1) if end_round is not None else itertools.count(start_round)
 
-        for round_num in range(start_round, end_round + 1):
-            print(f"Retrieving data for round {round_num}")
+        found_rounds = []
+        empty_rounds = 0
+        errors = 0
+        failed = False
+        for round_num in rounds:
+            matches, error = self._retrieve_round(league_id, season, round_num, save_individual_rounds)
+            failed = failed or error
+            errors = errors + 1 if error else 0
+            if matches:
+                all_rounds_data.extend(matches)
+                found_rounds.append(round_num)
+                empty_rounds = 0
+            elif not error:
+                empty_rounds += 1
 
-            try:
-                round_data = self.api_client.get_events_by_round(league_id, round_num, season)
-                if round_data and round_data.get('events'):
-                    matches = round_data['events']
-                    all_rounds_data.extend(matches)
-                    print(f'Round {round_num}: retrieved {len(matches)} matches.')
-
-                    if save_individual_rounds:
-                        if self.storage:
-                            self.storage.save(
-                                data=matches,
-                                data_type="rounds",
-                                league_id=league_id,
-                                season=season,
-                                round_num=round_num
-                            )
-                        else:
-                            print("No storage implementation provided, skipping individual round save.")
-                else:
-                    print(f'Round {round_num}: no data was found.')
-            except Exception as e:
-                print(f'Error while retrieving data for round {round_num}: {e}')
-
-            sleep(1)
+            if discovering and empty_rounds >= max_empty_rounds:
+                logger.info('No matches in %s consecutive rounds, last round is %s.', empty_rounds,
+                            round_num - empty_rounds)
+                break
+            if discovering and errors >= max_errors:
+                logger.error('%s consecutive rounds failed, stopping round discovery at round %s.', errors, round_num,
+                             extra={'league_id': league_id, 'season': season})
+                break
+
+        if discovering:
+            if include_special_rounds:
+                for round_num in SPECIAL_ROUNDS:
+                    matches, error = self._retrieve_round(league_id, season, round_num, save_individual_rounds)
+                    failed = failed or error
+                    if matches:
+                        all_rounds_data.extend(matches)
+                        found_rounds.append(round_num)
+
+            # Only cache complete discoveries from the first round of finished seasons, so later runs can rely on them
+            if not failed and start_round == 1 and found_rounds and is_season_complete(all_rounds_data):
+                self.round_ranges.set(league_id, season, found_rounds)
 
         return all_rounds_data
 
-    def scrape_all_rounds(self, league_id: int, season: str, start_round: int = 1, end_round: int = 38,
+    def _retrieve_round(self, league_id: int, season: str, round_num: int,
+                        save_individual_rounds: bool = False) -> tuple[list[Any], bool]:
+        """
+        Retrieve (and optionally save) the matches of a single round.
+
+        :return: Tuple of (matches, whether an error occurred)
+        """
+        logger.debug('Retrieving data for round %s', round_num)
+        matches, error = [], False
+
+        try:
+            with self._request_stage(f'round {round_num}'):
+                round_data = self.api_client.get_events_by_round(league_id, round_num, season)
+            if round_data and round_data.get('events'):
+                matches = round_data['events']
+                logger.info('Round %s: retrieved %s matches.', round_num, len(matches),
+                            extra={'league_id': league_id, 'season': season})
+                with self._stage('transform', f'round {round_num}'):
+                    self._update_standings(league_id, season, matches)
+
+                if save_individual_rounds:
+                    if self.storage:
+                        self._save(
+                            data=matches,
+                            data_type="rounds",
+                            league_id=league_id,
+                            season=season,
+                            round_num=round_num
+                        )
+                    else:
+                        logger.warning('No storage implementation provided, skipping individual round save.')
+            else:
+                logger.info('Round %s: no data was found.', round_num, extra={'league_id': league_id, 'season': season})
+        except Exception as e:
+            logger.error('Error while retrieving data for round %s: %s', round_num, e,
+                         extra={'league_id': league_id, 'season': season})
+            error = True
+
+        sleep(self.ROUND_DELAY)
+        return matches, error
+
+    def discover_rounds(self, league_id: int, season: str) -> Optional[list[int]]:
+        """
+        Get the rounds of a league and season without making requests: from the round cache, or from
+        a stored (complete) season overview.
+
+        :param league_id: League ID
+        :param season: Season (e.g. '2024-2025')
+        :return: Sorted round numbers or None if they are not known yet
+        """
+        rounds = self.round_ranges.get(league_id, season)
+        if rounds:
+            return rounds
+
+        season_data = self.storage.load('season_matches', league_id=league_id, season=season) if self.storage \
+            else None
+        events = (season_data or {}).get('events') or []
+        if events and len(events) < FREE_TIER_SEASON_EVENTS_LIMIT:
+            rounds = sorted({int(event['intRound']) for event in events if event.get('intRound')})
+            if rounds:
+                # Rounds can still be added to a season in progress, so only finished seasons are cached
+                if is_season_complete(events):
+                    self.round_ranges.set(league_id, season, rounds)
+                return rounds
+        return None
+
+    def scrape_all_rounds(self, league_id: int, season: str, start_round: int = 1, end_round: int = None,
                           output_path: str = None, output_file: str = None, save_all_rounds: bool = False,
-                          save_individual_rounds: bool = False) -> list[Any]:
+                          save_individual_rounds: bool = False, include_special_rounds: bool = False,
+                          max_empty_rounds: int = 2, max_errors: int = 3) -> list[Any]:
         """
         Scrape data for consecutive rounds for the specified season and league.
+        Without an end round, only the rounds known to exist are requested (see discover_rounds); if they are
+        not known yet, rounds are requested until max_empty_rounds consecutive rounds are empty.
 
         :param league_id: League ID (e.g. 4335 for Spanish La Liga)
         :param season: Season (e.g. '2024-2025')
         :param start_round: Number of the first round to retrieve
-        :param end_round: Number of the last round to retrieve (inclusive)
+        :param end_round: Number of the last round to retrieve (inclusive), None to discover it
         :param output_path: Optional override for output path from config
         :param output_file: Optional override for output filename from config
         :param save_all_rounds: Whether to save the data to disk into a single file
         :param save_individual_rounds: Whether to save each round to a separate file
+        :param include_special_rounds: Whether to also retrieve special cup/playoff rounds (125-500)
+        :param max_empty_rounds: Number of consecutive empty rounds after which discovery stops
+        :param max_errors: Number of consecutive failed rounds after which discovery stops
         :return: List of round data
         """
-        return self.scrape_data(
+        rounds = None
+        if end_round is None:
+            known_rounds = self.discover_rounds(league_id, season)
+            if known_rounds is not None:
+                rounds = [round_num for round_num in known_rounds if round_num >= start_round and
+                          (include_special_rounds or round_num not in SPECIAL_ROUNDS)]
+
+        data = self.scrape_data(
             scraper_func=self._retrieve_all_rounds,
-            save_data=save_all_rounds,
+            save_data=False,
+            single_request=False,
             # output_path=output_path,
             # output_file=output_file,
             data_type="rounds",
@@ -124,9 +358,79 @@ class DataScraper:
             season=season,
             start_round=start_round,
             end_round=end_round,
-            save_individual_rounds=save_individual_rounds
+            save_individual_rounds=save_individual_rounds,
+            rounds=rounds,
+            max_empty_rounds=max_empty_rounds,
+            max_errors=max_errors,
+            include_special_rounds=include_special_rounds
         )
 
+        if data and save_all_rounds and self.storage:
+            if end_round is None:
+                regular_rounds = [int(match['intRound']) for match in data
+                                  if match.get('intRound') and int(match['intRound']) not in SPECIAL_ROUNDS]
+                end_round = max(regular_rounds, default=start_round)
+            self._save(data, "rounds", league_id=league_id, season=season, start_round=start_round,
+                       end_round=end_round)
+
+        return data
+
+    def scrape_planned(self, tasks: Iterable[ScrapeTask], budget: int = None, max_empty_rounds: int = 2,
+                       **kwargs) -> dict:
+        """
+        Scrape the rounds of several leagues and seasons within the request budget: tasks are run by priority
+        and the ones that would exceed the budget are deferred (see RequestPlanner).
+
+        :param tasks: Requested scrapes
+        :param budget: Number of API calls available (defaults to the remaining requests of the client's quota)
+        :param max_empty_rounds: Number of consecutive empty rounds after which discovery stops
+        :param kwargs: Further arguments of scrape_all_rounds (e.g. save_individual_rounds)
+        :return: The plan ('scheduled', 'deferred', 'estimated_calls', 'budget') with the number of retrieved
+                 matches per scheduled task in 'matches'
+        """
+        planner = RequestPlanner(getattr(self.api_client, 'quota', None), self.discover_rounds,
+                                 max_empty_rounds=max_empty_rounds)
+        plan = planner.plan(tasks, budget)
+        if plan['deferred']:
+            logger.info('Deferring %s of %s scrapes to stay within the budget of %s requests.',
+                        len(plan['deferred']), len(plan['deferred']) + len(plan['scheduled']), plan['budget'])
+
+        plan['matches'] = []
+        for task in plan['scheduled']:
+            data = self.scrape_all_rounds(task.league_id, task.season, start_round=task.start_round,
+                                          end_round=task.end_round, max_empty_rounds=max_empty_rounds, **kwargs)
+            plan['matches'].append(len(data or []))
+        return plan
+
+    def poll_live(self, league_id: int, season: str, save_data: bool = True, max_polls: int = None,
+                  **kwargs) -> Iterator[list[Any]]:
+        """
+        Follow the matches of a league season as they are played: rounds are polled often only during match windows
+        derived from the kickoff times of the stored schedule (scrape the season or its rounds first), and only the
+        events whose score or status changed are yielded (see LivePoller). Changed rounds are saved, and changed events
+        update the standings.
+
+        Live calls keep interactive priority, so they are not queued behind bulk scraping.
+
+        :param league_id: League ID
+        :param season: Season (e.g. '2024-2025')
+        :param save_data: Whether to save the rounds with changed events
+        :param max_polls: Optional maximum number of polls
+        :param kwargs: LivePoller settings (interval, idle_interval, before, after)
+        :return: Iterator over the changed events of every poll that found changes
+        """
+        poller = LivePoller.from_storage(self.api_client, self.storage, league_id, season, sleep=sleep, **kwargs)
+        for changed in poller.run(max_polls):
+            logger.info('Live: %s events changed.', len(changed), extra={'league_id': league_id, 'season': season})
+            self._update_standings(league_id, season, changed)
+
+            if save_data and self.storage:
+                for round_num in sorted({int(event['intRound']) for event in changed if event.get('intRound')}):
+                    matches = [event for event in poller.events.values()
+                               if event.get('intRound') and int(event['intRound']) == round_num]
+                    self._save(matches, 'rounds', league_id=league_id, season=season, round_num=round_num)
+            yield changed
+
     def scrape_league_table(self, league_id: int, season: str, output_path: str = None, output_file: str = None,
                             save_data: bool = False) -> list[Any]:
         """
@@ -149,51 +453,153 @@ class DataScraper:
             season=season
         )
 
-    def scrape_countries(self, save_data: bool = True) -> dict:
+    def compute_league_table(self, league_id: int, season: str, round_num: int = None) -> dict:
         """
-        Scrape countries data.
+        Compute the league table from stored matches, without calling the API.
+        The engine is built from storage on first use and then updated incrementally as rounds are retrieved.
+
+        :param league_id: League ID
+        :param season: Season (e.g. '2024-2025')
+        :param round_num: Last round included (None for all finished matches)
+        :return: League table data ({'table': [...]})
+        """
+        key = (int(league_id), season)
+        if key not in self.standings:
+            self.standings[key] = StandingsEngine.from_storage(self.storage, league_id, season)
+        return self.standings[key].table(round_num)
+
+    def _update_standings(self, league_id: int, season: str, matches: list[Any]) -> None:
+        engine = self.standings.get((int(league_id), season))
+        if engine is not None:
+            engine.add_matches(matches)
+
+    def scrape_countries(self, save_data: bool = True, force_refresh: bool = False) -> dict:
+        """
+        Scrape countries data (served from storage while still fresh).
 
         :param save_data: Whether to save the data
+        :param force_refresh: Whether to call the API even if stored data is still fresh
         :return: Countries data
         """
         return self.scrape_data(
             scraper_func=self.api_client.get_all_countries,
             save_data=save_data,
-            data_type="countries"
+            data_type="countries",
+            force_refresh=force_refresh
         )
 
-    def scrape_leagues(self, save_data: bool = True) -> dict:
+    def scrape_leagues(self, save_data: bool = True, force_refresh: bool = False) -> dict:
         """
-        Scrape leagues data.
+        Scrape leagues data (served from storage while still fresh).
 
         :param save_data: Whether to save the data
+        :param force_refresh: Whether to call the API even if stored data is still fresh
         :return: Leagues data
         """
         return self.scrape_data(
             scraper_func=self.api_client.get_all_leagues,
             save_data=save_data,
-            data_type="leagues"
+            data_type="leagues",
+            force_refresh=force_refresh
         )
 
-    def scrape_teams_by_league(self, league_id: int, save_data: bool = True) -> dict:
+    def scrape_teams_by_league(self, league_id: int, save_data: bool = True, force_refresh: bool = False) -> dict:
         """
-        Scrape teams for a specific league.
+        Scrape teams for a specific league (served from storage while still fresh).
+        The league name is taken from the league resolver, so scrape_leagues (or discover_leagues) should have
+        been run at least once for leagues outside the built-in ones.
 
         :param league_id: League ID
         :param save_data: Whether to save the data
+        :param force_refresh: Whether to call the API even if stored data is still fresh
         :return: Teams data
         """
-        league_name = league_id_to_name(league_id)
+        league_name = self.league_resolver.name(league_id)
+        if not league_name:
+            league_name = self.league_resolver.slug(league_id)
+            logger.warning('League %s is unknown to the league resolver, searching teams by "%s".', league_id,
+                           league_name)
+
         return self.scrape_data(
-            scraper_func=lambda: self.api_client.get_teams_in_league(league_name),
+            scraper_func=lambda league_id: self.api_client.get_teams_in_league(league_name),
             save_data=save_data,
             data_type="teams",
+            force_refresh=force_refresh,
             league_id=league_id
         )
 
+    def discover_leagues(self, country: str, sport: str = 'Soccer') -> int:
+        """
+        Add all leagues of a country to the league resolver (one search_all_leagues.php request).
+
+        :param country: Country name, e.g. 'Spain'
+        :param sport: Sport name, e.g. 'Soccer'
+        :return: Number of new or renamed leagues
+        """
+        with request_priority(self.REQUEST_PRIORITY):
+            data = self.api_client.get_leagues_in_country(country, sport)
+        return self.league_resolver.update_from_response(data)
+
+    def _retrieve_season_matches(self, league_id: int, season: str) -> Any:
+        """
+        Retrieve all matches of a league and season.
+        eventsseason.php returns at most 100 events on the free tier; when the response hits that cap,
+        the rounds it does not fully cover are fetched concurrently and merged in (de-duplicated by idEvent).
+
+        :param league_id: League ID
+        :param season: Season (e.g. '2024-2025')
+        :return: Matches data ({'events': [...]}, ordered by round and kick-off)
+        """
+        with self._request_stage('season_matches'):
+            data = self.api_client.get_events_in_league_by_season(league_id, season)
+        events = (data or {}).get('events') or []
+        if len(events) < FREE_TIER_SEASON_EVENTS_LIMIT:
+            self._update_standings(league_id, season, events)
+            return data
+
+        teams = {event.get(field) for event in events for field in ('idHomeTeam', 'idAwayTeam') if event.get(field)}
+        matches_per_round = max(len(teams) // 2, 1)
+        round_sizes = {}
+        for event in events:
+            if event.get('intRound'):
+                round_num = int(event['intRound'])
+                round_sizes[round_num] = round_sizes.get(round_num, 0) + 1
+
+        # Known rounds, or a double round-robin estimate from the number of teams seen
+        expected_rounds = self.discover_rounds(league_id, season) or list(range(1, 2 * (len(teams) - 1) + 1))
+        missing_rounds = [round_num for round_num in expected_rounds
+                          if round_sizes.get(round_num, 0) < matches_per_round]
+        logger.info('Season response capped at %s events, fetching %s missing rounds.', len(events),
+                    len(missing_rounds), extra={'league_id': league_id, 'season': season})
+
+        def fetch_round(round_num: int) -> Any:
+            # Profiled in the worker thread, where the network time of its call is recorded
+            with self._request_stage(f'round {round_num}'):
+                return self.api_client.get_events_by_round(league_id, round_num, season)
+
+        batch = run_batch(fetch_round, missing_rounds, getattr(self.api_client, 'max_workers', 4))
+        for round_num, error in batch['errors'].items():
+            logger.error('Error while retrieving data for round %s: %s', round_num, error,
+                         extra={'league_id': league_id, 'season': season})
+
+        merged = {event['idEvent']: event for event in events if event.get('idEvent')}
+        for round_data in batch['results'].values():
+            for event in (round_data or {}).get('events') or []:
+                if event.get('idEvent'):
+                    merged[event['idEvent']] = event
+
+        season_events = sorted(merged.values(), key=lambda event: (
+            int(event.get('intRound') or 0), event.get('strTimestamp') or event.get('dateEvent') or '',
+            event['idEvent']))
+        if not batch['errors'] and is_season_complete(season_events):
+            self.round_ranges.set(league_id, season, [int(event['intRound']) for event in season_events
+                                                      if event.get('intRound')])
+        self._update_standings(league_id, season, season_events)
+        return {'events': season_events}
+
     def scrape_season_matches(self, league_id: int, season: str, save_data: bool = True) -> dict:
         """
-        Scrape all matches for a league and season.
+        Scrape all matches for a league and season (working around the free-tier cap of 100 events).
 
         :param league_id: League ID
         :param season: Season (e.g. '2024-2025')
@@ -201,9 +607,31 @@ class DataScraper:
         :return: Matches data
         """
         return self.scrape_data(
-            scraper_func=self.api_client.get_events_in_league_by_season,
+            scraper_func=self._retrieve_season_matches,
             save_data=save_data,
+            single_request=False,
             data_type="season_matches",
             league_id=league_id,
             season=season
         )
+
+    def scrape_season_graph(self, league_id: int, season: str) -> dict:
+        """
+        Scrape all matches for a league and season together with the leagues, venues and teams they reference.
+        Only entities missing from storage are fetched, and everything is saved in foreign-key order
+        (leagues -> venues -> teams -> matches).
+
+        :param league_id: League ID
+        :param season: Season (e.g. '2024-2025')
+        :return: Crawl summary (requests made, fetched counts, unresolved IDs)
+        """
+        data = self.scrape_season_matches(league_id, season, save_data=False)
+        events = (data or {}).get('events') or []
+
+        with request_priority(self.REQUEST_PRIORITY):
+            summary = CrawlPlanner(self.api_client, self.storage, self.league_resolver).crawl(events)
+        if events:
+            self._save(data, 'season_matches', league_id=league_id, season=season)
+        logger.info('Crawled %s matches with %s additional requests, unresolved references: %s', len(events),
+                    summary['requests'], summary['unresolved'])
+        return summary
@@ -0,0 +1,68 @@
+import logging
+from typing import Optional
+from sports_api.database.db_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+
+class ContentHashesDAO:
+    """
+    Data Access Object for content_hashes table (last saved content hash per dataset key).
+
+    The table is created on first use if it does not exist yet (databases set up before it was added to
+    db_schema.sql). If it cannot be created, no hashes are stored or returned, so no save is ever skipped.
+    """
+
+    CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS content_hashes (
+            key VARCHAR(200) PRIMARY KEY,
+            hash CHAR(64) NOT NULL,
+            updated_at TIMESTAMP NOT NULL
+        )
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self._available = None
+
+    def is_available(self) -> bool:
+        """Check that the content_hashes table exists, creating it if needed (checked once)."""
+        if self._available is None:
+            conn = self.db_manager.get_connection()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(self.CREATE_TABLE)
+                conn.commit()
+                self._available = True
+            except Exception as e:
+                conn.rollback()
+                logger.warning('content_hashes table is not available, unchanged saves are not skipped: %s', e)
+                self._available = False
+        return self._available
+
+    def get_hash(self, key: str) -> Optional[str]:
+        """Get the last saved content hash for a dataset key."""
+        if not self.is_available():
+            return None
+        conn = self.db_manager.get_connection()
+
+        with conn.cursor() as cur:
+            cur.execute("SELECT hash FROM content_hashes WHERE key = %s", (key,))
+            existing = cur.fetchone()
+        return existing['hash'] if existing else None
+
+    def save_hash(self, key: str, content_hash: str) -> None:
+        """Save the content hash for a dataset key."""
+        if not self.is_available():
+            return
+        conn = self.db_manager.get_connection()
+
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO content_hashes (key, hash, updated_at) VALUES (%s, %s, NOW())
+                ON CONFLICT (key) DO UPDATE SET hash = EXCLUDED.hash, updated_at = EXCLUDED.updated_at
+                """,
+                (key, content_hash)
+            )
+            conn.commit()
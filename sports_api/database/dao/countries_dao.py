@@ -1,7 +1,10 @@
+import logging
 from typing import List, Dict, Any
 import uuid
 from sports_api.database.db_manager import DatabaseManager
 
+logger = logging.getLogger(__name__)
+
 
 class CountriesDAO:
     """
@@ -10,6 +13,8 @@ class CountriesDAO:
 
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        # Number of records the last save failed to write
+        self.failed = 0
 
     def save_countries(self, countries: List[Dict[str, Any]]) -> int:
         """
@@ -17,6 +22,7 @@ class CountriesDAO:
         """
         conn = self.db_manager.get_connection()
         count = 0
+        failed = 0
 
         with conn.cursor() as cur:
             for country in countries:
@@ -38,11 +44,13 @@ class CountriesDAO:
                     else:
                         # Ignore existing country
                         country_id = existing['id']
-                        print(f'Country {country_name} already exists with id {country_id}.')
+                        logger.debug('Country %s already exists with id %s.', country_name, country_id)
 
                     count += 1
                 except Exception as e:
-                    print(f"Error saving country {country_name}: {e}")
+                    logger.warning('Error saving country %s: %s', country_name, e)
+                    failed += 1
 
             conn.commit()
+        self.failed = failed
         return count
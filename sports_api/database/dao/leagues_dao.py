@@ -1,6 +1,9 @@
+import logging
 from typing import List, Dict, Any
 from sports_api.database.db_manager import DatabaseManager
 
+logger = logging.getLogger(__name__)
+
 
 class LeaguesDAO:
     """
@@ -9,6 +12,8 @@ class LeaguesDAO:
 
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        # Number of records the last save failed to write
+        self.failed = 0
 
     def save_leagues(self, leagues: List[Dict[str, Any]]) -> int:
         """
@@ -16,6 +21,7 @@ class LeaguesDAO:
         """
         conn = self.db_manager.get_connection()
         count = 0
+        failed = 0
 
         with conn.cursor() as cur:
             for league in leagues:
@@ -39,7 +45,17 @@ class LeaguesDAO:
                         )
                     count += 1
                 except Exception as e:
-                    print(f"Error saving league {league_name}: {e}")
+                    logger.warning('Error saving league %s: %s', league_name, e)
+                    failed += 1
 
             conn.commit()
+        self.failed = failed
         return count
+
+    def get_existing_ids(self, ids: List[int]) -> set:
+        """Get which of the given leagues IDs already exist in the database."""
+        conn = self.db_manager.get_connection()
+
+        with conn.cursor() as cur:
+            cur.execute("SELECT id FROM leagues WHERE id = ANY(%s)", ([int(item_id) for item_id in ids],))
+            return {row['id'] for row in cur.fetchall()}
@@ -1,17 +1,23 @@
+import logging
 from typing import List, Dict, Any
 from sports_api.database.db_manager import DatabaseManager
 
+logger = logging.getLogger(__name__)
+
 
 class MatchesDAO:
     """Data Access Object for matches table."""
 
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        # Number of records the last save failed to write
+        self.failed = 0
 
     def save_matches(self, matches: List[Dict[str, Any]]) -> int:
-        """Save matches to database."""
+        """Save matches to database, updating the score, status and kickoff of stored ones."""
         conn = self.db_manager.get_connection()
         count = 0
+        failed = 0
 
         with conn.cursor() as cur:
             for match in matches:
@@ -20,35 +26,46 @@ class MatchesDAO:
                     continue
 
                 try:
-                    # Check if exists
-                    cur.execute("SELECT id FROM matches WHERE id = %s", (match_id,))
-                    existing = cur.fetchone()
-
-                    if not existing:
-                        league_id = match.get('idLeague')
-                        season = match.get('strSeason')
-                        home_team_id = match.get('idHomeTeam')
-                        away_team_id = match.get('idAwayTeam')
-                        event_date = match.get('strTimestamp')
-                        home_score = match.get('intHomeScore')
-                        away_score = match.get('intAwayScore')
-                        round_number = match.get('intRound')
-                        status = match.get('strStatus')
-
-                        cur.execute(
-                            """
-                            INSERT INTO matches (id, league_id, season, home_team_id, away_team_id, event_date, home_score, away_score, round_number, status)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            """,
-                            (match_id, league_id, season, home_team_id, away_team_id, event_date,
-                             home_score, away_score, round_number, status)
-                        )
-                    else:
-                        # Ignore existing match
-                        print(f'Match {match_id} already exists.')
+                    # Existing matches get their current score, status and kickoff (e.g. from live polling)
+                    cur.execute(
+                        """
+                        INSERT INTO matches (id, league_id, season, home_team_id, away_team_id, event_date, home_score, away_score, round_number, status)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        ON CONFLICT (id) DO UPDATE SET home_score = EXCLUDED.home_score,
+                            away_score = EXCLUDED.away_score, status = EXCLUDED.status,
+                            event_date = COALESCE(EXCLUDED.event_date, matches.event_date)
+                        """,
+                        (match_id, match.get('idLeague'), match.get('strSeason'), match.get('idHomeTeam'),
+                         match.get('idAwayTeam'), match.get('strTimestamp'), match.get('intHomeScore'),
+                         match.get('intAwayScore'), match.get('intRound'), match.get('strStatus'))
+                    )
                     count += 1
                 except Exception as e:
-                    print(f"Error saving match {match_id}: {e}")
+                    logger.warning('Error saving match %s: %s', match_id, e)
+                    failed += 1
 
             conn.commit()
+        self.failed = failed
         return count
+
+    def get_matches(self, league_id: int, season: str) -> List[Dict[str, Any]]:
+        """Get the matches of a league season with API field names (e.g. for computing standings)."""
+        conn = self.db_manager.get_connection()
+
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT m.id AS "idEvent", m.league_id AS "idLeague", m.season AS "strSeason",
+                       m.home_team_id AS "idHomeTeam", home.name AS "strHomeTeam",
+                       m.away_team_id AS "idAwayTeam", away.name AS "strAwayTeam",
+                       m.event_date::text AS "dateEvent", m.home_score AS "intHomeScore",
+                       m.away_score AS "intAwayScore", m.round_number AS "intRound", m.status AS "strStatus"
+                FROM matches m
+                LEFT JOIN teams home ON home.id = m.home_team_id
+                LEFT JOIN teams away ON away.id = m.away_team_id
+                WHERE m.league_id = %s AND m.season = %s
+                ORDER BY m.round_number, m.event_date, m.id
+                """,
+                (league_id, season)
+            )
+            return cur.fetchall()
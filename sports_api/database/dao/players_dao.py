@@ -1,17 +1,25 @@
+import logging
 from typing import List, Dict, Any
 from sports_api.database.db_manager import DatabaseManager
+from sports_api.services.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
 
 
 class PlayersDAO:
     """Data Access Object for players table."""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, search_index: SearchIndex = None):
         self.db_manager = db_manager
+        self.search_index = search_index
+        # Number of records the last save failed to write
+        self.failed = 0
 
     def save_players(self, players: List[Dict[str, Any]]) -> int:
         """Save players to database."""
         conn = self.db_manager.get_connection()
         count = 0
+        failed = 0
 
         with conn.cursor() as cur:
             for player in players:
@@ -42,12 +50,29 @@ class PlayersDAO:
                             (player_id, player_name, team_id, nationality, date_born, position, height, weight,
                              jersey_number)
                         )
+                        if self.search_index is not None:
+                            self.search_index.add('players', player)
                     else:
-                        print(f'Player {player.get("strPlayer")} already exists with id {player_id}.')
+                        logger.debug('Player %s already exists with id %s.', player.get('strPlayer'), player_id)
 
                     count += 1
                 except Exception as e:
-                    print(f"Error saving player {player.get('strPlayer')}: {e}")
+                    logger.warning('Error saving player %s: %s', player.get('strPlayer'), e)
+                    failed += 1
 
             conn.commit()
+        self.failed = failed
         return count
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        """Get all players with API field names (e.g. for building a SearchIndex)."""
+        conn = self.db_manager.get_connection()
+
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT id AS "idPlayer", name AS "strPlayer", team_id AS "idTeam", position AS "strPosition"
+                FROM players
+                """
+            )
+            return cur.fetchall()
@@ -1,17 +1,25 @@
+import logging
 from typing import List, Dict, Any
 from sports_api.database.db_manager import DatabaseManager
+from sports_api.services.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
 
 
 class TeamsDAO:
     """Data Access Object for teams table."""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, search_index: SearchIndex = None):
         self.db_manager = db_manager
+        self.search_index = search_index
+        # Number of records the last save failed to write
+        self.failed = 0
 
     def save_teams(self, teams: List[Dict[str, Any]]) -> int:
         """Save teams to database."""
         conn = self.db_manager.get_connection()
         count = 0
+        failed = 0
 
         with conn.cursor() as cur:
             for team in teams:
@@ -43,13 +51,39 @@ class TeamsDAO:
                             (team_id, team_name, alternate_names, short_name, foundation_year, sport, league_id,
                              venue_id, location, country_name)
                         )
+                        if self.search_index is not None:
+                            self.search_index.add('teams', team)
                     else:
                         # Ignore existing team
-                        print(f'Team {team.get("strTeam")} already exists with id {team_id}.')
+                        logger.debug('Team %s already exists with id %s.', team.get('strTeam'), team_id)
 
                     count += 1
                 except Exception as e:
-                    print(f"Error saving team {team.get('strTeam')}: {e}")
+                    logger.warning('Error saving team %s: %s', team.get('strTeam'), e)
+                    failed += 1
 
             conn.commit()
+        self.failed = failed
         return count
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        """Get all teams with API field names (e.g. for building a SearchIndex)."""
+        conn = self.db_manager.get_connection()
+
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT id AS "idTeam", name AS "strTeam", alternate_names AS "strTeamAlternate", short_name AS "strTeamShort",
+                       league_id AS "idLeague", venue_id AS "idVenue", country_name AS "strCountry"
+                FROM teams
+                """
+            )
+            return cur.fetchall()
+
+    def get_existing_ids(self, ids: List[int]) -> set:
+        """Get which of the given teams IDs already exist in the database."""
+        conn = self.db_manager.get_connection()
+
+        with conn.cursor() as cur:
+            cur.execute("SELECT id FROM teams WHERE id = ANY(%s)", ([int(item_id) for item_id in ids],))
+            return {row['id'] for row in cur.fetchall()}
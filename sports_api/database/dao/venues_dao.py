@@ -1,17 +1,25 @@
+import logging
 from typing import List, Dict, Any
 from sports_api.database.db_manager import DatabaseManager
+from sports_api.services.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
 
 
 class VenuesDAO:
     """Data Access Object for venues table."""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, search_index: SearchIndex = None):
         self.db_manager = db_manager
+        self.search_index = search_index
+        # Number of records the last save failed to write
+        self.failed = 0
 
     def save_venues(self, venues: List[Dict[str, Any]]) -> int:
         """Save venues to database."""
         conn = self.db_manager.get_connection()
         count = 0
+        failed = 0
 
         with conn.cursor() as cur:
             for venue in venues:
@@ -41,13 +49,39 @@ class VenuesDAO:
                             (venue_id, venue_name, alternate_names, sport, capacity, country_name, location,
                              foundation_year)
                         )
+                        if self.search_index is not None:
+                            self.search_index.add('venues', venue)
                     else:
                         # Ignore existing venue
-                        print(f'Venue {venue.get("strVenue")} already exists with id {venue_id}.')
+                        logger.debug('Venue %s already exists with id %s.', venue.get('strVenue'), venue_id)
 
                     count += 1
                 except Exception as e:
-                    print(f"Error saving venue {venue.get('strVenue')}: {e}")
+                    logger.warning('Error saving venue %s: %s', venue.get('strVenue'), e)
+                    failed += 1
 
             conn.commit()
+        self.failed = failed
         return count
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        """Get all venues with API field names (e.g. for building a SearchIndex)."""
+        conn = self.db_manager.get_connection()
+
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT id AS "idVenue", name AS "strVenue", alternate_names AS "strVenueAlternate",
+                       country_name AS "strCountry", location AS "strLocation"
+                FROM venues
+                """
+            )
+            return cur.fetchall()
+
+    def get_existing_ids(self, ids: List[int]) -> set:
+        """Get which of the given venues IDs already exist in the database."""
+        conn = self.db_manager.get_connection()
+
+        with conn.cursor() as cur:
+            cur.execute("SELECT id FROM venues WHERE id = ANY(%s)", ([int(item_id) for item_id in ids],))
+            return {row['id'] for row in cur.fetchall()}
@@ -0,0 +1,219 @@
+import datetime
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from sports_api.analytics.standings import FINISHED_STATUSES
+
+logger = logging.getLogger(__name__)
+
+# Statuses of matches that will not be played (at their scheduled time)
+INACTIVE_STATUSES = {'Match Postponed', 'Postponed', 'PST', 'Match Cancelled', 'Cancelled', 'CANC', 'Abandoned'}
+
+
+def parse_kickoff(event: Dict[str, Any]) -> Optional[float]:
+    """
+    Get the kickoff of an event as a UNIX timestamp, from strTimestamp (or dateEvent and strTime), read as UTC
+    unless the value has an offset.
+
+    :return: Timestamp or None if the event has no (valid) kickoff time, e.g. only a date (see parse_match_day)
+    """
+    value = event.get('strTimestamp')
+    if not value and event.get('dateEvent'):
+        if len(str(event['dateEvent'])) > 10:
+            value = event['dateEvent']
+        elif event.get('strTime'):
+            value = f"{event['dateEvent']}T{event['strTime']}"
+    if not value:
+        return None
+    try:
+        kickoff = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if kickoff.tzinfo is None:
+        kickoff = kickoff.replace(tzinfo=datetime.timezone.utc)
+    return kickoff.timestamp()
+
+
+def parse_match_day(event: Dict[str, Any]) -> Optional[float]:
+    """
+    Get the start (00:00 UTC) of the day of an event from its dateEvent, e.g. for database rows, which keep the date
+    of a match but not its kickoff time.
+
+    :return: Timestamp or None if the event has no (valid) date
+    """
+    try:
+        day = datetime.date.fromisoformat(str(event.get('dateEvent') or '')[:10])
+    except ValueError:
+        return None
+    return datetime.datetime(day.year, day.month, day.day, tzinfo=datetime.timezone.utc).timestamp()
+
+
+class LivePoller:
+    """
+    Polls the rounds of a league season while matches are being played, based on the kickoff times of the stored
+    schedule, and reports only the events whose score or status changed since the previous poll.
+
+    A match window runs from `before` seconds before kickoff until the match is finished (or `after` seconds after
+    kickoff). During a window the rounds with matches in progress are polled every `interval` seconds (one
+    eventsround.php call per round); between windows the poller sleeps until the next window opens, waking at
+    least every `idle_interval` seconds. Polling ends when no window is left.
+
+    Matches whose kickoff time is not known (only their date, e.g. in the database) have the whole day as their
+    window until a poll returns their kickoff time.
+    """
+
+    def __init__(self, api_client: Any, league_id: int, season: str, events: Iterable[Dict[str, Any]],
+                 interval: float = 60.0, idle_interval: float = 3600.0, before: float = 900.0,
+                 after: float = 9000.0, clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], Any] = time.sleep):
+        """
+        Initialize the live poller.
+
+        :param api_client: API client providing get_events_by_round
+        :param league_id: League ID
+        :param season: Season (e.g. '2024-2025')
+        :param events: Stored schedule of the season (events with idEvent, intRound and strTimestamp)
+        :param interval: Seconds between polls during match windows
+        :param idle_interval: Maximum seconds between checks outside match windows
+        :param before: Seconds before kickoff a match window opens
+        :param after: Seconds after kickoff a match window closes if the match is not reported finished
+        :param clock: Function returning the current UNIX time
+        :param sleep: Function used to wait between polls
+        """
+        self.api_client = api_client
+        self.league_id = league_id
+        self.season = season
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self.before = before
+        self.after = after
+        self.clock = clock
+        self.sleep = sleep
+        self.events: Dict[str, Dict[str, Any]] = {}
+        self.polls = 0
+        self.update(events)
+
+    @classmethod
+    def from_storage(cls, api_client: Any, storage: Any, league_id: int, season: str, **kwargs) -> 'LivePoller':
+        """
+        Create a poller with the schedule held by a storage.
+
+        :param storage: FileStorage (saved season matches and rounds) or DatabaseStorage (matches table)
+        :param kwargs: Poller settings
+        """
+        events = []
+        if hasattr(storage, 'load_events'):
+            events = storage.load_events(league_id, season)
+        elif hasattr(storage, 'matches_dao'):
+            events = storage.matches_dao.get_matches(league_id, season)
+        return cls(api_client, league_id, season, events, **kwargs)
+
+    def update(self, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge events into the known schedule.
+
+        :param events: Events as returned by the API
+        :return: Events that are new or whose score or status changed
+        """
+        changed = []
+        for event in events or []:
+            event_id = event.get('idEvent')
+            if not event_id:
+                continue
+            previous = self.events.get(str(event_id))
+            if previous is None or self._state(previous) != self._state(event):
+                changed.append(event)
+            self.events[str(event_id)] = event
+        return changed
+
+    def active_rounds(self, now: Optional[float] = None) -> List[int]:
+        """
+        Get the rounds with a match window open at the given time.
+        """
+        now = self.clock() if now is None else now
+        rounds = set()
+        for event in self.events.values():
+            window = self._window(event)
+            if window is not None and window[0] <= now < window[1] and event.get('intRound'):
+                rounds.add(int(event['intRound']))
+        return sorted(rounds)
+
+    def next_delay(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Get the number of seconds until the next poll.
+
+        :return: interval during a match window, the time until the next window (at most idle_interval)
+                 otherwise, or None if no window is left
+        """
+        now = self.clock() if now is None else now
+        starts = []
+        for event in self.events.values():
+            window = self._window(event)
+            if window is None or window[1] <= now:
+                continue
+            if window[0] <= now:
+                return self.interval
+            starts.append(window[0])
+        if not starts:
+            return None
+        return min(min(starts) - now, self.idle_interval)
+
+    def poll(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Request the rounds with an open match window once.
+
+        :return: Events whose score or status changed since the previous poll
+        """
+        changed = []
+        for round_num in self.active_rounds(now):
+            try:
+                data = self.api_client.get_events_by_round(self.league_id, round_num, self.season)
+            except Exception as e:
+                logger.warning('Error while polling round %s: %s', round_num, e,
+                               extra={'league_id': self.league_id, 'season': self.season})
+                continue
+            changed.extend(self.update((data or {}).get('events') or []))
+        self.polls += 1
+        return changed
+
+    def run(self, max_polls: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Poll until no match window is left, yielding the changed events of every poll that found changes.
+
+        :param max_polls: Optional maximum number of polls
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            delay = self.next_delay()
+            if delay is None:
+                logger.info('No upcoming matches, live polling stopped.',
+                            extra={'league_id': self.league_id, 'season': self.season})
+                return
+            if delay > 0:
+                self.sleep(delay)
+            if not self.active_rounds():
+                continue  # woke up before the next window, e.g. after idle_interval
+
+            changed = self.poll()
+            polls += 1
+            if changed:
+                yield changed
+
+    def _window(self, event: Dict[str, Any]) -> Optional[tuple]:
+        status = event.get('strStatus')
+        if status in FINISHED_STATUSES or status in INACTIVE_STATUSES:
+            return None
+        kickoff = parse_kickoff(event)
+        if kickoff is not None:
+            return kickoff - self.before, kickoff + self.after
+        day = parse_match_day(event)
+        if day is None:
+            return None
+        return day - self.before, day + 86400 + self.after
+
+    @staticmethod
+    def _state(event: Dict[str, Any]) -> tuple:
+        # Compared as strings, so stored rows (e.g. integer scores from the database) match API responses
+        return tuple(None if event.get(field) in (None, '') else str(event[field])
+                     for field in ('intHomeScore', 'intAwayScore', 'strStatus'))
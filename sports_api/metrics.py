@@ -0,0 +1,218 @@
+import bisect
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from sports_api.utils.file_utils import make_directory
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed buckets, as exposed by Prometheus (bucket counts, sum and count).
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        position = bisect.bisect_left(self.buckets, value)
+        if position < len(self.counts):
+            self.counts[position] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list:
+        counts, total = [], 0
+        for count in self.counts:
+            total += count
+            counts.append(total)
+        return counts
+
+
+class MetricsRegistry:
+    """
+    Thread-safe collection of API and storage metrics:
+
+    - request latency histograms, response bytes, status codes and errors per endpoint (e.g. 'eventsround.php')
+    - time spent waiting for the rate limiter
+    - storage save duration histograms per data type
+
+    Metrics are rendered in the Prometheus text format, either served over HTTP (serve) or written to a file (write).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self.request_latency: Dict[str, Histogram] = {}
+        self.response_bytes: Dict[str, int] = {}
+        self.responses: Dict[Tuple[str, str], int] = {}
+        self.errors: Dict[Tuple[str, str], int] = {}
+        self.rate_limit_wait = 0.0
+        self.save_duration: Dict[str, Histogram] = {}
+
+    def record_request(self, endpoint: str, duration: float, status: Optional[int] = None, size: int = 0,
+                       error: Optional[str] = None) -> None:
+        """
+        Record an API request.
+
+        :param endpoint: Endpoint name without the query string, e.g. 'eventsround.php'
+        :param duration: Time from sending the request to receiving the whole response (seconds)
+        :param status: HTTP status code (None if no response was received)
+        :param size: Response size in bytes
+        :param error: Exception class name if the request failed
+        """
+        with self._lock:
+            self.request_latency.setdefault(endpoint, Histogram()).observe(duration)
+            self.response_bytes[endpoint] = self.response_bytes.get(endpoint, 0) + size
+            if status is not None:
+                key = (endpoint, str(status))
+                self.responses[key] = self.responses.get(key, 0) + 1
+            if error:
+                key = (endpoint, error)
+                self.errors[key] = self.errors.get(key, 0) + 1
+
+    def record_rate_limit_wait(self, waited: float) -> None:
+        """
+        Record time spent waiting for the rate limiter (seconds).
+        """
+        if waited:
+            with self._lock:
+                self.rate_limit_wait += waited
+
+    def record_save(self, data_type: str, duration: float) -> None:
+        """
+        Record a storage save of a data type (seconds).
+        """
+        with self._lock:
+            self.save_duration.setdefault(str(data_type), Histogram()).observe(duration)
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        with self._lock:
+            lines += ['# HELP sportsdb_request_duration_seconds API request latency per endpoint.',
+                      '# TYPE sportsdb_request_duration_seconds histogram']
+            for endpoint, histogram in sorted(self.request_latency.items()):
+                lines += _histogram_lines('sportsdb_request_duration_seconds', {'endpoint': endpoint}, histogram)
+
+            lines += ['# HELP sportsdb_response_bytes_total Response body bytes per endpoint.',
+                      '# TYPE sportsdb_response_bytes_total counter']
+            lines += [f'sportsdb_response_bytes_total{_labels(endpoint=endpoint)} {size}'
+                      for endpoint, size in sorted(self.response_bytes.items())]
+
+            lines += ['# HELP sportsdb_responses_total Responses per endpoint and HTTP status code.',
+                      '# TYPE sportsdb_responses_total counter']
+            lines += [f'sportsdb_responses_total{_labels(endpoint=endpoint, status=status)} {count}'
+                      for (endpoint, status), count in sorted(self.responses.items())]
+
+            lines += ['# HELP sportsdb_request_errors_total Failed requests per endpoint and error type.',
+                      '# TYPE sportsdb_request_errors_total counter']
+            lines += [f'sportsdb_request_errors_total{_labels(endpoint=endpoint, error=error)} {count}'
+                      for (endpoint, error), count in sorted(self.errors.items())]
+
+            lines += ['# HELP sportsdb_rate_limit_wait_seconds_total Time spent waiting for the rate limiter.',
+                      '# TYPE sportsdb_rate_limit_wait_seconds_total counter',
+                      f'sportsdb_rate_limit_wait_seconds_total {_number(self.rate_limit_wait)}']
+
+            lines += ['# HELP sportsdb_storage_save_duration_seconds Storage save duration per data type.',
+                      '# TYPE sportsdb_storage_save_duration_seconds histogram']
+            for data_type, histogram in sorted(self.save_duration.items()):
+                lines += _histogram_lines('sportsdb_storage_save_duration_seconds', {'data_type': data_type},
+                                          histogram)
+        return '\n'.join(lines) + '\n'
+
+    def write(self, file_path: str) -> str:
+        """
+        Write the metrics to a file in the Prometheus text format (e.g. for node_exporter's textfile collector).
+
+        :param file_path: Path of the metrics file
+        :return: Path of the written file
+        """
+        if os.path.dirname(file_path):
+            make_directory(os.path.dirname(file_path))
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        return file_path
+
+    def serve(self, port: int = 9108, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """
+        Serve the metrics over HTTP (GET /metrics) from a daemon thread.
+
+        :param port: Port to listen on (0 picks a free port)
+        :param host: Address to listen on
+        :return: The running server (call shutdown() to stop it)
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', PROMETHEUS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def reset(self) -> None:
+        """
+        Clear all metrics.
+        """
+        with self._lock:
+            self._clear()
+
+
+def endpoint_name(endpoint: str) -> str:
+    """
+    Get the metric label of an endpoint, e.g. 'eventsround.php?id=4328&r=38' -> 'eventsround.php'.
+    """
+    return endpoint.split('?', 1)[0]
+
+
+def _labels(**labels) -> str:
+    escaped = ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return f'{{{escaped}}}'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    return repr(float(value))
+
+
+def _histogram_lines(name: str, labels: Dict[str, str], histogram: Histogram) -> list:
+    lines = []
+    for bound, count in zip(histogram.buckets, histogram.cumulative_counts()):
+        lines.append(f'{name}_bucket{_labels(**labels, le=_number(bound))} {count}')
+    lines.append(f'{name}_bucket{_labels(**labels, le="+Inf")} {histogram.count}')
+    lines.append(f'{name}_sum{_labels(**labels)} {_number(histogram.sum)}')
+    lines.append(f'{name}_count{_labels(**labels)} {histogram.count}')
+    return lines
+
+
+# Registry used by services and storages unless another one is given
+REGISTRY = MetricsRegistry()
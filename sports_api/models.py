@@ -0,0 +1,168 @@
+from typing import Any, Dict, Iterator, Optional
+
+
+class Record:
+    """
+    Compact, typed record of an API entity.
+
+    Only the fields stored in the database (db_schema.sql) are kept, in __slots__ instead of a per-record dict,
+    so holding several seasons of events costs a fraction of the memory of the API's dicts with dozens of
+    string fields. Records also answer get() with API field names, so they can be passed wherever API
+    dicts are read (e.g. the DAOs and the analytics engines).
+    """
+
+    __slots__ = ()
+
+    # Attribute -> (API field, converter)
+    FIELDS: Dict[str, tuple] = {}
+    # Keys of the API responses that hold records of this type
+    RESPONSE_KEYS: tuple = ()
+
+    def __init__(self, **values):
+        for attribute in self.FIELDS:
+            setattr(self, attribute, values.get(attribute))
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'Record':
+        """
+        Build a record from an API dict, keeping and converting only the stored fields.
+        """
+        record = cls.__new__(cls)
+        for attribute, (field, converter) in cls.FIELDS.items():
+            value = data.get(field)
+            setattr(record, attribute, converter(value) if value not in (None, '') else None)
+        return record
+
+    def to_api(self) -> Dict[str, Any]:
+        """
+        Get the record as a dict with API field names (e.g. for saving to file storage).
+        """
+        return {field: getattr(self, attribute) for attribute, (field, _) in self.FIELDS.items()}
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """
+        Get a value by API field name, like dict.get on the API response.
+        """
+        attribute = self._attributes_by_field().get(field)
+        value = getattr(self, attribute) if attribute else None
+        return default if value is None else value
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.FIELDS)
+        return f'{type(self).__name__}({values})'
+
+    @classmethod
+    def _attributes_by_field(cls) -> Dict[str, str]:
+        if '_field_index' not in cls.__dict__:
+            cls._field_index = {field: attribute for attribute, (field, _) in cls.FIELDS.items()}
+        return cls._field_index
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _date(value: Any) -> str:
+    # strTimestamp ('2024-08-15T19:00:00+00:00') or dateEvent/dateBorn ('2024-08-15')
+    return str(value)[:10]
+
+
+class Event(Record):
+    __slots__ = ('id', 'league_id', 'season', 'home_team_id', 'away_team_id', 'event_date', 'home_score',
+                 'away_score', 'round_number', 'status')
+    FIELDS = {
+        'id': ('idEvent', _int),
+        'league_id': ('idLeague', _int),
+        'season': ('strSeason', str),
+        'home_team_id': ('idHomeTeam', _int),
+        'away_team_id': ('idAwayTeam', _int),
+        'event_date': ('strTimestamp', str),
+        'home_score': ('intHomeScore', _int),
+        'away_score': ('intAwayScore', _int),
+        'round_number': ('intRound', _int),
+        'status': ('strStatus', str),
+    }
+    RESPONSE_KEYS = ('events', 'results', 'event')
+
+
+class Team(Record):
+    __slots__ = ('id', 'name', 'alternate_names', 'short_name', 'foundation_year', 'sport', 'league_id', 'venue_id',
+                 'location', 'country_name')
+    FIELDS = {
+        'id': ('idTeam', _int),
+        'name': ('strTeam', str),
+        'alternate_names': ('strTeamAlternate', str),
+        'short_name': ('strTeamShort', str),
+        'foundation_year': ('intFormedYear', _int),
+        'sport': ('strSport', str),
+        'league_id': ('idLeague', _int),
+        'venue_id': ('idVenue', _int),
+        'location': ('strLocation', str),
+        'country_name': ('strCountry', str),
+    }
+    RESPONSE_KEYS = ('teams',)
+
+
+class Player(Record):
+    __slots__ = ('id', 'name', 'team_id', 'nationality', 'position', 'height', 'weight', 'jersey_number',
+                 'birth_date')
+    FIELDS = {
+        'id': ('idPlayer', _int),
+        'name': ('strPlayer', str),
+        'team_id': ('idTeam', _int),
+        'nationality': ('strNationality', str),
+        'position': ('strPosition', str),
+        'height': ('strHeight', str),
+        'weight': ('strWeight', str),
+        'jersey_number': ('strNumber', _int),
+        'birth_date': ('dateBorn', _date),
+    }
+    RESPONSE_KEYS = ('player', 'players')
+
+
+class Venue(Record):
+    __slots__ = ('id', 'name', 'alternate_names', 'sport', 'capacity', 'country_name', 'location',
+                 'foundation_year')
+    FIELDS = {
+        'id': ('idVenue', _int),
+        'name': ('strVenue', str),
+        'alternate_names': ('strVenueAlternate', str),
+        'sport': ('strSport', str),
+        'capacity': ('intCapacity', _int),
+        'country_name': ('strCountry', str),
+        'location': ('strLocation', str),
+        'foundation_year': ('intFormedYear', _int),
+    }
+    RESPONSE_KEYS = ('venues',)
+
+
+class League(Record):
+    __slots__ = ('id', 'name', 'alternate_name', 'sport')
+    FIELDS = {
+        'id': ('idLeague', _int),
+        'name': ('strLeague', str),
+        'alternate_name': ('strLeagueAlternate', str),
+        'sport': ('strSport', str),
+    }
+    RESPONSE_KEYS = ('leagues', 'countries', 'all')
+
+
+def iter_records(data: Any, record_type: type) -> Iterator[Record]:
+    """
+    Lazily build records from an API response (or a list of API dicts), one record per item.
+
+    :param data: API response, e.g. {'events': [...]}, or list of API dicts
+    :param record_type: Record class (Event, Team, Player, Venue or League)
+    :return: Iterator of records
+    """
+    items: Optional[list] = data if isinstance(data, list) else None
+    if items is None and data:
+        items = next((data.get(key) for key in record_type.RESPONSE_KEYS if isinstance(data.get(key), list)), None)
+    for item in items or []:
+        yield record_type.from_api(item)
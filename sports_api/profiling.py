@@ -0,0 +1,206 @@
+import cProfile
+import datetime
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from sports_api.utils.file_utils import make_directory, write_json_atomic
+
+STAGES = ('fetch', 'decode', 'transform', 'save')
+
+
+class ScrapeProfiler:
+    """
+    Opt-in profiler of a scrape job, timing each stage per round (or per dataset):
+
+    - fetch: network time of API calls (measured by an after_response hook on the API client)
+    - decode: the rest of the API call, i.e. JSON decoding (lazy in raw mode, where it shows up in transform)
+    - transform: processing of the scraped data (standings, ratings)
+    - save: storage saves (serialisation and file writes, or DAO inserts and commits)
+
+    Optionally cProfile and tracemalloc run for the whole job. finish() writes a JSON report, a collapsed-stack
+    file (job;label;stage microseconds, loadable by flamegraph.pl or speedscope) and the cProfile stats.
+    """
+
+    def __init__(self, job_name: str, output_path: str, use_cprofile: bool = False, use_tracemalloc: bool = False,
+                 top_entries: int = 20):
+        """
+        Initialize the profiler.
+
+        :param job_name: Name used in the report and file names, e.g. 'scrape_all_rounds'
+        :param output_path: Directory the reports are written to
+        :param use_cprofile: Whether to run cProfile during the job
+        :param use_tracemalloc: Whether to trace memory allocations during the job
+        :param top_entries: Number of functions/allocation sites listed in the report
+        """
+        self.job_name = job_name
+        self.output_path = output_path
+        self.use_cprofile = use_cprofile
+        self.use_tracemalloc = use_tracemalloc
+        self.top_entries = top_entries
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profile: Optional[cProfile.Profile] = None
+        self._snapshot = None
+        self._started_at = None
+        self._start = None
+
+    @classmethod
+    def from_config(cls, config: Any, job_name: str) -> Optional['ScrapeProfiler']:
+        """
+        Create a profiler from the 'profiling' config section.
+
+        :return: ScrapeProfiler, or None if profiling is disabled
+        """
+        settings = config.get_profiling_settings()
+        if not settings['enabled']:
+            return None
+        output_path = settings.get('output_path') or \
+            os.path.join(config.get_output_settings()['output_path'], 'profiles')
+        return cls(job_name, output_path, use_cprofile=settings['cprofile'], use_tracemalloc=settings['tracemalloc'])
+
+    def attach(self, api_client: Any) -> None:
+        """
+        Measure the network time of the client's API calls (requires a client with a HookRegistry).
+        """
+        hooks = getattr(api_client, 'hooks', None)
+        if hooks is not None:
+            hooks.after_response(self._record_fetch)
+            hooks.on_error(self._record_fetch)
+
+    def start(self) -> None:
+        """
+        Start the job (and cProfile/tracemalloc if enabled).
+        """
+        self._started_at = datetime.datetime.now()
+        self._start = time.perf_counter()
+        if self.use_tracemalloc:
+            tracemalloc.start()
+            self._snapshot = tracemalloc.take_snapshot()
+        if self.use_cprofile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    @contextmanager
+    def stage(self, stage: str, label: Any):
+        """
+        Time a stage of the job, e.g. `with profiler.stage('save', 'round 3'):`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(str(label), stage, time.perf_counter() - start)
+
+    @contextmanager
+    def request(self, label: Any):
+        """
+        Time an API client call, split into fetch (network, from the hooks) and decode (the rest).
+        Requests do not nest: a request opened inside another one on the same thread is part of the outer one.
+        """
+        if getattr(self._local, 'in_request', False):
+            yield
+            return
+        self._local.in_request = True
+        self._local.network = 0.0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            network = min(self._local.network, elapsed)
+            self._local.in_request = False
+            self._add(str(label), 'fetch', network)
+            self._add(str(label), 'decode', elapsed - network)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Get the report of the job so far.
+        """
+        totals = {stage: 0.0 for stage in STAGES}
+        for stages in self.timings.values():
+            for stage, seconds in stages.items():
+                totals[stage] = totals.get(stage, 0.0) + seconds
+
+        report = {
+            'job': self.job_name,
+            'started_at': self._started_at.isoformat() if self._started_at else None,
+            'duration': time.perf_counter() - self._start if self._start is not None else None,
+            'stages': totals,
+            'labels': {label: dict(stages) for label, stages in self.timings.items()},
+            'counts': {label: dict(counts) for label, counts in self.counts.items()},
+        }
+        if self._profile is not None:
+            report['cprofile_top'] = self._cprofile_top()
+        if self._snapshot is not None and tracemalloc.is_tracing():
+            report['memory'] = self._memory_report()
+        return report
+
+    def finish(self) -> Dict[str, str]:
+        """
+        Stop profiling and write the report files.
+
+        :return: Paths of the written files ('report', 'collapsed' and 'cprofile' if enabled)
+        """
+        if self._profile is not None:
+            self._profile.disable()
+        report = self.report()
+        if self._snapshot is not None:
+            tracemalloc.stop()
+            self._snapshot = None
+
+        make_directory(self.output_path)
+        timestamp = (self._started_at or datetime.datetime.now()).strftime('%Y%m%d-%H%M%S')
+        base_path = os.path.join(self.output_path, f'{self.job_name}_{timestamp}')
+        paths = {'report': f'{base_path}.json', 'collapsed': f'{base_path}.collapsed'}
+
+        write_json_atomic(report, paths['report'])
+        with open(paths['collapsed'], 'w', encoding='utf-8') as f:
+            f.write(self.collapsed_stacks())
+        if self._profile is not None:
+            paths['cprofile'] = f'{base_path}.prof'
+            self._profile.dump_stats(paths['cprofile'])
+            self._profile = None
+        return paths
+
+    def collapsed_stacks(self) -> str:
+        """
+        Get the stage timings as collapsed stacks ('job;label;stage microseconds' per line).
+        """
+        lines = []
+        for label, stages in self.timings.items():
+            for stage, seconds in stages.items():
+                lines.append(f'{self.job_name};{label};{stage} {round(seconds * 1e6)}')
+        return '\n'.join(lines) + '\n'
+
+    def _add(self, label: str, stage: str, seconds: float) -> None:
+        with self._lock:
+            stages = self.timings.setdefault(label, {})
+            stages[stage] = stages.get(stage, 0.0) + seconds
+            counts = self.counts.setdefault(label, {})
+            counts[stage] = counts.get(stage, 0) + 1
+
+    def _record_fetch(self, context: Any) -> None:
+        self._local.network = getattr(self._local, 'network', 0.0) + (context.elapsed or 0.0)
+
+    def _cprofile_top(self) -> list:
+        stats = pstats.Stats(self._profile)
+        rows = sorted(stats.stats.items(), key=lambda item: -item[1][3])[:self.top_entries]
+        return [{'function': f'{file}:{line}({name})', 'calls': calls, 'tottime': tottime, 'cumtime': cumtime}
+                for (file, line, name), (_, calls, tottime, cumtime, _) in rows]
+
+    def _memory_report(self) -> Dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory()
+        differences = tracemalloc.take_snapshot().compare_to(self._snapshot, 'lineno')[:self.top_entries]
+        return {
+            'current_bytes': current,
+            'peak_bytes': peak,
+            'top_allocations': [{'location': str(difference.traceback), 'size_diff': difference.size_diff,
+                                 'count_diff': difference.count_diff} for difference in differences],
+        }
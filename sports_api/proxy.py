@@ -0,0 +1,276 @@
+"""
+Read-through caching proxy for the TheSportsDB API, shared by all local workers.
+
+Usage: python -m sports_api.proxy [--config config/config.yaml] [--host 127.0.0.1] [--port 8089]
+
+Point `api.base_url` of the workers at the proxy (e.g. http://127.0.0.1:8089/api/v1/json); the proxy forwards
+`/{api_key}/{endpoint}` requests to the upstream API.
+"""
+import argparse
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+import requests
+import yaml
+
+from sports_api.config import Config
+from sports_api.metrics import MetricsRegistry, REGISTRY, endpoint_name
+from sports_api.services.rate_limiter import RateLimiter
+from sports_api.utils.logging_utils import configure_logging_from_config
+from sports_api.utils.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_URL = 'https://www.thesportsdb.com/api/v1/json'
+
+# Seconds responses are cached per endpoint (0 disables caching); other endpoints use the default TTL
+DEFAULT_TTLS = {
+    'all_countries.php': 86400,
+    'all_leagues.php': 86400,
+    'all_sports.php': 86400,
+    'search_all_leagues.php': 86400,
+    'search_all_seasons.php': 86400,
+    'search_all_teams.php': 86400,
+    'lookup_all_teams.php': 86400,
+    'lookupvenue.php': 86400,
+    'eventsround.php': 3600,
+    'eventsseason.php': 3600,
+    'lookuptable.php': 1800,
+    'eventslast.php': 600,
+    'eventsnext.php': 600,
+    'eventsnextleague.php': 600,
+    'eventspastleague.php': 600,
+    'eventsday.php': 300,
+    'livescore.php': 0,
+}
+
+
+class _Flight:
+    """
+    An upstream request that concurrent requests for the same endpoint wait for.
+    """
+
+    __slots__ = ('done', 'result')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Tuple[int, bytes, str]] = None
+
+
+class CachingProxy:
+    """
+    HTTP server that answers API requests from an in-memory cache with per-endpoint TTLs.
+
+    Concurrent requests for the same uncached endpoint are coalesced into one upstream request (single flight),
+    upstream requests share one rate limit, and expired responses are served if the upstream request fails.
+    Only successful responses are cached. Responses carry an X-Cache header: HIT, MISS, SHARED
+    (coalesced with another request's MISS) or STALE.
+    """
+
+    def __init__(self, upstream: str = UPSTREAM_URL, rate_limiter: Optional[RateLimiter] = None,
+                 ttls: Optional[Dict[str, int]] = None, default_ttl: int = 900, max_entries: int = 10000,
+                 timeout: float = 30.0, metrics: Optional[MetricsRegistry] = None):
+        """
+        Initialize the proxy.
+
+        :param upstream: Base URL of the upstream API (without the API key)
+        :param rate_limiter: Optional RateLimiter for upstream requests
+        :param ttls: Cache TTLs in seconds per endpoint name, merged with DEFAULT_TTLS
+        :param default_ttl: Cache TTL in seconds of endpoints without their own TTL
+        :param max_entries: Maximum number of cached responses (least recently used ones are evicted)
+        :param timeout: Timeout of upstream requests in seconds
+        :param metrics: MetricsRegistry that records upstream requests (defaults to the shared REGISTRY)
+        """
+        self.upstream = upstream.rstrip('/')
+        self.rate_limiter = rate_limiter
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.timeout = timeout
+        self.metrics = metrics if metrics is not None else REGISTRY
+        self.stats = {'hits': 0, 'misses': 0, 'shared': 0, 'stale': 0, 'errors': 0}
+        self._cache = LRUCache(max_entries)  # (api key, endpoint) -> (expires, status, body)
+        self._in_flight: Dict[Tuple[str, str], _Flight] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @classmethod
+    def from_config(cls, config: Config) -> 'CachingProxy':
+        """
+        Create a proxy from the 'proxy' and 'rate_limit' config sections.
+        """
+        settings = config.get_proxy_settings()
+        rate_limit = config.get_rate_limit_settings()
+        return cls(settings['upstream'], RateLimiter(rate_limit['max_requests'], rate_limit['period'],
+                                                     rate_limit['aging']),
+                   ttls=settings['ttl'], default_ttl=settings['default_ttl'], max_entries=settings['max_entries'])
+
+    def ttl(self, endpoint: str) -> int:
+        """
+        Get the cache TTL in seconds of an endpoint (with or without its query string).
+        """
+        return self.ttls.get(endpoint_name(endpoint), self.default_ttl)
+
+    def fetch(self, api_key: str, endpoint: str) -> Tuple[int, bytes, str]:
+        """
+        Get the response for an endpoint from the cache or the upstream API.
+
+        :param api_key: API key the request was made with
+        :param endpoint: Endpoint with its query string, e.g. 'eventsround.php?id=4328&r=1&s=2024-2025'
+        :return: Tuple of (status code, body, cache state)
+        """
+        key = (api_key, endpoint)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.time():
+                self.stats['hits'] += 1
+                return cached[1], cached[2], 'HIT'
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            status, body, state = flight.result
+            with self._lock:
+                self.stats['shared'] += 1
+            return status, body, 'SHARED' if state == 'MISS' else state
+
+        try:
+            flight.result = self._fetch_upstream(key, cached)
+            return flight.result
+        except Exception as e:
+            # Unexpected errors (e.g. from the rate limiter) are answered like failed upstream requests, also for
+            # the requests waiting on this one
+            logger.error('Error while fetching %s: %s', endpoint, e)
+            with self._lock:
+                self.stats['errors'] += 1
+            flight.result = (502, b'Bad Gateway', 'MISS')
+            return flight.result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            flight.done.set()
+
+    def _fetch_upstream(self, key: Tuple[str, str], stale: Optional[tuple]) -> Tuple[int, bytes, str]:
+        api_key, endpoint = key
+        if self.rate_limiter is not None:
+            self.metrics.record_rate_limit_wait(self.rate_limiter.acquire())
+
+        name = endpoint_name(endpoint) if endpoint else 'index'
+        start = time.perf_counter()
+        try:
+            response = requests.get(f'{self.upstream}/{api_key}/{endpoint}', timeout=self.timeout)
+        except requests.RequestException as e:
+            self.metrics.record_request(name, time.perf_counter() - start, error=type(e).__name__)
+            logger.warning('Upstream request for %s failed: %s', endpoint, e)
+            with self._lock:
+                self.stats['errors'] += 1
+                if stale is not None:
+                    self.stats['stale'] += 1
+            if stale is not None:
+                return stale[1], stale[2], 'STALE'
+            return 502, b'Bad Gateway', 'MISS'
+
+        self.metrics.record_request(name, time.perf_counter() - start, status=response.status_code,
+                                    size=len(response.content))
+        with self._lock:
+            self.stats['misses'] += 1
+            if response.status_code == 200 and self.ttl(endpoint) > 0:
+                self._cache.put(key, (time.time() + self.ttl(endpoint), response.status_code, response.content))
+            elif response.status_code >= 500 and stale is not None:
+                self.stats['stale'] += 1
+                return stale[1], stale[2], 'STALE'
+        return response.status_code, response.content, 'MISS'
+
+    def start(self, host: str = '127.0.0.1', port: int = 8089) -> ThreadingHTTPServer:
+        """
+        Serve the proxy from a daemon thread.
+
+        :param host: Address to listen on
+        :param port: Port to listen on (0 picks a free port)
+        :return: The running server (call stop() to stop it)
+        """
+        proxy = self
+
+        class ProxyHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                # Only the last two path segments matter, so any base path prefix works: /.../{api_key}/{endpoint}
+                path, _, query = self.path.partition('?')
+                segments = path.split('/')
+                if len(segments) < 3:
+                    self.send_error(404)
+                    return
+                endpoint = f'{segments[-1]}?{query}' if query else segments[-1]
+
+                status, body, state = proxy.fetch(segments[-2], endpoint)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('X-Cache', state)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), ProxyHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server
+
+    def stop(self) -> None:
+        """
+        Stop the server started by start().
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def clear(self) -> None:
+        """
+        Drop all cached responses.
+        """
+        with self._lock:
+            self._cache.clear()
+
+
+def load_config(config_path: str) -> Config:
+    """
+    Load a config file without verifying the API connection, since its base_url may point at the proxy itself.
+    """
+    with open(config_path, 'r') as f:
+        config_data = yaml.safe_load(f) or {}
+    api = config_data.get('api') or {}
+    config = Config(api_key=api.get('key') or 'unused', base_url=api.get('base_url') or UPSTREAM_URL)
+    config.config_data = config_data
+    return config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--config', default='config/config.yaml')
+    parser.add_argument('--host')
+    parser.add_argument('--port', type=int)
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    configure_logging_from_config(config)
+    settings = config.get_proxy_settings()
+    proxy = CachingProxy.from_config(config)
+    server = proxy.start(args.host or settings['host'], args.port if args.port is not None else settings['port'])
+    host, port = server.server_address[:2]
+    logger.info('Caching proxy for %s listening on http://%s:%s', proxy.upstream, host, port)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        proxy.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sports_api.services.quota import QuotaTracker
+
+# Regular rounds assumed for a league and season whose rounds are not known yet (a 20-team double round-robin)
+DEFAULT_ROUNDS = 38
+
+
+class ScrapeTask:
+    """
+    A requested scrape of the rounds of one league and season.
+    """
+
+    def __init__(self, league_id: int, season: str, priority: int = 0, start_round: int = 1,
+                 end_round: Optional[int] = None):
+        """
+        :param league_id: League ID
+        :param season: Season (e.g. '2024-2025')
+        :param priority: Higher priorities are scheduled first
+        :param start_round: Number of the first round
+        :param end_round: Number of the last round (inclusive), None to retrieve (or discover) all rounds
+        """
+        self.league_id = league_id
+        self.season = season
+        self.priority = priority
+        self.start_round = start_round
+        self.end_round = end_round
+
+    def __repr__(self) -> str:
+        return f'ScrapeTask(league_id={self.league_id}, season={self.season!r}, priority={self.priority})'
+
+
+class RequestPlanner:
+    """
+    Estimates how many API calls scrapes of leagues x seasons x rounds take and fits them into the request budget
+    left in the quota: tasks are taken by priority (in request order within a priority), and tasks that do not fit
+    are deferred while smaller, lower-priority ones that still fit are scheduled.
+    """
+
+    def __init__(self, quota: Optional[QuotaTracker] = None,
+                 round_lookup: Optional[Callable[[int, str], Optional[list]]] = None,
+                 default_rounds: int = DEFAULT_ROUNDS, max_empty_rounds: int = 2):
+        """
+        Initialize the request planner.
+
+        :param quota: Optional QuotaTracker whose remaining requests are the default budget
+        :param round_lookup: Optional function returning the known rounds of a league and season
+                             (e.g. DataScraper.discover_rounds), or None if they are unknown
+        :param default_rounds: Number of rounds assumed when the rounds are not known
+        :param max_empty_rounds: Empty rounds requested after the last round when the rounds are discovered
+        """
+        self.quota = quota
+        self.round_lookup = round_lookup
+        self.default_rounds = default_rounds
+        self.max_empty_rounds = max_empty_rounds
+
+    def estimate(self, task: ScrapeTask) -> int:
+        """
+        Estimate the number of API calls of a task (one per round, plus the empty rounds that end a discovery).
+        """
+        if task.end_round is not None:
+            return max(0, task.end_round - task.start_round + 1)
+
+        rounds = self.round_lookup(task.league_id, task.season) if self.round_lookup is not None else None
+        if rounds:
+            return len([round_num for round_num in rounds if round_num >= task.start_round])
+        return max(0, self.default_rounds - task.start_round + 1) + self.max_empty_rounds
+
+    def plan(self, tasks: Iterable[ScrapeTask], budget: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Order the tasks and split them into the ones that fit into the budget and the deferred ones.
+
+        :param tasks: Requested scrapes
+        :param budget: Number of API calls available (defaults to the quota's remaining requests; None is unlimited)
+        :return: {'scheduled': [tasks], 'deferred': [tasks], 'estimated_calls': calls of the scheduled tasks,
+                  'budget': budget}
+        """
+        if budget is None and self.quota is not None:
+            budget = self.quota.remaining()
+
+        scheduled: List[ScrapeTask] = []
+        deferred: List[ScrapeTask] = []
+        estimated_calls = 0
+        for task in sorted(tasks, key=lambda task: -task.priority):
+            calls = self.estimate(task)
+            if budget is not None and estimated_calls + calls > budget:
+                deferred.append(task)
+                continue
+            scheduled.append(task)
+            estimated_calls += calls
+
+        return {'scheduled': scheduled, 'deferred': deferred, 'estimated_calls': estimated_calls, 'budget': budget}
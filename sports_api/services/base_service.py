@@ -1,7 +1,14 @@
-from typing import Dict, Any
+import time
+from typing import Any, Dict
 import requests
 
 from sports_api.config import Config
+from sports_api.metrics import MetricsRegistry, REGISTRY, endpoint_name
+from sports_api.services.hooks import HookRegistry, RequestContext
+from sports_api.services.quota import QuotaTracker
+from sports_api.services.rate_limiter import RateLimiter
+from sports_api.services.raw_response import RawResponse
+from sports_api.services.replay import ReplayTransport
 
 
 class BaseService:
@@ -9,25 +16,86 @@ class BaseService:
     Base service class that provides common functionality for all service classes.
     All service classes should inherit from this class.
     """
-    
-    def __init__(self, config: Config):
+
+    def __init__(self, config: Config, raw: bool = False, rate_limiter: RateLimiter = None,
+                 metrics: MetricsRegistry = None, hooks: HookRegistry = None, quota: QuotaTracker = None,
+                 transport: ReplayTransport = None):
         """
         Initialize the base service.
-        
+
         :param config: Config object with API credentials
+        :param raw: Whether to return undecoded response bodies (RawResponse) instead of parsed JSON
+        :param rate_limiter: Optional RateLimiter shared with other services
+        :param metrics: MetricsRegistry that records latency, size, status and errors per endpoint
+                        (defaults to the shared REGISTRY)
+        :param hooks: Optional HookRegistry whose callbacks run around every request
+        :param quota: Optional QuotaTracker counting the requests made with the API key
+        :param transport: Optional ReplayTransport that serves responses from disk and/or records live ones
         """
         self.config = config
-    
+        self.raw = raw
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics if metrics is not None else REGISTRY
+        self.hooks = hooks
+        self.quota = quota
+        self.transport = transport
+
     def _make_request(self, endpoint: str) -> Dict[str, Any]:
         """
         Make a request to the API.
-        
+
         :param endpoint: API endpoint to call
-        :return: JSON response as a dictionary
+        :return: JSON response as a dictionary (RawResponse in raw mode)
         """
+        if self.transport is not None:
+            replayed = self.transport.replay(endpoint)
+            if replayed is not None:
+                replayed.raise_for_status()
+                return self._decode(replayed)
+
         api_key, base_url = self.config.get_credentials()
         url = f'{base_url}/{api_key}/{endpoint}'
-        
-        response = requests.get(url)
-        response.raise_for_status()
+
+        if self.rate_limiter is not None:
+            self.metrics.record_rate_limit_wait(self.rate_limiter.acquire())
+        if self.quota is not None:
+            self.quota.record()
+
+        name = endpoint_name(endpoint)
+        # Contexts are only created when hooks are registered, so requests without hooks pay one check
+        context = RequestContext(name, endpoint) if self.hooks is not None and self.hooks.active else None
+        if context is not None:
+            self.hooks.run('before_request', context)
+
+        start = time.perf_counter()
+        try:
+            response = requests.get(url, headers=context.headers) if context is not None and context.headers \
+                else requests.get(url)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            elapsed = time.perf_counter() - start
+            failed_response = getattr(e, 'response', None)
+            status = failed_response.status_code if failed_response is not None else None
+            size = len(failed_response.content or b'') if failed_response is not None else 0
+            self.metrics.record_request(name, elapsed, status=status, size=size, error=type(e).__name__)
+            if context is not None:
+                context.start, context.elapsed, context.status, context.size, context.error = \
+                    start, elapsed, status, size, e
+                self.hooks.run('on_error', context)
+            raise
+
+        elapsed = time.perf_counter() - start
+        self.metrics.record_request(name, elapsed, status=response.status_code, size=len(response.content))
+        if context is not None:
+            context.start, context.elapsed, context.status, context.size = \
+                start, elapsed, response.status_code, len(response.content)
+            self.hooks.run('after_response', context)
+
+        if self.transport is not None:
+            self.transport.record(endpoint, response)
+        return self._decode(response)
+
+    def _decode(self, response: Any) -> Any:
+        if self.raw:
+            return RawResponse(response.content)
         return response.json()
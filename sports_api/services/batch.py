@@ -0,0 +1,30 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable
+
+
+def run_batch(func: Callable[[Any], Any], ids: Iterable[Any], max_workers: int = 4) -> Dict[str, Dict[Any, Any]]:
+    """
+    Call func for every unique ID concurrently. A failing ID does not abort the batch.
+    Rate limiting is left to func (the services share the client's rate limiter); the calls keep the request
+    priority of the caller.
+
+    :param func: Function called with a single ID, e.g. LookupService.get_player_details
+    :param ids: IDs to look up (duplicates are removed, order is kept)
+    :param max_workers: Maximum number of concurrent requests
+    :return: {'results': {id: data}, 'errors': {id: error message}}
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    results, errors = {}, {}
+    if not unique_ids:
+        return {'results': results, 'errors': errors}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+        futures = {item_id: executor.submit(contextvars.copy_context().run, func, item_id) for item_id in unique_ids}
+        for item_id, future in futures.items():
+            try:
+                results[item_id] = future.result()
+            except Exception as e:
+                errors[item_id] = str(e)
+
+    return {'results': results, 'errors': errors}
@@ -1,3 +1,22 @@
+import functools
+
+
+class PremiumRequiredError(Exception):
+    """
+    Raised when an endpoint that needs a premium API key is called with a free-tier key.
+    """
+
+
 def premium_required(func):
-    func.is_premium = True
-    return func
+    """
+    Mark a service method as premium-only and refuse it, before any request is made, when the service's
+    config has a free-tier key (see Config.is_premium).
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not self.config.is_premium():
+            raise PremiumRequiredError(f'{func.__name__} requires a premium API key.')
+        return func(self, *args, **kwargs)
+
+    wrapper.is_premium = True
+    return wrapper
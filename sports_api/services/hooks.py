@@ -0,0 +1,87 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+HOOK_EVENTS = ('before_request', 'after_response', 'on_error')
+
+
+class RequestContext:
+    """
+    State of one API call passed to every hook.
+
+    before_request hooks may add headers (e.g. a request ID) and tags; after_response and on_error hooks
+    also see the status code, response size, elapsed time and the error, if any.
+    """
+
+    __slots__ = ('endpoint', 'path', 'headers', 'tags', 'start', 'elapsed', 'status', 'size', 'retries', 'error')
+
+    def __init__(self, endpoint: str, path: str, retries: int = 0):
+        """
+        :param endpoint: Endpoint name without the query string, e.g. 'eventsround.php'
+        :param path: Endpoint with its query string (the API key is not included)
+        :param retries: Number of earlier attempts of this call (0 while services make a single attempt per call)
+        """
+        self.endpoint = endpoint
+        self.path = path
+        self.headers: Dict[str, str] = {}
+        self.tags: Dict[str, Any] = {}
+        self.start: Optional[float] = None
+        self.elapsed: Optional[float] = None
+        self.status: Optional[int] = None
+        self.size = 0
+        self.retries = retries
+        self.error: Optional[BaseException] = None
+
+
+class HookRegistry:
+    """
+    Callbacks run around every API call made by the services sharing this registry.
+
+    Hooks are called with a RequestContext. Exceptions raised by hooks are reported and ignored, so
+    instrumentation cannot break scraping. With no hooks registered, requests only pay for one attribute check.
+    """
+
+    def __init__(self):
+        self.hooks: Dict[str, List[Callable[[RequestContext], Any]]] = {event: [] for event in HOOK_EVENTS}
+        self.active = False
+
+    def register(self, event: str, callback: Callable[[RequestContext], Any]) -> Callable[[RequestContext], Any]:
+        """
+        Register a callback.
+
+        :param event: 'before_request', 'after_response' or 'on_error'
+        :param callback: Function called with the RequestContext
+        :return: The callback (so register can be used as a decorator)
+        """
+        if event not in self.hooks:
+            raise ValueError(f"Unknown hook event: {event}. Expected one of {', '.join(HOOK_EVENTS)}.")
+        self.hooks[event].append(callback)
+        self.active = True
+        return callback
+
+    def unregister(self, event: str, callback: Callable[[RequestContext], Any]) -> None:
+        """
+        Remove a registered callback.
+        """
+        self.hooks[event].remove(callback)
+        self.active = any(self.hooks.values())
+
+    def before_request(self, callback: Callable[[RequestContext], Any]) -> Callable[[RequestContext], Any]:
+        return self.register('before_request', callback)
+
+    def after_response(self, callback: Callable[[RequestContext], Any]) -> Callable[[RequestContext], Any]:
+        return self.register('after_response', callback)
+
+    def on_error(self, callback: Callable[[RequestContext], Any]) -> Callable[[RequestContext], Any]:
+        return self.register('on_error', callback)
+
+    def run(self, event: str, context: RequestContext) -> None:
+        """
+        Call the callbacks registered for an event in registration order.
+        """
+        for callback in self.hooks[event]:
+            try:
+                callback(context)
+            except Exception as e:
+                logger.warning('Error in %s hook %s: %s', event, getattr(callback, '__name__', callback), e)
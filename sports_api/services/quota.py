@@ -0,0 +1,115 @@
+import hashlib
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, Optional
+
+from sports_api.utils.file_utils import file_lock, load_json_file, write_json_atomic
+
+# Length of the quota windows in seconds; windows are aligned to the epoch (e.g. a day starts at 00:00 UTC)
+WINDOWS = {'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+class QuotaTracker:
+    """
+    Counts the requests made with an API key per minute, hour and day, persisted in a JSON file so that
+    every process using the key (scheduled jobs, scripts) shares the counters.
+
+    Keys are stored as a short SHA-256 digest, never in plain text. Limits are optional; they are used to
+    report the remaining budget (e.g. to the RequestPlanner), requests are never blocked here.
+    """
+
+    FILE_NAME = 'quota.json'
+
+    def __init__(self, api_key: str, file_path: Optional[str] = None, limits: Optional[Dict[str, int]] = None):
+        """
+        Initialize the quota tracker.
+
+        :param api_key: API key the requests are counted for
+        :param file_path: Optional JSON file the counters are persisted in (kept in memory only if None)
+        :param limits: Optional request limits per window, e.g. {'minute': 30, 'day': 5000}
+        """
+        unknown = set(limits or {}) - set(WINDOWS)
+        if unknown:
+            raise ValueError(f"Unknown quota windows: {', '.join(sorted(unknown))}. "
+                             f"Expected {', '.join(WINDOWS)}.")
+        self.key = hashlib.sha256(str(api_key).encode('utf-8')).hexdigest()[:16]
+        self.file_path = file_path
+        self.limits = {window: limit for window, limit in (limits or {}).items() if limit is not None}
+        self._counters: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional['QuotaTracker']:
+        """
+        Create a tracker from the 'quota' config section, persisted in the output directory by default.
+
+        :return: QuotaTracker, or None if quota accounting is disabled
+        """
+        settings = config.get_quota_settings()
+        if not settings['enabled']:
+            return None
+        file_path = settings.get('file') or \
+            os.path.join(config.get_output_settings()['output_path'], cls.FILE_NAME)
+        api_key, _ = config.get_credentials()
+        return cls(api_key, file_path, {window: settings.get(window) for window in WINDOWS})
+
+    def record(self, count: int = 1, now: Optional[float] = None) -> None:
+        """
+        Count requests made with the key. The file is re-read and written under an inter-process lock, so
+        counts of other processes are kept.
+
+        :param count: Number of requests
+        :param now: Optional UNIX timestamp of the requests (defaults to the current time)
+        """
+        now = time.time() if now is None else now
+        with self._lock, (file_lock(self.file_path) if self.file_path else nullcontext()):
+            self._load()
+            counters = self._counters.setdefault(self.key, {})
+            for window, length in WINDOWS.items():
+                start = int(now // length * length)
+                counter = counters.get(window)
+                if counter is None or counter['start'] != start:
+                    counter = counters[window] = {'start': start, 'count': 0}
+                counter['count'] += count
+            if self.file_path:
+                write_json_atomic(self._counters, self.file_path)
+
+    def used(self, window: str, now: Optional[float] = None) -> int:
+        """
+        Get the number of requests made in the current window.
+
+        :param window: 'minute', 'hour' or 'day'
+        :param now: Optional UNIX timestamp (defaults to the current time)
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._load()
+            counter = self._counters.get(self.key, {}).get(window)
+        if counter is None or counter['start'] != int(now // WINDOWS[window] * WINDOWS[window]):
+            return 0
+        return counter['count']
+
+    def remaining(self, window: Optional[str] = None, now: Optional[float] = None) -> Optional[int]:
+        """
+        Get the number of requests left.
+
+        :param window: Window to check, or None for the smallest budget over all limited windows
+        :param now: Optional UNIX timestamp (defaults to the current time)
+        :return: Requests left, or None if there is no limit
+        """
+        windows = [window] if window is not None else list(self.limits)
+        budgets = [max(0, self.limits[name] - self.used(name, now)) for name in windows if name in self.limits]
+        return min(budgets) if budgets else None
+
+    def usage(self, now: Optional[float] = None) -> Dict[str, Dict[str, Optional[int]]]:
+        """
+        Get the used requests, limit and remaining requests of every window.
+        """
+        return {window: {'used': self.used(window, now), 'limit': self.limits.get(window),
+                         'remaining': self.remaining(window, now)} for window in WINDOWS}
+
+    def _load(self) -> None:
+        if self.file_path:
+            self._counters = load_json_file(self.file_path, default={}) or {}
@@ -0,0 +1,102 @@
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Request priorities: lower values are served first
+INTERACTIVE = 0
+BULK = 1
+
+_priority: ContextVar[int] = ContextVar('request_priority', default=INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: int):
+    """
+    Make the API calls of the current thread (or task) in the block with the given priority,
+    e.g. `with request_priority(BULK):` for background scraping.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    """
+    Get the priority of API calls made in the current context (INTERACTIVE unless set by request_priority).
+    """
+    return _priority.get()
+
+
+class RateLimiter:
+    """
+    Thread-safe sliding-window rate limiter shared by all services of a client (or several clients).
+
+    Waiting requests are served by priority, so interactive calls take the next free slot ahead of queued bulk
+    traffic, and in arrival order within a priority. A request that has waited `aging` seconds moves up one
+    priority level (and another one after every further `aging` seconds), so bulk work is never starved.
+    """
+
+    def __init__(self, max_requests: int, period: float = 60.0, aging: float = 10.0):
+        """
+        Initialize the rate limiter.
+
+        :param max_requests: Maximum number of requests allowed within the period
+        :param period: Length of the window in seconds
+        :param aging: Seconds of waiting after which a request is promoted by one priority level
+        """
+        self.max_requests = max_requests
+        self.period = period
+        self.aging = aging
+        self._request_times = deque()
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiting = []  # (priority, arrival time, sequence number) of the waiting requests
+        self._sequence = itertools.count()
+
+    def acquire(self, priority: int = None) -> float:
+        """
+        Block until a request may be made and record it.
+
+        :param priority: Priority of the request (defaults to the priority of the current context)
+        :return: Time spent waiting in seconds
+        """
+        start = time.monotonic()
+        ticket = (current_priority() if priority is None else priority, start, next(self._sequence))
+        with self._condition:
+            self._waiting.append(ticket)
+            # A new request may rank ahead of the ones already waiting
+            self._condition.notify_all()
+            try:
+                while True:
+                    now = time.monotonic()
+                    while self._request_times and now - self._request_times[0] >= self.period:
+                        self._request_times.popleft()
+
+                    full = len(self._request_times) >= self.max_requests
+                    if not full and min(self._waiting, key=lambda waiting: self._rank(waiting, now)) is ticket:
+                        self._request_times.append(now)
+                        return now - start
+
+                    # Wait for the next free slot, or until another request takes the free slot
+                    self._condition.wait(self.period - (now - self._request_times[0]) if full else None)
+            finally:
+                self._waiting.remove(ticket)
+                self._condition.notify_all()
+
+    def pending(self) -> int:
+        """
+        Get the number of requests waiting for a slot.
+        """
+        with self._lock:
+            return len(self._waiting)
+
+    def _rank(self, ticket: tuple, now: float) -> tuple:
+        priority, arrival, sequence = ticket
+        if self.aging:
+            priority -= int((now - arrival) / self.aging)
+        return max(priority, INTERACTIVE), arrival, sequence
@@ -0,0 +1,51 @@
+import json
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+
+class RawResponse(Mapping):
+    """
+    Undecoded API response body.
+    The body is kept as bytes and is only parsed the first time its content is accessed, so archival
+    scrapes can write it to disk without a parse/re-serialise round trip.
+    """
+
+    __slots__ = ('content', '_data', '_decoded')
+
+    def __init__(self, content: bytes):
+        """
+        Initialize the raw response.
+
+        :param content: Response body exactly as returned by the API
+        """
+        self.content = content
+        self._data = None
+        self._decoded = False
+
+    @property
+    def data(self) -> Any:
+        """
+        Decoded response body (parsed lazily on first access).
+
+        :return: JSON response as a dictionary
+        """
+        if not self._decoded:
+            self._data = json.loads(self.content) if self.content.strip() else {}
+            self._decoded = True
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data or {})
+
+    def __len__(self) -> int:
+        return len(self.data or {})
+
+    def __bool__(self) -> bool:
+        # Checked before saving, so it must not trigger decoding
+        return bool(self.content.strip())
+
+    def __repr__(self) -> str:
+        return f'RawResponse({len(self.content)} bytes)'
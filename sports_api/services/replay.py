@@ -0,0 +1,185 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from sports_api.utils.file_utils import make_directory
+
+logger = logging.getLogger(__name__)
+
+REPLAY_MODES = ('replay', 'record', 'auto')
+
+# endpoint -> (stored data type, {query parameter: storage field}, response key)
+STORED_ENDPOINTS = {
+    'eventsround.php': ('rounds', {'id': 'league_id', 's': 'season', 'r': 'round_num'}, 'events'),
+    'eventsseason.php': ('season_matches', {'id': 'league_id', 's': 'season'}, 'events'),
+    'lookuptable.php': ('league_table', {'l': 'league_id', 's': 'season'}, 'table'),
+    'all_countries.php': ('countries', {}, 'countries'),
+    'all_leagues.php': ('leagues', {}, 'leagues'),
+    'search_all_teams.php': ('teams', {'l': 'league_id'}, 'teams'),
+}
+
+
+class ReplayMissError(requests.RequestException):
+    """
+    Raised in replay mode for an endpoint that has neither a recorded nor a stored response.
+    """
+
+
+class ReplayResponse:
+    """
+    Recorded response with the parts of requests.Response used by the services.
+    """
+
+    __slots__ = ('status_code', 'content')
+
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+    def json(self) -> Any:
+        return json.loads(self.content) if self.content.strip() else {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error (replayed)', response=self)
+
+
+class ReplayTransport:
+    """
+    Serves API calls from local disk instead of the API:
+
+    - replay: responses come from the cassette, or else from the data FileStorage saved for the endpoint (rounds,
+      season matches, tables, countries, leagues, teams at their generate_file_path locations); anything else
+      raises ReplayMissError, so no request ever reaches the API
+    - record: every call goes to the API and its response is appended to the cassette
+    - auto: replays what is available and records the rest
+
+    The cassette is a JSON-lines file of {"endpoint", "status", "body"} entries (later entries win). Endpoints are
+    recorded without the API key. Replayed calls skip the rate limiter, quota, metrics and hooks.
+    """
+
+    def __init__(self, cassette_path: Optional[str] = None, mode: str = 'replay', storage: Any = None):
+        """
+        Initialize the replay transport.
+
+        :param cassette_path: Optional JSON-lines file responses are replayed from and recorded to
+        :param mode: 'replay', 'record' or 'auto'
+        :param storage: Optional FileStorage whose saved data answers endpoints missing from the cassette
+        """
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"Unknown replay mode: {mode}. Expected one of {', '.join(REPLAY_MODES)}.")
+        self.cassette_path = cassette_path
+        self.mode = mode
+        self.storage = storage
+        self._interactions: Optional[Dict[str, Tuple[int, bytes]]] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional['ReplayTransport']:
+        """
+        Create a transport from the 'replay' config section, with the cassette in the data output path by default.
+
+        :return: ReplayTransport, or None if no replay mode is configured
+        """
+        settings = config.get_replay_settings()
+        if not settings['mode']:
+            return None
+
+        output_path = config.get_output_settings()['output_path']
+        storage = None
+        if settings['use_storage']:
+            # Imported here: the storage package depends on the services package
+            from sports_api.storage.file_storage import FileStorage
+            from sports_api.utils.league_resolver import LeagueResolver
+            storage = FileStorage(config, league_resolver=LeagueResolver.from_config(config))
+        cassette_path = settings['cassette'] or os.path.join(output_path, 'cassettes', 'cassette.jsonl')
+        return cls(cassette_path, settings['mode'], storage)
+
+    @property
+    def interactions(self) -> Dict[str, Tuple[int, bytes]]:
+        """
+        Recorded responses by endpoint (loaded from the cassette on first access).
+        """
+        if self._interactions is None:
+            self._interactions = {}
+            if self.cassette_path and os.path.exists(self.cassette_path):
+                with open(self.cassette_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            entry = json.loads(line)
+                            self._interactions[entry['endpoint']] = (entry['status'], entry['body'].encode('utf-8'))
+        return self._interactions
+
+    def replay(self, endpoint: str) -> Optional[ReplayResponse]:
+        """
+        Get the local response for an endpoint.
+
+        :param endpoint: Endpoint with its query string, e.g. 'eventsround.php?id=4335&r=1&s=2024-2025'
+        :return: ReplayResponse, or None if the endpoint is to be requested from the API
+        :raises ReplayMissError: In replay mode, if there is no local response
+        """
+        if self.mode == 'record':
+            return None
+
+        recorded = self.interactions.get(endpoint)
+        if recorded is not None:
+            return ReplayResponse(*recorded)
+
+        stored = self._load_stored(endpoint)
+        if stored is not None:
+            return ReplayResponse(200, json.dumps(stored, ensure_ascii=False).encode('utf-8'))
+
+        if self.mode == 'replay':
+            raise ReplayMissError(f'No recorded or stored response for {endpoint}')
+        return None
+
+    def record(self, endpoint: str, response: Any) -> None:
+        """
+        Append a live response to the cassette (no-op in replay mode).
+
+        :param endpoint: Endpoint with its query string
+        :param response: Response with status_code and content
+        """
+        if self.mode == 'replay':
+            return
+
+        body = response.content.decode('utf-8')
+        with self._lock:
+            self.interactions[endpoint] = (response.status_code, response.content)
+            if self.cassette_path:
+                make_directory(os.path.dirname(self.cassette_path) or '.')
+                with open(self.cassette_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps({'endpoint': endpoint, 'status': response.status_code, 'body': body},
+                                       ensure_ascii=False) + '\n')
+
+    def _load_stored(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        url = urlsplit(endpoint)
+        if self.storage is None or url.path not in STORED_ENDPOINTS:
+            return None
+
+        data_type, fields, response_key = STORED_ENDPOINTS[url.path]
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if set(params) - set(fields):
+            return None  # e.g. search_all_teams.php by sport and country
+        kwargs = {field: params.get(param) for param, field in fields.items()}
+
+        if kwargs.get('league_id') is not None and not kwargs['league_id'].isdigit():
+            # Team searches name the league, the stored files are keyed by its ID
+            resolver = getattr(self.storage, 'league_resolver', None)
+            kwargs['league_id'] = resolver.resolve_id(kwargs['league_id']) if resolver is not None else None
+            if kwargs['league_id'] is None:
+                return None
+        for field in ('league_id', 'round_num'):
+            if kwargs.get(field) is not None:
+                kwargs[field] = int(kwargs[field])
+
+        data = self.storage.load(data_type, **kwargs)
+        if data is None:
+            return None
+        # Individual rounds are saved as the list of their events
+        return data if isinstance(data, dict) else {response_key: data}
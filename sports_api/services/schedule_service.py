@@ -3,6 +3,9 @@ from typing import Dict, Any, Optional
 from sports_api.services.base_service import BaseService
 from sports_api.services.decorators import premium_required
 
+# Maximum number of events returned by eventsseason.php on the free tier
+FREE_TIER_SEASON_EVENTS_LIMIT = 100
+
 
 class ScheduleService(BaseService):
     """
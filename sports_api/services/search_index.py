@@ -0,0 +1,171 @@
+import bisect
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, Iterable, List
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for matching: fold accents, lowercase, treat underscores and punctuation as spaces.
+
+    :param name: Name, e.g. 'Atlético_Madrid'
+    :return: Normalized name, e.g. 'atletico madrid'
+    """
+    folded = unicodedata.normalize('NFKD', name)
+    folded = ''.join(char for char in folded if not unicodedata.combining(char))
+    folded = re.sub(r'[\W_]+', ' ', folded.lower())
+    return folded.strip()
+
+
+def trigrams(name: str) -> set:
+    """
+    Get the trigrams of a normalized name (padded, so short names and word starts are matched too).
+    """
+    padded = f'  {name} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """
+    In-process index of teams, players and venues for answering name searches without API calls.
+
+    Names and alternate names are accent-folded and matched exactly, by prefix and finally by trigram
+    similarity. Records can be added incrementally as they are scraped or saved.
+    """
+
+    # entity type -> (ID field, name field, alternate name fields, API response key)
+    ENTITY_FIELDS = {
+        'teams': ('idTeam', 'strTeam', ('strTeamAlternate', 'strTeamShort'), 'teams'),
+        'players': ('idPlayer', 'strPlayer', ('strPlayerAlternate',), 'player'),
+        'venues': ('idVenue', 'strVenue', ('strVenueAlternate',), 'venues'),
+    }
+
+    def __init__(self, min_similarity: float = 0.5):
+        """
+        Initialize an empty index.
+
+        :param min_similarity: Minimum trigram (Jaccard) similarity for fuzzy matches
+        """
+        self.min_similarity = min_similarity
+        self._lock = threading.Lock()
+        self._records = {entity_type: {} for entity_type in self.ENTITY_FIELDS}
+        self._names = {entity_type: {} for entity_type in self.ENTITY_FIELDS}
+        self._exact = {entity_type: {} for entity_type in self.ENTITY_FIELDS}
+        self._sorted_names = {entity_type: [] for entity_type in self.ENTITY_FIELDS}
+        self._trigrams = {entity_type: {} for entity_type in self.ENTITY_FIELDS}
+
+    def add(self, entity_type: str, record: Dict[str, Any]) -> None:
+        """
+        Add or update a record.
+
+        :param entity_type: 'teams', 'players' or 'venues'
+        :param record: Record as returned by the API (e.g. with 'idTeam', 'strTeam', 'strTeamAlternate')
+        """
+        id_field, name_field, alternate_fields, _ = self.ENTITY_FIELDS[entity_type]
+        record_id = record.get(id_field)
+        if not record_id or not record.get(name_field):
+            return
+        record_id = str(record_id)
+
+        names = {normalize_name(record[name_field])}
+        for field in alternate_fields:
+            if record.get(field):
+                names.update(normalize_name(name) for name in str(record[field]).split(','))
+        names.discard('')
+
+        with self._lock:
+            self._remove(entity_type, record_id)
+            self._records[entity_type][record_id] = record
+            self._names[entity_type][record_id] = names
+            for name in names:
+                self._exact[entity_type].setdefault(name, set()).add(record_id)
+                bisect.insort(self._sorted_names[entity_type], (name, record_id))
+                for trigram in trigrams(name):
+                    self._trigrams[entity_type].setdefault(trigram, set()).add(record_id)
+
+    def add_many(self, entity_type: str, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add or update several records.
+
+        :param entity_type: 'teams', 'players' or 'venues'
+        :param records: Records as returned by the API
+        """
+        for record in records or []:
+            self.add(entity_type, record)
+
+    def search(self, entity_type: str, query: str, limit: int = 10, exact: bool = False) -> List[Dict[str, Any]]:
+        """
+        Search records by name or alternate name.
+        Exact matches win over prefix matches, which win over fuzzy (trigram) matches.
+
+        :param entity_type: 'teams', 'players' or 'venues'
+        :param query: Name to search for, e.g. 'Barcelona' or 'Danny_Welbeck'
+        :param limit: Maximum number of records returned
+        :param exact: Whether to return exact (accent-folded) name matches only
+        :return: Matching records, best first (empty list on a miss)
+        """
+        name = normalize_name(query)
+        if not name:
+            return []
+
+        with self._lock:
+            record_ids = sorted(self._exact[entity_type].get(name, ()))
+            if not record_ids and not exact:
+                record_ids = self._prefix_matches(entity_type, name)
+            if not record_ids and not exact:
+                record_ids = self._fuzzy_matches(entity_type, name)
+            return [self._records[entity_type][record_id] for record_id in record_ids[:limit]]
+
+    def build_from_storage(self, storage: Any) -> None:
+        """
+        Add all teams, players and venues held by a storage.
+
+        :param storage: FileStorage (saved API payloads) or DatabaseStorage (saved rows)
+        """
+        for entity_type, (_, _, _, response_key) in self.ENTITY_FIELDS.items():
+            if hasattr(storage, 'query'):
+                for entry in storage.query(data_type=entity_type):
+                    data = storage.load(entity_type, entry['league_id'], entry['season'], entry['round_num'])
+                    if isinstance(data, dict):
+                        self.add_many(entity_type, data.get(response_key))
+            elif hasattr(storage, f'{entity_type}_dao'):
+                self.add_many(entity_type, getattr(storage, f'{entity_type}_dao').get_all())
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._records.values())
+
+    def _remove(self, entity_type: str, record_id: str) -> None:
+        for name in self._names[entity_type].pop(record_id, ()):
+            self._exact[entity_type][name].discard(record_id)
+            sorted_names = self._sorted_names[entity_type]
+            sorted_names.pop(bisect.bisect_left(sorted_names, (name, record_id)))
+            for trigram in trigrams(name):
+                self._trigrams[entity_type][trigram].discard(record_id)
+
+    def _prefix_matches(self, entity_type: str, name: str) -> List[str]:
+        sorted_names = self._sorted_names[entity_type]
+        record_ids = []
+        position = bisect.bisect_left(sorted_names, (name, ''))
+        while position < len(sorted_names) and sorted_names[position][0].startswith(name):
+            record_id = sorted_names[position][1]
+            if record_id not in record_ids:
+                record_ids.append(record_id)
+            position += 1
+        return record_ids
+
+    def _fuzzy_matches(self, entity_type: str, name: str) -> List[str]:
+        query_trigrams = trigrams(name)
+        candidates = set()
+        for trigram in query_trigrams:
+            candidates.update(self._trigrams[entity_type].get(trigram, ()))
+
+        scores = {}
+        for record_id in candidates:
+            best = 0.0
+            for indexed_name in self._names[entity_type][record_id]:
+                name_trigrams = trigrams(indexed_name)
+                best = max(best, len(query_trigrams & name_trigrams) / len(query_trigrams | name_trigrams))
+            if best >= self.min_similarity:
+                scores[record_id] = best
+        return sorted(scores, key=lambda record_id: (-scores[record_id], record_id))
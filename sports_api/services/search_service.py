@@ -1,7 +1,14 @@
 from typing import Dict, Any
 
+from sports_api.config import Config
+from sports_api.metrics import MetricsRegistry
 from sports_api.services.base_service import BaseService
 from sports_api.services.decorators import premium_required
+from sports_api.services.hooks import HookRegistry
+from sports_api.services.quota import QuotaTracker
+from sports_api.services.rate_limiter import RateLimiter
+from sports_api.services.replay import ReplayTransport
+from sports_api.services.search_index import SearchIndex
 
 
 class SearchService(BaseService):
@@ -10,9 +17,42 @@ class SearchService(BaseService):
     This is an internal class not meant to be used directly by users.
     """
 
+    def __init__(self, config: Config, raw: bool = False, rate_limiter: RateLimiter = None,
+                 search_index: SearchIndex = None, metrics: MetricsRegistry = None, hooks: HookRegistry = None,
+                 quota: QuotaTracker = None, transport: ReplayTransport = None):
+        """
+        Initialize the search service.
+
+        :param config: Config object with API credentials
+        :param raw: Whether to return undecoded response bodies
+        :param rate_limiter: Optional RateLimiter shared with other services
+        :param search_index: Optional local SearchIndex answering team/player/venue searches before the API
+        :param metrics: Optional MetricsRegistry (defaults to the shared REGISTRY)
+        :param hooks: Optional HookRegistry whose callbacks run around every request
+        :param quota: Optional QuotaTracker counting the requests made with the API key
+        :param transport: Optional ReplayTransport that serves responses from disk and/or records live ones
+        """
+        super().__init__(config, raw, rate_limiter, metrics, hooks, quota, transport)
+        self.search_index = search_index
+
+    def _search_with_index(self, entity_type: str, name: str, endpoint: str) -> Dict[str, Any]:
+        """
+        Answer a search from the local index if it has an exact name match; otherwise call the API and index its
+        results (prefix and fuzzy matches of a partly filled index could miss records the API has).
+        """
+        if self.search_index is not None:
+            records = self.search_index.search(entity_type, name, exact=True)
+            if records:
+                return {SearchIndex.ENTITY_FIELDS[entity_type][3]: records}
+
+        data = self._make_request(endpoint)
+        if self.search_index is not None and data:
+            self.search_index.add_many(entity_type, data.get(SearchIndex.ENTITY_FIELDS[entity_type][3]))
+        return data
+
     def search_team_by_name(self, name: str) -> Dict[str, Any]:
         endpoint = f'searchteams.php?t={name}'
-        return self._make_request(endpoint)
+        return self._search_with_index('teams', name, endpoint)
 
     def search_team_by_shortcode(self, shortcode: str) -> Dict[str, Any]:
         endpoint = f'searchteams.php?t={shortcode}'
@@ -20,7 +60,7 @@ class SearchService(BaseService):
 
     def search_player_by_name(self, name: str) -> Dict[str, Any]:
         endpoint = f'searchplayers.php?p={name}'
-        return self._make_request(endpoint)
+        return self._search_with_index('players', name, endpoint)
 
     def search_event_by_name(self, event_name: str) -> Dict[str, Any]:
         endpoint = f'searchevents.php?e={event_name}'
@@ -32,7 +72,7 @@ class SearchService(BaseService):
 
     def search_venue_by_name(self, name: str) -> Dict[str, Any]:
         endpoint = f'searchvenues.php?t={name}'
-        return self._make_request(endpoint)
+        return self._search_with_index('venues', name, endpoint)
 
     @premium_required
     def search_all_players_from_team(self, team: str) -> Dict[str, Any]:
@@ -0,0 +1,64 @@
+import hashlib
+import json
+from typing import Any, Optional
+
+from sports_api.services.raw_response import RawResponse
+from sports_api.utils.file_utils import load_json_file, write_json_atomic
+
+
+def compute_content_hash(data: Any) -> str:
+    """
+    Compute a stable hash of the data to be saved.
+    Parsed data is hashed in canonical form (sorted keys, compact separators), so the hash does not depend
+    on formatting; raw responses are hashed as received.
+
+    :param data: Data to be hashed
+    :return: SHA-256 hex digest
+    """
+    if isinstance(data, RawResponse):
+        content = data.content
+    else:
+        content = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+
+def make_content_key(data_type: str, league_id: int = None, season: str = None, round_num: int = None,
+                     **kwargs) -> str:
+    """
+    Build the key identifying a saved dataset, e.g. 'rounds|4335|2024-2025|3'.
+    Round ranges and explicit output locations are part of the key, since they select different files.
+
+    :param data_type: Type of data
+    :param league_id: Optional league ID
+    :param season: Optional season string
+    :param round_num: Optional round number
+    :param kwargs: Other save parameters
+    :return: Content key
+    """
+    parts = ['' if part is None else str(part) for part in (data_type, league_id, season, round_num)]
+    for field in ('start_round', 'end_round', 'output_path', 'output_file'):
+        if kwargs.get(field) is not None:
+            parts.append(f'{field}={kwargs[field]}')
+    return '|'.join(parts)
+
+
+class ContentHashRegistry:
+    """
+    File-backed registry of the last saved content hash per dataset key.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the registry, loading previously recorded hashes.
+
+        :param file_path: Path of the JSON file holding the hashes
+        """
+        self.file_path = file_path
+        self.hashes = load_json_file(file_path, default={})
+
+    def get_hash(self, key: str) -> Optional[str]:
+        return self.hashes.get(key)
+
+    def save_hash(self, key: str, content_hash: str) -> None:
+        self.hashes[key] = content_hash
+        write_json_atomic(self.hashes, self.file_path)
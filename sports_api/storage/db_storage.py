@@ -1,14 +1,19 @@
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, Iterable
 
 from sports_api.config import Config
+from sports_api.metrics import MetricsRegistry, REGISTRY
+from sports_api.storage.decorators import skip_unchanged, timed_save
 from sports_api.storage.storage_interface import StorageInterface
 from sports_api.database.db_manager import DatabaseManager
+from sports_api.database.dao.content_hashes_dao import ContentHashesDAO
 from sports_api.database.dao.countries_dao import CountriesDAO
 from sports_api.database.dao.leagues_dao import LeaguesDAO
 from sports_api.database.dao.teams_dao import TeamsDAO
 from sports_api.database.dao.matches_dao import MatchesDAO
 from sports_api.database.dao.venues_dao import VenuesDAO
 from sports_api.database.dao.players_dao import PlayersDAO
+from sports_api.services.search_index import SearchIndex
 
 
 class DatabaseStorage(StorageInterface):
@@ -17,17 +22,43 @@ class DatabaseStorage(StorageInterface):
     Simple interface that delegates to appropriate DAOs.
     """
 
-    def __init__(self, config: Config):
+    # data_type -> (table, {save parameter: column}) used to check that a dataset is still stored
+    SAVED_TABLES = {
+        'countries': ('countries', {}),
+        'leagues': ('leagues', {}),
+        'teams': ('teams', {'league_id': 'league_id'}),
+        'rounds': ('matches', {'league_id': 'league_id', 'season': 'season', 'round_num': 'round_number'}),
+        'matches': ('matches', {'league_id': 'league_id', 'season': 'season', 'round_num': 'round_number'}),
+        'season_matches': ('matches', {'league_id': 'league_id', 'season': 'season'}),
+        'venues': ('venues', {}),
+        'players': ('players', {}),
+    }
+
+    def __init__(self, config: Config, skip_unchanged_writes: bool = True, search_index: SearchIndex = None,
+                 metrics: MetricsRegistry = None):
+        """
+        Initialize the database storage.
+
+        :param config: Config object
+        :param skip_unchanged_writes: Whether to skip saving datasets whose content did not change
+        :param search_index: Optional SearchIndex updated with every newly saved team, player and venue
+        :param metrics: MetricsRegistry that records save durations per data type (defaults to the shared REGISTRY)
+        """
         self.config = config
         self.db_manager = DatabaseManager(config)
+        self.skip_counts = {}
+        # Whether every record of the last save was written (content hashes are only recorded for complete saves)
+        self.last_save_complete = True
+        self.metrics = metrics if metrics is not None else REGISTRY
 
         # Initialize DAOs
         self.countries_dao = CountriesDAO(self.db_manager)
         self.leagues_dao = LeaguesDAO(self.db_manager)
         self.matches_dao = MatchesDAO(self.db_manager)
-        self.players_dao = PlayersDAO(self.db_manager)
-        self.teams_dao = TeamsDAO(self.db_manager)
-        self.venues_dao = VenuesDAO(self.db_manager)
+        self.players_dao = PlayersDAO(self.db_manager, search_index)
+        self.teams_dao = TeamsDAO(self.db_manager, search_index)
+        self.venues_dao = VenuesDAO(self.db_manager, search_index)
+        self.content_hashes = ContentHashesDAO(self.db_manager) if skip_unchanged_writes else None
 
     def close(self):
         """
@@ -35,32 +66,62 @@ class DatabaseStorage(StorageInterface):
         """
         self.db_manager.close()
 
+    @timed_save
+    @skip_unchanged
     def save(self, data: Any, data_type: str = None, **kwargs) -> str:
         """
         Save data using the appropriate DAO based on data_type.
         """
+        self.last_save_complete = True
         if not data:
             return "No data to save"
 
         if data_type == "countries":
-            count = self.countries_dao.save_countries(data.get('countries', []))
-            return f"Saved {count} countries"
+            dao, name = self.countries_dao, 'countries'
+            count = dao.save_countries(data.get('countries', []))
         elif data_type == "leagues":
-            count = self.leagues_dao.save_leagues(data.get('all', []))
-            return f"Saved {count} leagues"
+            dao, name = self.leagues_dao, 'leagues'
+            count = dao.save_leagues(data.get('leagues') or data.get('all') or [])
         elif data_type == "teams":
-            count = self.teams_dao.save_teams(data.get('teams', []))
-            return f"Saved {count} teams"
+            dao, name = self.teams_dao, 'teams'
+            count = dao.save_teams(data.get('teams', []))
         elif data_type == "rounds" or data_type == "matches" or data_type == "season_matches":
             # Handle both single round data and multiple matches
-            matches = data.get('events', []) if isinstance(data, dict) else data
-            count = self.matches_dao.save_matches(matches)
-            return f"Saved {count} matches"
+            matches = data.get('events', []) if isinstance(data, Mapping) else data
+            dao, name = self.matches_dao, 'matches'
+            count = dao.save_matches(matches)
         elif data_type == "venues":
-            count = self.venues_dao.save_venues(data.get('venues', []))
-            return f"Saved {count} venues"
+            dao, name = self.venues_dao, 'venues'
+            count = dao.save_venues(data.get('venues', []))
         elif data_type == "players":
-            count = self.players_dao.save_players(data.get('player', []))
-            return f"Saved {count} players"
+            dao, name = self.players_dao, 'players'
+            count = dao.save_players(data.get('player', []))
         else:
             return f"Unknown data type: {data_type}"
+
+        if dao.failed:
+            self.last_save_complete = False
+            return f"Saved {count} {name}, {dao.failed} failed"
+        return f"Saved {count} {name}"
+
+    def _is_saved(self, data_type: str, **kwargs) -> bool:
+        table, columns = self.SAVED_TABLES.get(data_type, (None, {}))
+        if table is None:
+            return False
+
+        filters = {column: kwargs[param] for param, column in columns.items() if kwargs.get(param) is not None}
+        where = ' AND '.join(f'{column} = %s' for column in filters) or 'TRUE'
+        conn = self.db_manager.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT EXISTS (SELECT 1 FROM {table} WHERE {where}) AS saved", tuple(filters.values()))
+            return cur.fetchone()['saved']
+
+    def existing_ids(self, entity_type: str, ids: Iterable[int]) -> set:
+        """
+        Get which of the given league, team or venue IDs already exist in the database.
+        """
+        dao = getattr(self, f'{entity_type}_dao', None)
+        ids = list(ids)
+        if not ids or not hasattr(dao, 'get_existing_ids'):
+            return set()
+        return dao.get_existing_ids(ids)
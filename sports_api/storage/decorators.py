@@ -0,0 +1,58 @@
+import functools
+import logging
+import time
+
+from sports_api.storage.content_hash import compute_content_hash, make_content_key
+
+logger = logging.getLogger(__name__)
+
+
+def skip_unchanged(save):
+    """
+    Skip saves whose content hash matches the last hash stored for the same dataset key.
+
+    The storage must provide a `content_hashes` registry (get_hash/save_hash, or None to disable deduplication)
+    and a `skip_counts` dictionary that is incremented per data_type for every skipped save. Storages that may write
+    only part of a payload set `last_save_complete` to False after such a save, so its hash is not recorded and the
+    payload is saved again next time.
+    """
+
+    @functools.wraps(save)
+    def wrapper(self, data, data_type=None, **kwargs):
+        registry = self.content_hashes
+        if not data or not data_type or registry is None:
+            return save(self, data, data_type, **kwargs)
+
+        key = make_content_key(data_type, **kwargs)
+        content_hash = compute_content_hash(data)
+        if registry.get_hash(key) == content_hash and self._is_saved(data_type, **kwargs):
+            self.skip_counts[data_type] = self.skip_counts.get(data_type, 0) + 1
+            logger.info('Skipped saving unchanged %s (%s).', data_type, key)
+            return f"Skipped unchanged {data_type}"
+
+        result = save(self, data, data_type, **kwargs)
+        if getattr(self, 'last_save_complete', True):
+            registry.save_hash(key, content_hash)
+        return result
+
+    return wrapper
+
+
+def timed_save(save):
+    """
+    Record the duration of every save per data_type in the storage's `metrics` registry (if it has one).
+    """
+
+    @functools.wraps(save)
+    def wrapper(self, data, data_type=None, **kwargs):
+        metrics = getattr(self, 'metrics', None)
+        if metrics is None:
+            return save(self, data, data_type, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return save(self, data, data_type, **kwargs)
+        finally:
+            metrics.record_save(data_type, time.perf_counter() - start)
+
+    return wrapper
@@ -0,0 +1,190 @@
+import json
+import mmap
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from sports_api.utils.file_utils import load_json_file, make_directory
+
+
+class EventStore:
+    """
+    Append-only store of match events for fast point lookups by idEvent.
+
+    Events are appended as JSON lines to numbered segment files. An index maps each idEvent to the
+    (segment, offset, length) of its latest record, and reads slice the record out of a memory-mapped
+    segment, so a single match can be fetched without decoding whole season files.
+    The index can always be rebuilt from the segments.
+    """
+
+    INDEX_FILE = 'index.json'
+    SEGMENT_PATTERN = 'segment_{:05d}.jsonl'
+
+    def __init__(self, directory: str, max_segment_size: int = 64 * 1024 * 1024):
+        """
+        Initialize the event store, loading (or rebuilding) its index.
+
+        :param directory: Directory holding the segment files and the index
+        :param max_segment_size: Size in bytes after which a new segment is started
+        """
+        self.directory = directory
+        self.max_segment_size = max_segment_size
+        self._lock = threading.Lock()
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._files = {}
+
+        make_directory(directory)
+        index = load_json_file(os.path.join(directory, self.INDEX_FILE))
+        if index is None:
+            self.rebuild_index()
+        else:
+            self.index = {event_id: tuple(location) for event_id, location in index.items()}
+
+    def append(self, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Append events to the store. Events identical to their latest stored record are skipped.
+
+        :param events: Event dictionaries (as returned by the API), each with an 'idEvent'
+        :return: Number of records appended
+        """
+        appended = 0
+        with self._lock:
+            segment = self._current_segment()
+            f = open(self._segment_path(segment), 'ab')
+            try:
+                if f.tell() and not self._ends_with_newline(segment):
+                    # Terminate a record left partially written by an interrupted append
+                    f.write(b'\n')
+                for event in events:
+                    event_id = event.get('idEvent')
+                    if not event_id:
+                        continue
+
+                    record = json.dumps(event, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                    if self._read_record(str(event_id)) == record:
+                        continue
+
+                    if f.tell() and f.tell() + len(record) + 1 > self.max_segment_size:
+                        f.close()
+                        segment += 1
+                        f = open(self._segment_path(segment), 'ab')
+
+                    offset = f.tell()
+                    f.write(record + b'\n')
+                    # Flush so the record is visible to memory-mapped reads straight away
+                    f.flush()
+                    self.index[str(event_id)] = (segment, offset, len(record))
+                    appended += 1
+            finally:
+                f.close()
+
+            if appended:
+                self._save_index()
+        return appended
+
+    def get(self, event_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest stored record of an event.
+
+        :param event_id: Event ID, e.g. 2076163
+        :return: Event dictionary or None if the event is not stored
+        """
+        with self._lock:
+            record = self._read_record(str(event_id))
+        return json.loads(record) if record is not None else None
+
+    def get_many(self, event_ids: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Get the stored records of several events, skipping unknown IDs.
+
+        :param event_ids: Event IDs
+        :return: List of event dictionaries
+        """
+        events = (self.get(event_id) for event_id in event_ids)
+        return [event for event in events if event is not None]
+
+    def rebuild_index(self) -> None:
+        """
+        Rebuild the index by scanning all segments in order (later records win).
+        """
+        self._close_maps()
+        self.index = {}
+        for segment in self._segments():
+            with open(self._segment_path(segment), 'rb') as f:
+                offset = 0
+                for line in f:
+                    record = line.rstrip(b'\n')
+                    try:
+                        event_id = json.loads(record).get('idEvent')
+                    except ValueError:
+                        # Partially written record at the end of a segment
+                        event_id = None
+                    if event_id:
+                        self.index[str(event_id)] = (segment, offset, len(record))
+                    offset += len(line)
+        self._save_index()
+
+    def close(self) -> None:
+        """
+        Release the memory maps of all segments.
+        """
+        with self._lock:
+            self._close_maps()
+
+    def __contains__(self, event_id: Any) -> bool:
+        return str(event_id) in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _read_record(self, event_id: str) -> Optional[bytes]:
+        location = self.index.get(event_id)
+        if location is None:
+            return None
+
+        segment, offset, length = location
+        segment_map = self._maps.get(segment)
+        if segment_map is None or offset + length > len(segment_map):
+            # Segment not mapped yet or grown since it was mapped
+            if segment_map is not None:
+                segment_map.close()
+                self._files.pop(segment).close()
+            self._files[segment] = open(self._segment_path(segment), 'rb')
+            segment_map = mmap.mmap(self._files[segment].fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = segment_map
+        return segment_map[offset:offset + length]
+
+    def _ends_with_newline(self, segment: int) -> bool:
+        with open(self._segment_path(segment), 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _segments(self) -> List[int]:
+        prefix, suffix = self.SEGMENT_PATTERN.split('{:05d}')
+        segments = []
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and name.endswith(suffix):
+                segments.append(int(name[len(prefix):-len(suffix)]))
+        return sorted(segments)
+
+    def _current_segment(self) -> int:
+        segments = self._segments()
+        return segments[-1] if segments else 0
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, self.SEGMENT_PATTERN.format(segment))
+
+    def _save_index(self) -> None:
+        index_path = os.path.join(self.directory, self.INDEX_FILE)
+        tmp_path = f'{index_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, index_path)
+
+    def _close_maps(self) -> None:
+        for segment_map in self._maps.values():
+            segment_map.close()
+        for f in self._files.values():
+            f.close()
+        self._maps.clear()
+        self._files.clear()
@@ -1,32 +1,100 @@
-from typing import Any
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Mapping
+from typing import Any, Iterable, Optional
 
+from sports_api.metrics import MetricsRegistry, REGISTRY
+from sports_api.services.raw_response import RawResponse
+from sports_api.storage.content_hash import ContentHashRegistry
+from sports_api.storage.decorators import skip_unchanged, timed_save
+from sports_api.storage.event_store import EventStore
+from sports_api.storage.manifest import Manifest
 from sports_api.storage.storage_interface import StorageInterface
-from sports_api.utils.file_utils import save_json_file
+from sports_api.utils.file_utils import save_bytes_file, encode_json
 from sports_api.config import Config
 from sports_api.utils.datascraper_utils import generate_file_path
+from sports_api.utils.league_resolver import LeagueResolver
+from sports_api.utils.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
 
 
 class FileStorage(StorageInterface):
     """
     Implementation of the StorageInterface that saves data to files.
+    Every written file is recorded in a manifest, so saved data can be read back with load/query.
     """
 
-    def __init__(self, config: Config):
+    supports_load = True
+    EVENT_DATA_TYPES = ('rounds', 'matches', 'season_matches')
+    # entity type -> (ID field, keys of the record lists in saved API responses)
+    ENTITY_ID_FIELDS = {
+        'leagues': ('idLeague', ('leagues', 'countries', 'all')),
+        'teams': ('idTeam', ('teams',)),
+        'venues': ('idVenue', ('venues',)),
+    }
+
+    def __init__(self, config: Config, cache_size: int = 128, event_store: EventStore = None,
+                 skip_unchanged_writes: bool = True, league_resolver: LeagueResolver = None,
+                 metrics: MetricsRegistry = None):
+        """
+        Initialize the file storage.
+
+        :param config: Config object
+        :param cache_size: Maximum number of decoded payloads kept in the read cache
+        :param event_store: Optional EventStore that saved match events are also appended to
+        :param skip_unchanged_writes: Whether to skip rewriting files whose content did not change
+        :param league_resolver: Optional LeagueResolver used to name league directories and files
+        :param metrics: MetricsRegistry that records save durations per data type (defaults to the shared REGISTRY)
+        """
         self.config = config
+        self.league_resolver = league_resolver
+        self.event_store = event_store
+        self.skip_unchanged_writes = skip_unchanged_writes
+        self.skip_counts = {}
+        self.metrics = metrics if metrics is not None else REGISTRY
+        self._manifest = None
+        self._content_hashes = None
+        self._cache = LRUCache(cache_size)
+
+    @property
+    def manifest(self) -> Manifest:
+        """
+        Manifest of written files (loaded lazily from the configured output path).
+        """
+        if self._manifest is None:
+            self._manifest = Manifest(self.config.get_output_settings()['output_path'])
+        return self._manifest
+
+    @property
+    def content_hashes(self) -> Optional[ContentHashRegistry]:
+        """
+        Registry of last saved content hashes (None if unchanged writes are not skipped).
+        """
+        if self.skip_unchanged_writes and self._content_hashes is None:
+            output_path = self.config.get_output_settings()['output_path']
+            self._content_hashes = ContentHashRegistry(os.path.join(output_path, 'content_hashes.json'))
+        return self._content_hashes
 
-    def save(self, data: Any, data_type: str = None, **kwargs) -> None:
+    @timed_save
+    @skip_unchanged
+    def save(self, data: Any, data_type: str = None, **kwargs) -> str:
         """
         Save data to a file.
 
         :param data: Data to be saved
         :param data_type: Type of data for naming/categorization
         :param kwargs: Additional parameters for file storage (path, filename, etc.)
+        :return: Path of the saved file
         """
         output_path = kwargs.get('output_path')
         output_file = kwargs.get('output_file')
 
         if data_type and not (output_path and output_file):
-            generated_path, generated_file = generate_file_path(self.config, data_type, **kwargs)
+            generated_path, generated_file = generate_file_path(self.config, data_type,
+                                                                  league_resolver=self.league_resolver, **kwargs)
             final_path = output_path or generated_path
             final_file = output_file or generated_file
         else:
@@ -34,4 +102,129 @@ class FileStorage(StorageInterface):
             final_path = output_path or storage_config['output_path']
             final_file = output_file or storage_config['default_file']
 
-        save_json_file(data, final_path, final_file)
+        # Raw mode: write the response body exactly as received
+        content = data.content if isinstance(data, RawResponse) else encode_json(data)
+        file_path = save_bytes_file(content, final_path, final_file)
+
+        if data_type:
+            key_fields = self._key_fields(kwargs)
+            self.manifest.record(file_path, len(content), hashlib.sha256(content).hexdigest(), data_type,
+                                 **key_fields)
+            self._cache.pop(Manifest.make_key(data_type, **key_fields))
+
+        if self.event_store is not None and data_type in self.EVENT_DATA_TYPES:
+            events = data.get('events') if isinstance(data, Mapping) else data
+            self.event_store.append(events or [])
+
+        return file_path
+
+    def get_event(self, event_id: int) -> Optional[Any]:
+        """
+        Get a single saved match from the event store without loading whole season files.
+
+        :param event_id: Event ID
+        :return: Event data or None if not stored (or no event store is configured)
+        """
+        return self.event_store.get(event_id) if self.event_store is not None else None
+
+    def load(self, data_type: str, league_id: int = None, season: str = None, round_num: int = None,
+             start_round: int = None, end_round: int = None, **kwargs) -> Optional[Any]:
+        """
+        Load previously saved data using the manifest index.
+
+        :param data_type: Type of data (e.g., 'rounds', 'league_table')
+        :param league_id: Optional league ID
+        :param season: Optional season string (e.g., '2024-2025')
+        :param round_num: Optional round number
+        :param start_round: Optional first round of a combined rounds file
+        :param end_round: Optional last round of a combined rounds file
+        :param kwargs: Other save parameters (ignored)
+        :return: Decoded data or None if it was never saved
+        """
+        key = Manifest.make_key(data_type, league_id, season, round_num, start_round, end_round)
+        if key in self._cache:
+            return self._cache.get(key)
+
+        entry = self.manifest.get(data_type, league_id, season, round_num, start_round, end_round)
+        if not entry:
+            return None
+
+        try:
+            with open(entry['path'], 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning('Error while loading %s: %s', entry['path'], e)
+            return None
+
+        self._cache.put(key, data)
+        return data
+
+    def load_entry(self, entry: dict) -> Optional[Any]:
+        """
+        Load the data of a manifest entry returned by query.
+        """
+        return self.load(entry['data_type'], entry['league_id'], entry['season'], entry['round_num'],
+                         entry.get('start_round'), entry.get('end_round'))
+
+    def load_events(self, league_id: int = None, season: str = None) -> list:
+        """
+        Load the events of every saved rounds, matches and season matches file, oldest file first, so a later
+        record of an event (e.g. its final result) comes after the ones it replaces.
+
+        :param league_id: Optional league ID
+        :param season: Optional season string
+        :return: Events in save order (an event saved in several files appears more than once)
+        """
+        entries = [entry for entry in self.query(league_id=league_id, season=season)
+                   if entry['data_type'] in self.EVENT_DATA_TYPES]
+        events = []
+        for entry in sorted(entries, key=lambda entry: entry.get('timestamp') or ''):
+            data = self.load_entry(entry)
+            events.extend((data.get('events') if isinstance(data, dict) else data) or [])
+        return events
+
+    def flush(self) -> None:
+        """
+        Merge the manifest journal into manifest.json (e.g. at the end of a job).
+        The journal is already durable, so this only keeps it short.
+        """
+        self.manifest.compact()
+
+    def query(self, data_type: str = None, league_id: int = None, season: str = None,
+              round_num: int = None) -> list[dict]:
+        """
+        Find saved files matching the given fields (fields left as None match anything).
+
+        :param data_type: Optional type of data
+        :param league_id: Optional league ID
+        :param season: Optional season string
+        :param round_num: Optional round number
+        :return: Manifest entries (path, data_type, league_id, season, round_num, start_round, end_round, size,
+                 hash, timestamp)
+        """
+        return self.manifest.query(data_type=data_type, league_id=league_id, season=season, round_num=round_num)
+
+    def existing_ids(self, entity_type: str, ids: Iterable[int]) -> set:
+        """
+        Get which of the given league, team or venue IDs appear in saved files of that data type.
+
+        :param entity_type: 'leagues', 'teams' or 'venues'
+        :param ids: Entity IDs to check
+        :return: Set of stored IDs (as ints)
+        """
+        id_field, response_keys = self.ENTITY_ID_FIELDS[entity_type]
+        stored = set()
+        for entry in self.query(data_type=entity_type):
+            data = self.load(entity_type, entry['league_id'], entry['season'], entry['round_num'])
+            for key in response_keys:
+                records = data.get(key) if isinstance(data, dict) else None
+                stored.update(int(record[id_field]) for record in records or [] if record.get(id_field))
+        return stored & {int(item_id) for item_id in ids}
+
+    def _is_saved(self, data_type: str, **kwargs) -> bool:
+        entry = self.manifest.get(data_type, **self._key_fields(kwargs))
+        return bool(entry) and os.path.exists(entry['path'])
+
+    @staticmethod
+    def _key_fields(kwargs: dict) -> dict:
+        return {field: kwargs.get(field) for field in ('league_id', 'season', 'round_num', 'start_round', 'end_round')}
@@ -0,0 +1,56 @@
+import time
+from typing import Optional
+
+from sports_api.utils.file_utils import load_json_file, write_json_atomic
+
+
+class FreshnessRegistry:
+    """
+    Tracks when each dataset was last scraped successfully and decides whether it is still fresh
+    according to a time-to-live policy per data type.
+    """
+
+    def __init__(self, file_path: str, ttl_hours: dict):
+        """
+        Initialize the registry, loading previously recorded scrape times.
+
+        :param file_path: Path of the JSON file holding the scrape times
+        :param ttl_hours: Time-to-live in hours per data type (e.g. {'countries': 720})
+        """
+        self.file_path = file_path
+        self.ttl_hours = ttl_hours
+        self.scraped_at = load_json_file(file_path, default={})
+
+    def last_scraped(self, key: str) -> Optional[float]:
+        """
+        Get the time of the last successful scrape of a dataset.
+
+        :param key: Dataset key
+        :return: Unix timestamp or None if the dataset was never scraped
+        """
+        return self.scraped_at.get(key)
+
+    def is_fresh(self, key: str, data_type: str, now: float = None) -> bool:
+        """
+        Check whether a dataset was scraped within the TTL configured for its data type.
+
+        :param key: Dataset key
+        :param data_type: Type of data
+        :param now: Optional current Unix timestamp
+        :return: True if the dataset is still fresh
+        """
+        ttl = self.ttl_hours.get(data_type)
+        last_scraped = self.scraped_at.get(key)
+        if not ttl or last_scraped is None:
+            return False
+        return (now or time.time()) - last_scraped < ttl * 3600
+
+    def mark_scraped(self, key: str, now: float = None) -> None:
+        """
+        Record a successful scrape of a dataset.
+
+        :param key: Dataset key
+        :param now: Optional current Unix timestamp
+        """
+        self.scraped_at[key] = now or time.time()
+        write_json_atomic(self.scraped_at, self.file_path)
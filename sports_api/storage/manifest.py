@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Optional
+
+from sports_api.utils.file_utils import load_json_file, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class Manifest:
+    """
+    Index of every file written by FileStorage.
+    Entries are keyed by (data_type, league_id, season, round_num, round range), so saved data can be located
+    without walking the output directory.
+
+    New entries are appended to a journal (manifest.log), which is merged into manifest.json every
+    `compact_every` records and by compact(), so recording a file does not rewrite the whole manifest.
+    """
+
+    FILE_NAME = 'manifest.json'
+    LOG_FILE_NAME = 'manifest.log'
+
+    def __init__(self, output_path: str, compact_every: int = 1000):
+        """
+        Initialize the manifest, loading existing entries from the output directory.
+
+        :param output_path: Base output directory of the file storage
+        :param compact_every: Number of journaled records after which the journal is merged into the manifest
+        """
+        self.output_path = output_path
+        self.file_path = os.path.join(output_path, self.FILE_NAME)
+        self.log_path = os.path.join(output_path, self.LOG_FILE_NAME)
+        self.compact_every = compact_every
+        self.entries = load_json_file(self.file_path, default={})
+        self._journaled = self._replay_log()
+
+    @staticmethod
+    def make_key(data_type: str, league_id: int = None, season: str = None, round_num: int = None,
+                 start_round: int = None, end_round: int = None) -> str:
+        """
+        Build the manifest key for a dataset.
+
+        :param data_type: Type of data (e.g., 'rounds', 'league_table')
+        :param league_id: Optional league ID
+        :param season: Optional season string (e.g., '2024-2025')
+        :param round_num: Optional round number
+        :param start_round: Optional first round of a combined rounds file
+        :param end_round: Optional last round of a combined rounds file
+        :return: Manifest key
+        """
+        parts = ['' if part is None else str(part) for part in (data_type, league_id, season, round_num)]
+        if start_round is not None or end_round is not None:
+            parts.append(f'{start_round}-{end_round}')
+        return '|'.join(parts)
+
+    def record(self, file_path: str, size: int, content_hash: str, data_type: str, league_id: int = None,
+               season: str = None, round_num: int = None, start_round: int = None, end_round: int = None) -> dict:
+        """
+        Record a written file in the journal.
+
+        :param file_path: Path of the written file
+        :param size: File size in bytes
+        :param content_hash: SHA-256 hash of the file content
+        :param data_type: Type of data
+        :param league_id: Optional league ID
+        :param season: Optional season string
+        :param round_num: Optional round number
+        :param start_round: Optional first round of a combined rounds file
+        :param end_round: Optional last round of a combined rounds file
+        :return: The recorded entry
+        """
+        entry = {
+            'path': file_path,
+            'data_type': data_type,
+            'league_id': league_id,
+            'season': season,
+            'round_num': round_num,
+            'start_round': start_round,
+            'end_round': end_round,
+            'size': size,
+            'hash': content_hash,
+            'timestamp': datetime.now().isoformat(),
+        }
+        self.entries[self.make_key(data_type, league_id, season, round_num, start_round, end_round)] = entry
+
+        os.makedirs(self.output_path, exist_ok=True)
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._journaled += 1
+        if self._journaled >= self.compact_every:
+            self.compact()
+        return entry
+
+    def compact(self) -> None:
+        """
+        Merge the journal into manifest.json.
+        """
+        if not self._journaled and os.path.exists(self.file_path):
+            return
+        write_json_atomic(self.entries, self.file_path)
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        self._journaled = 0
+
+    def get(self, data_type: str, league_id: int = None, season: str = None, round_num: int = None,
+            start_round: int = None, end_round: int = None) -> Optional[dict]:
+        """
+        Get the entry for a dataset.
+
+        :return: Manifest entry or None if the dataset was never written
+        """
+        return self.entries.get(self.make_key(data_type, league_id, season, round_num, start_round, end_round))
+
+    def query(self, **filters: Any) -> list[dict]:
+        """
+        Find entries matching all given field values (e.g. data_type='rounds', league_id=4335).
+        Filters set to None are ignored.
+
+        :param filters: Entry fields to match
+        :return: Matching entries ordered by round number
+        """
+        filters = {field: value for field, value in filters.items() if value is not None}
+        matches = [entry for entry in self.entries.values()
+                   if all(entry.get(field) == value for field, value in filters.items())]
+        return sorted(matches, key=lambda entry: (entry['round_num'] is not None, entry['round_num'] or 0))
+
+    def _replay_log(self) -> int:
+        """
+        Apply the journaled entries on top of manifest.json.
+
+        :return: Number of journaled entries
+        """
+        if not os.path.exists(self.log_path):
+            return 0
+
+        count = 0
+        with open(self.log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash while it was written
+                    logger.warning('Skipping invalid manifest journal line in %s.', self.log_path)
+                    continue
+                key = self.make_key(entry['data_type'], entry['league_id'], entry['season'], entry['round_num'],
+                                    entry.get('start_round'), entry.get('end_round'))
+                self.entries[key] = entry
+                count += 1
+        return count
@@ -0,0 +1,67 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from sports_api.analytics.standings import FINISHED_STATUSES
+from sports_api.utils.file_utils import load_json_file, write_json_atomic
+
+# Special round numbers used by the API for cup and playoff stages (see ApiClient.get_events_by_round)
+SPECIAL_ROUNDS = (125, 150, 160, 170, 180, 200, 500)
+
+
+def is_season_complete(events: Iterable[Dict[str, Any]]) -> bool:
+    """
+    Check whether every match of the last round of a season is finished, i.e. no more rounds can be added to it.
+
+    :param events: Events of the season (or of all its rounds)
+    :return: False for a season in progress (or without rounds)
+    """
+    last_round, statuses = None, []
+    for event in events:
+        if not event.get('intRound'):
+            continue
+        round_num = int(event['intRound'])
+        if last_round is None or round_num > last_round:
+            last_round, statuses = round_num, []
+        if round_num == last_round:
+            statuses.append(event.get('strStatus'))
+    return last_round is not None and all(status in FINISHED_STATUSES for status in statuses)
+
+
+class RoundRangeCache:
+    """
+    Persisted list of the rounds that exist for each league and season, so repeat scrapes only request
+    rounds that actually have matches. Only completed seasons are recorded (see is_season_complete), as rounds
+    can still be added to a season in progress.
+    """
+
+    def __init__(self, file_path: str = None):
+        """
+        Initialize the cache, loading previously discovered rounds.
+
+        :param file_path: Optional path of the JSON file the rounds are persisted to
+        """
+        self.file_path = file_path
+        self.rounds = load_json_file(file_path, default={}) if file_path else {}
+
+    @staticmethod
+    def make_key(league_id: int, season: str) -> str:
+        return f'{league_id}|{season}'
+
+    def get(self, league_id: int, season: str) -> Optional[List[int]]:
+        """
+        Get the discovered rounds of a league and season.
+
+        :return: Sorted round numbers or None if not discovered yet
+        """
+        return self.rounds.get(self.make_key(league_id, season))
+
+    def set(self, league_id: int, season: str, rounds: List[int]) -> None:
+        """
+        Record the rounds of a league and season.
+
+        :param league_id: League ID
+        :param season: Season (e.g. '2024-2025')
+        :param rounds: Round numbers that have matches
+        """
+        self.rounds[self.make_key(league_id, season)] = sorted(set(rounds))
+        if self.file_path:
+            write_json_atomic(self.rounds, self.file_path)
@@ -1,9 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable, Optional
 
 
 class StorageInterface(ABC):
-    """Interface for data storage implementations."""
+    """
+    Interface for data storage implementations.
+
+    Implementations that decorate save with @skip_unchanged must set `content_hashes` (registry of last saved
+    content hashes, or None to disable deduplication) and `skip_counts` (skipped saves per data_type), and should
+    implement _is_saved.
+    """
+
+    # Whether load() returns saved data (storages that cannot read their data back keep the default)
+    supports_load = False
 
     @abstractmethod
     def save(self, data: Any, data_type: str = None, **kwargs) -> str:
@@ -16,3 +25,39 @@ class StorageInterface(ABC):
         :return: Identifier or location where data was saved
         """
         pass
+
+    def load(self, data_type: str, **kwargs) -> Optional[Any]:
+        """
+        Load previously saved data. Storages that cannot read their data back return None.
+
+        :param data_type: Type of data
+        :param kwargs: Parameters identifying the dataset (league_id, season, round_num)
+        :return: Saved data or None if not available
+        """
+        return None
+
+    def existing_ids(self, entity_type: str, ids: Iterable[int]) -> set:
+        """
+        Get which of the given entity IDs are already stored. Storages that cannot tell report none.
+
+        :param entity_type: 'leagues', 'teams' or 'venues'
+        :param ids: Entity IDs to check
+        :return: Set of stored IDs (as ints)
+        """
+        return set()
+
+    def flush(self) -> None:
+        """
+        Persist buffered bookkeeping (e.g. at the end of a job). Storages without buffers do nothing.
+        """
+        pass
+
+    def _is_saved(self, data_type: str, **kwargs) -> bool:
+        """
+        Check that previously saved data is still present, so an unchanged payload can be skipped safely.
+
+        :param data_type: Type of data
+        :param kwargs: Parameters identifying the dataset
+        :return: True if the data is still stored
+        """
+        return True
@@ -1,25 +1,24 @@
 import os
 
 from sports_api.config import Config
+from sports_api.utils.league_resolver import LeagueResolver, LEGACY_LEAGUE_SLUGS
 
 
-def league_id_to_name(league_id: int) -> str:
+def league_id_to_name(league_id: int, league_resolver: LeagueResolver = None) -> str:
     """
     Map league IDs to their names for file naming purposes.
+
+    :param league_id: League ID
+    :param league_resolver: Optional LeagueResolver that knows leagues beyond the built-in ones
+    :return: League slug, e.g. 'laliga' (or 'league_<id>' for unknown leagues)
     """
-    league_mapping = {
-        4328: "premier_league",
-        4331: "bundesliga",
-        4332: "serie_a",
-        4334: "ligue_1",
-        4335: "laliga",
-        # Add more leagues as needed
-    }
-    return league_mapping.get(league_id, f"league_{league_id}")
+    if league_resolver is not None:
+        return league_resolver.slug(league_id)
+    return LEGACY_LEAGUE_SLUGS.get(league_id, f"league_{league_id}")
 
 
 def generate_file_path(config: Config, data_type: str, league_id: int = None, season: str = None, round_num: int = None,
-                       **kwargs) -> tuple[str, str]:
+                       league_resolver: LeagueResolver = None, **kwargs) -> tuple[str, str]:
     """
     Generate appropriate file path and name based on the data type and parameters.
 
@@ -28,6 +27,7 @@ def generate_file_path(config: Config, data_type: str, league_id: int = None, se
     :param league_id: Optional league ID
     :param season: Optional season string (e.g., '2024-2025')
     :param round_num: Optional round number
+    :param league_resolver: Optional LeagueResolver used to name leagues
     :param kwargs: Additional parameters for specialized naming
     :return: Tuple of (directory_path, filename)
     """
@@ -37,7 +37,7 @@ def generate_file_path(config: Config, data_type: str, league_id: int = None, se
     base_path = config.get_output_settings()['output_path']
 
     # Get league name from ID or use the ID as string
-    league_name = league_id_to_name(league_id) if league_id else ""
+    league_name = league_id_to_name(league_id, league_resolver) if league_id else ""
 
     # Format season for filenames (2024-2025 -> 2024_2025)
     formatted_season = season.replace("-", "_") if season else ""
@@ -1,7 +1,17 @@
 import json
+import logging
 import os
+import tempfile
+from contextlib import contextmanager
 from typing import Any
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
 
 def make_directory(path: str) -> bool:
     """
@@ -15,22 +25,118 @@ def make_directory(path: str) -> bool:
             os.makedirs(path)
             return True
         except OSError as e:
-            print(f'Error while making directory {path}: {e}')
+            logger.error('Error while making directory %s: %s', path, e)
             return False
     return True
 
 
-def save_json_file(data: Any, output_path: str, output_file: str) -> None:
+def save_json_file(data: Any, output_path: str, output_file: str) -> str:
     """
     Save data to JSON file.
 
     :param data: Data to be saved
     :param output_path: Path where the file will be saved
     :param output_file: Name of the output file
+    :return: Path of the saved file
     """
     make_directory(output_path)
 
     output_file_path = os.path.join(output_path, output_file)
     with open(output_file_path, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=4)
-    print(f'Data saved to: {output_file_path}')
\ No newline at end of file
+    logger.info('Data saved to: %s', output_file_path)
+    return output_file_path
+
+
+def save_bytes_file(content: bytes, output_path: str, output_file: str) -> str:
+    """
+    Save raw bytes to a file without decoding them.
+
+    :param content: Bytes to be saved
+    :param output_path: Path where the file will be saved
+    :param output_file: Name of the output file
+    :return: Path of the saved file
+    """
+    make_directory(output_path)
+
+    output_file_path = os.path.join(output_path, output_file)
+    with open(output_file_path, 'wb') as f:
+        f.write(content)
+    logger.info('Data saved to: %s', output_file_path)
+    return output_file_path
+
+
+def encode_json(data: Any) -> bytes:
+    """
+    Encode data to JSON bytes in the same format as save_json_file.
+
+    :param data: Data to be encoded
+    :return: UTF-8 encoded JSON
+    """
+    return json.dumps(data, ensure_ascii=False, indent=4).encode('utf-8')
+
+
+def load_json_file(file_path: str, default: Any = None) -> Any:
+    """
+    Load data from JSON file.
+
+    :param file_path: Path of the file to load
+    :param default: Value returned if the file does not exist or cannot be decoded
+    :return: Decoded data
+    """
+    if not os.path.exists(file_path):
+        return default
+
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning('Error while loading file %s: %s', file_path, e)
+        return default
+
+
+def write_json_atomic(data: Any, file_path: str) -> None:
+    """
+    Write data to a JSON file atomically, so readers never see a partially written file.
+    Each write goes through its own temporary file, so concurrent writers (threads or processes) do not clash.
+
+    :param data: Data to be saved
+    :param file_path: Path of the file
+    """
+    directory = os.path.dirname(file_path)
+    if directory:
+        make_directory(directory)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory or '.', prefix=f'.{os.path.basename(file_path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(encode_json(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def file_lock(file_path: str):
+    """
+    Hold an exclusive inter-process lock for a file (on a '{file_path}.lock' file next to it), e.g. around a
+    read-modify-write of a file shared by several processes. Without fcntl (Windows) no lock is taken.
+
+    :param file_path: Path of the file to lock
+    """
+    directory = os.path.dirname(file_path)
+    if directory:
+        make_directory(directory)
+
+    with open(f'{file_path}.lock', 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,143 @@
+import os
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, Optional
+
+from sports_api.utils.file_utils import load_json_file, write_json_atomic
+
+# Slugs used for file naming before leagues were resolved from API data (kept so existing paths do not move)
+LEGACY_LEAGUE_SLUGS = {
+    4328: "premier_league",
+    4331: "bundesliga",
+    4332: "serie_a",
+    4334: "ligue_1",
+    4335: "laliga",
+}
+
+
+def slugify(name: str) -> str:
+    """
+    Turn a league name into a file-name friendly slug, e.g. 'Spanish La Liga' -> 'spanish_la_liga'.
+    """
+    folded = unicodedata.normalize('NFKD', name)
+    folded = ''.join(char for char in folded if not unicodedata.combining(char))
+    return re.sub(r'[\W_]+', '_', folded.lower()).strip('_')
+
+
+class LeagueResolver:
+    """
+    Resolves league ID <-> name <-> slug in O(1) from league data already returned by the API
+    (all_leagues.php, search_all_leagues.php, and the idLeague/strLeague fields of teams and events).
+    The index is persisted, so it is available at startup without extra requests.
+    """
+
+    FILE_NAME = 'leagues_index.json'
+
+    def __init__(self, file_path: Optional[str] = None):
+        """
+        Initialize the resolver, loading the persisted index if it exists.
+
+        :param file_path: Optional path of the JSON file the index is persisted to
+        """
+        self.file_path = file_path
+        self.leagues: Dict[int, dict] = {}
+        self._ids_by_name: Dict[str, int] = {}
+
+        saved = load_json_file(file_path, default={}) if file_path else {}
+        for league_id, league in saved.items():
+            self._add(int(league_id), league['name'], league.get('alternate_names'))
+
+    @classmethod
+    def from_config(cls, config: Any) -> 'LeagueResolver':
+        """
+        Create a resolver persisted in the configured output directory.
+        """
+        return cls(os.path.join(config.get_output_settings()['output_path'], cls.FILE_NAME))
+
+    def update(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add leagues from API records with 'idLeague' and 'strLeague' fields (leagues, teams or events)
+        and persist the index if anything changed.
+
+        :param records: API records
+        :return: Number of new or renamed leagues
+        """
+        changed = 0
+        for record in records or []:
+            league_id, name = record.get('idLeague'), record.get('strLeague')
+            if not league_id or not name:
+                continue
+            known = self.leagues.get(int(league_id))
+            alternate_names = record.get('strLeagueAlternate') or (known or {}).get('alternate_names')
+            if known and known['name'] == name and known.get('alternate_names') == alternate_names:
+                continue
+            self._add(int(league_id), name, alternate_names)
+            changed += 1
+
+        if changed and self.file_path:
+            write_json_atomic({str(league_id): league for league_id, league in self.leagues.items()},
+                              self.file_path)
+        return changed
+
+    def update_from_response(self, data: Any) -> int:
+        """
+        Add leagues from an API response (e.g. all_leagues.php returns 'leagues',
+        search_all_leagues.php returns 'countries', team and event lists carry league fields too).
+
+        :param data: API response or list of records
+        :return: Number of new or renamed leagues
+        """
+        if isinstance(data, list):
+            return self.update(data)
+        if not data:
+            return 0
+        changed = 0
+        for key in ('leagues', 'countries', 'all', 'teams', 'events'):
+            records = data.get(key)
+            if isinstance(records, list):
+                changed += self.update(records)
+        return changed
+
+    def name(self, league_id: int) -> Optional[str]:
+        """
+        Get the API name of a league, e.g. 4335 -> 'Spanish La Liga'.
+
+        :return: League name or None if the league is unknown
+        """
+        league = self.leagues.get(int(league_id))
+        return league['name'] if league else None
+
+    def slug(self, league_id: int) -> str:
+        """
+        Get the slug used for file naming, e.g. 4335 -> 'laliga'.
+        Falls back to 'league_<id>' for unknown leagues.
+        """
+        league_id = int(league_id)
+        if league_id in LEGACY_LEAGUE_SLUGS:
+            return LEGACY_LEAGUE_SLUGS[league_id]
+        league = self.leagues.get(league_id)
+        return league['slug'] if league else f"league_{league_id}"
+
+    def resolve_id(self, name_or_slug: str) -> Optional[int]:
+        """
+        Get the ID of a league from its name, alternate name or slug.
+
+        :return: League ID or None if the league is unknown
+        """
+        return self._ids_by_name.get(slugify(name_or_slug))
+
+    def __contains__(self, league_id: Any) -> bool:
+        return int(league_id) in self.leagues
+
+    def __len__(self) -> int:
+        return len(self.leagues)
+
+    def _add(self, league_id: int, name: str, alternate_names: Optional[str] = None) -> None:
+        league = {'name': name, 'slug': LEGACY_LEAGUE_SLUGS.get(league_id, slugify(name))}
+        if alternate_names:
+            league['alternate_names'] = alternate_names
+        self.leagues[league_id] = league
+
+        for alias in [name, league['slug']] + (alternate_names or '').split(','):
+            if alias.strip():
+                self._ids_by_name[slugify(alias)] = league_id
@@ -0,0 +1,141 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+PACKAGE_LOGGER = 'sports_api'
+
+# Attributes every LogRecord has; anything else was passed with `extra=` and is logged as a field
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formats records as `time level logger message key=value ...` (or one JSON object per line), including
+    the fields passed with `extra=`, e.g. logger.info('Retrieved round %s', 3, extra={'league_id': 4335}).
+    """
+
+    def __init__(self, json_lines: bool = False):
+        """
+        :param json_lines: Whether to write one JSON object per record instead of text
+        """
+        super().__init__()
+        self.json_lines = json_lines
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = {key: value for key, value in vars(record).items()
+                  if key not in _RECORD_ATTRIBUTES and not key.startswith('_')}
+        message = record.getMessage()
+        if record.exc_info:
+            message = f'{message}\n{self.formatException(record.exc_info)}'
+
+        if self.json_lines:
+            return json.dumps({'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'), 'level': record.levelname,
+                               'logger': record.name, 'message': message, **fields}, default=str, ensure_ascii=False)
+
+        line = f'{self.formatTime(record, "%Y-%m-%d %H:%M:%S")} {record.levelname:<7} {record.name}: {message}'
+        if fields:
+            line += ' ' + ' '.join(f'{key}={value}' for key, value in fields.items())
+        return line
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets at most `burst` records with the same logger and message template through per `interval` seconds.
+    The next record let through after suppression carries the number of suppressed records (`suppressed=`).
+    Only records below `max_level` are limited, so errors are never dropped.
+    """
+
+    def __init__(self, burst: int = 10, interval: float = 60.0, max_level: int = logging.ERROR):
+        """
+        :param burst: Number of records per template allowed in each interval
+        :param interval: Length of the interval in seconds
+        :param max_level: Records at or above this level are never limited
+        """
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.max_level = max_level
+        self._windows: Dict[Tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.max_level:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.setdefault(key, [now, 0, 0])  # [window start, allowed, suppressed]
+            if now - window[0] >= self.interval:
+                window[0], window[1] = now, 0
+            if window[1] >= self.burst:
+                window[2] += 1
+                return False
+            window[1] += 1
+            if window[2]:
+                record.suppressed = window[2]
+                window[2] = 0
+        return True
+
+
+def configure_logging(level: str = 'INFO', json_lines: bool = False, burst: int = 10,
+                      interval: float = 60.0) -> logging.handlers.QueueListener:
+    """
+    Route the package's log records through a queue to a background thread that formats and writes them,
+    so scraping never blocks on console or file output. Repetitive messages are rate limited.
+
+    :param level: Level of the package logger ('DEBUG' shows per-row messages)
+    :param json_lines: Whether to write JSON lines instead of text
+    :param burst: Records per message template allowed per interval
+    :param interval: Rate limit interval in seconds
+    :return: Running QueueListener (stopped automatically at exit, or when logging is configured again)
+    """
+    global _listener
+    stop_logging()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(StructuredFormatter(json_lines))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(burst, interval))
+
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    for handler in [handler for handler in logger.handlers if isinstance(handler, logging.handlers.QueueHandler)]:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """
+    Stop the background listener started by configure_logging, writing the records still in the queue.
+    """
+    global _listener
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+    _listener = None
+
+
+atexit.register(stop_logging)
+
+
+def configure_logging_from_config(config: Any) -> logging.handlers.QueueListener:
+    """
+    Configure logging from the 'logging' config section (see Config.get_logging_settings).
+    """
+    settings = config.get_logging_settings()
+    return configure_logging(settings['level'], settings['format'] == 'json', settings['burst'],
+                             settings['interval'])
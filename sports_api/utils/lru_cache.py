@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+    """
+    Fixed-size cache that evicts the least recently used entry when full.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize the cache.
+
+        :param maxsize: Maximum number of entries kept in the cache
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as most recently used.
+
+        :param key: Cache key
+        :param default: Value returned on a cache miss
+        :return: Cached value or default
+        """
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Add or replace a cached value, evicting the least recently used entry if the cache is full.
+
+        :param key: Cache key
+        :param value: Value to cache
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Remove a cached value if present.
+
+        :param key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
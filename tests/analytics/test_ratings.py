@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from sports_api.analytics.ratings import EloRatings
+
+
+def event(event_id, day, home, away, home_score, away_score, league='4335', status='Match Finished'):
+    return {'idEvent': str(event_id), 'idLeague': league, 'strTimestamp': f'2024-08-{day:02d}T19:00:00',
+            'idHomeTeam': str(home), 'idAwayTeam': str(away), 'intHomeScore': home_score,
+            'intAwayScore': away_score, 'strStatus': status}
+
+
+@pytest.fixture
+def ratings_path(tmp_path):
+    return str(tmp_path / 'ratings.json')
+
+
+class TestEloRatings:
+    def test_win_moves_ratings_symmetrically(self):
+        ratings = EloRatings(home_advantage=0)
+
+        assert ratings.update([event(1, 10, 1, 2, '1', '0')]) == 1
+
+        assert ratings.rating(1) == pytest.approx(1510)
+        assert ratings.rating(2) == pytest.approx(1490)
+        assert ratings.ranking()[0] == {'idTeam': '1', 'rating': 1510.0, 'matches': 1}
+
+    def test_larger_wins_move_ratings_more(self):
+        one_goal, three_goals = EloRatings(), EloRatings()
+        one_goal.update([event(1, 10, 1, 2, '1', '0')])
+        three_goals.update([event(1, 10, 1, 2, '3', '0')])
+
+        assert three_goals.rating(1) > one_goal.rating(1)
+
+    def test_only_matches_not_applied_before_are_processed(self, ratings_path):
+        first_round = [event(1, 10, 1, 2, '2', '0'), event(2, 10, 3, 4, '1', '1')]
+        ratings = EloRatings(ratings_path)
+        assert ratings.update(first_round) == 2
+        rating = ratings.rating(1)
+
+        reloaded = EloRatings(ratings_path)
+        assert reloaded.rating(1) == rating
+        assert reloaded.update(first_round + [event(3, 17, 2, 1, '0', '0')]) == 1
+        assert reloaded.matches_played['1'] == 2
+
+    def test_unfinished_and_duplicate_events_are_skipped(self):
+        ratings = EloRatings()
+
+        applied = ratings.update([event(1, 10, 1, 2, '1', '0'), event(1, 10, 1, 2, '1', '0'),
+                                  event(2, 11, 3, 4, None, None, status='Not Started'),
+                                  event(3, 11, 3, 4, '1', '0', status='1H')])
+
+        assert applied == 1
+        assert '3' not in ratings.ratings
+
+    def test_applied_matches_are_kept_per_league(self):
+        ratings = EloRatings()
+        ratings.update([event(1, 20, 1, 2, '1', '0', league='4335')])
+
+        assert ratings.update([event(2, 10, 5, 6, '1', '0', league='4328')]) == 1
+
+    def test_rescheduled_match_does_not_hide_later_rounds(self, ratings_path):
+        ratings = EloRatings(ratings_path)
+        # Round 1 is saved with one of its matches moved to October, before round 2 (played in August) is saved
+        rescheduled = {**event(2, 10, 3, 4, '2', '2'), 'strTimestamp': '2024-10-30T19:00:00'}
+        round_1 = [event(1, 10, 1, 2, '1', '0'), rescheduled]
+        round_2 = [event(3, 17, 5, 6, '0', '1')]
+
+        assert ratings.update(round_1) == 2
+        assert EloRatings(ratings_path).update(round_2) == 1
+        assert EloRatings(ratings_path).update(round_1 + round_2) == 0
+
+    def test_only_newly_applied_matches_are_journaled(self, tmp_path, ratings_path):
+        ratings = EloRatings(ratings_path)
+        ratings.update([event(1, 10, 1, 2, '2', '0'), event(2, 10, 3, 4, '1', '1')])
+        ratings.update([event(3, 17, 2, 1, '0', '0')])
+
+        assert (tmp_path / 'ratings_applied.log').read_text().splitlines() == [
+            '{"4335": ["000000000001", "000000000002"]}', '{"4335": ["000000000003"]}']
+        assert 'applied' not in json.loads((tmp_path / EloRatings.FILE_NAME).read_text())
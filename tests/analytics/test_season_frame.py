@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from sports_api.analytics.season_frame import SeasonFrame
+
+
+def event(event_id, round_num, home, away, home_score, away_score, season='2024-2025'):
+    return {'idEvent': str(event_id), 'idLeague': '4335', 'strSeason': season, 'intRound': str(round_num),
+            'strTimestamp': f'2024-08-{10 + event_id:02d}T19:00:00+00:00', 'idHomeTeam': str(home),
+            'idAwayTeam': str(away), 'intHomeScore': home_score, 'intAwayScore': away_score}
+
+
+@pytest.fixture
+def frame():
+    return SeasonFrame.from_events([
+        event(1, 1, 1, 2, '2', '0'),
+        event(2, 1, 3, 4, '1', '1'),
+        event(3, 2, 2, 1, '1', '1'),
+        event(4, 2, 4, 3, '0', '3'),
+        event(5, 3, 1, 3, '0', '1'),
+        event(6, 3, 2, 4, None, None),
+        event(1, 1, 1, 2, '2', '0'),
+    ])
+
+
+class TestSeasonFrame:
+    def test_columns_are_typed_and_deduplicated(self, frame):
+        assert len(frame) == 6
+        assert frame.columns['home_score'].dtype == np.int16
+        assert frame.columns['timestamp'].dtype == np.dtype('datetime64[s]')
+        assert frame.finished.tolist() == [True, True, True, True, True, False]
+        assert frame.seasons == ['2024-2025']
+
+    def test_goals_per_team(self, frame):
+        goals = frame.goals_per_team()
+
+        assert goals['idTeam'].tolist() == [1, 2, 3, 4]
+        assert goals['played'].tolist() == [3, 2, 3, 2]
+        assert goals['goals_for'].tolist() == [3, 1, 5, 1]
+        assert goals['goals_against'].tolist() == [2, 3, 1, 4]
+
+    def test_home_away_splits(self, frame):
+        splits = frame.home_away_splits()
+
+        assert splits['home_played'].tolist() == [2, 1, 1, 1]
+        assert splits['home_win'].tolist() == [1, 0, 0, 0]
+        assert splits['away_win'].tolist() == [0, 0, 2, 0]
+        assert splits['away_goals_for'].tolist() == [1, 0, 4, 1]
+
+    def test_rolling_form(self, frame):
+        form = frame.rolling_form(window=2)
+
+        team_1 = form['idTeam'] == 1
+        assert form['idEvent'][team_1].tolist() == [1, 3, 5]
+        assert form['points'][team_1].tolist() == [3, 1, 0]
+        assert form['form_points'][team_1].tolist() == [3, 4, 1]
+        assert form['form_points'][form['idTeam'] == 3].tolist() == [1, 4, 6]
+
+    def test_head_to_head(self, frame):
+        assert frame.head_to_head(1, 2) == {'matches': 2, 'team_a_wins': 1, 'team_b_wins': 0, 'draws': 1,
+                                            'team_a_goals': 3, 'team_b_goals': 1}
+        assert frame.head_to_head(2, 4)['matches'] == 0
+
+    def test_filter(self, frame):
+        assert frame.filter(frame.columns['round'] <= 1).goals_per_team()['played'].tolist() == [1, 1, 1, 1]
+
+    def test_empty_frame(self):
+        frame = SeasonFrame.from_events([])
+
+        assert len(frame) == 0
+        assert frame.goals_per_team()['idTeam'].tolist() == []
+        assert frame.rolling_form()['form_points'].tolist() == []
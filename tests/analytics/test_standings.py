@@ -0,0 +1,113 @@
+import pytest
+
+from sports_api.analytics.standings import StandingsEngine
+from sports_api.storage.file_storage import FileStorage
+from sports_api.config import Config
+
+
+def event(event_id, round_num, home, away, home_score, away_score, status='Match Finished'):
+    return {'idEvent': str(event_id), 'intRound': str(round_num), 'strTimestamp': f'2024-08-{10 + round_num}T19:00:00',
+            'idHomeTeam': str(home), 'strHomeTeam': f'Team {home}', 'idAwayTeam': str(away),
+            'strAwayTeam': f'Team {away}', 'intHomeScore': home_score, 'intAwayScore': away_score, 'strStatus': status}
+
+
+@pytest.fixture
+def matches():
+    return [
+        event(1, 1, 1, 2, '2', '0'),
+        event(2, 1, 3, 4, '1', '1'),
+        event(3, 2, 2, 3, '0', '3'),
+        event(4, 2, 4, 1, '1', '2'),
+    ]
+
+
+class TestStandingsEngine:
+    def test_table_orders_by_points_goal_difference_and_goals(self, matches):
+        engine = StandingsEngine()
+        engine.add_matches(matches)
+
+        table = engine.table()['table']
+
+        assert [row['idTeam'] for row in table] == ['1', '3', '4', '2']
+        assert table[0] == {'idTeam': '1', 'strTeam': 'Team 1', 'intPlayed': 2, 'intWin': 2, 'intDraw': 0,
+                            'intLoss': 0, 'intGoalsFor': 4, 'intGoalsAgainst': 1, 'intGoalDifference': 3,
+                            'intPoints': 6, 'strForm': 'WW', 'intRank': 1}
+        assert table[1]['strForm'] == 'WD'
+
+    def test_table_for_a_past_round(self, matches):
+        engine = StandingsEngine()
+        engine.add_matches(matches)
+        engine.table()
+
+        table = engine.table(round_num=1)['table']
+
+        assert [row['intPlayed'] for row in table] == [1, 1, 1, 1]
+        assert table[0]['idTeam'] == '1'
+
+    def test_unfinished_and_duplicate_matches_are_ignored(self, matches):
+        engine = StandingsEngine()
+
+        assert engine.add_matches(matches) == 4
+        assert engine.add_matches(matches + [event(5, 3, 1, 3, None, None, 'Not Started'),
+                                             event(6, 3, 2, 4, '1', '0', '2H')]) == 0
+        assert engine.table()['table'][0]['intPlayed'] == 2
+
+    def test_corrected_result_invalidates_later_snapshots(self, matches):
+        engine = StandingsEngine()
+        engine.add_matches(matches)
+        assert engine.table()['table'][0]['idTeam'] == '1'
+
+        engine.add_matches([event(1, 1, 1, 2, '0', '5')])
+
+        table = {row['idTeam']: row for row in engine.table()['table']}
+        assert table['1']['intPoints'] == 3
+        assert table['2']['intPoints'] == 3
+        assert table['2']['strForm'] == 'LW'
+
+    def test_round_zero_change_invalidates_later_snapshots(self, matches):
+        engine = StandingsEngine()
+        engine.add_matches(matches)
+        engine.table()
+
+        engine.add_matches([event(7, 0, 2, 1, '1', '0'), event(8, 5, 3, 4, '0', '0')])
+
+        assert {row['idTeam']: row['intPoints'] for row in engine.table(round_num=1)['table']}['2'] == 3
+
+    def test_match_no_longer_finished_is_removed(self, matches):
+        engine = StandingsEngine()
+        engine.add_matches(matches)
+        engine.table()
+
+        assert engine.add_matches([event(3, 2, 2, 3, None, None, 'Match Postponed')]) == 1
+
+        table = {row['idTeam']: row for row in engine.table()['table']}
+        assert table['3']['intPlayed'] == 1
+        assert table['2']['intPlayed'] == 1
+
+        engine.add_matches([event(4, 2, 4, 1, '1', '2', '2H')])
+        assert engine.rounds() == [1]
+
+    def test_from_file_storage(self, tmp_path, matches):
+        config = Config(api_key='test_api_key', base_url='http://test.com/api')
+        config.config_data = {'data': {'output_path': str(tmp_path)}}
+        storage = FileStorage(config)
+        storage.save(matches[:2], 'rounds', league_id=4335, season='2024-2025', round_num=1)
+        storage.save(matches[2:], 'rounds', league_id=4335, season='2024-2025', round_num=2)
+
+        engine = StandingsEngine.from_storage(storage, 4335, '2024-2025')
+
+        assert engine.rounds() == [1, 2]
+        assert engine.table()['table'][0]['intPoints'] == 6
+
+    def test_from_file_storage_uses_the_latest_saved_result(self, tmp_path):
+        config = Config(api_key='test_api_key', base_url='http://test.com/api')
+        config.config_data = {'data': {'output_path': str(tmp_path)}}
+        storage = FileStorage(config)
+        storage.save([event(1, 1, 1, 2, None, None, 'Not Started')], 'rounds', league_id=4335, season='2024-2025',
+                     round_num=1)
+        storage.save({'events': [event(1, 1, 1, 2, '2', '1')]}, 'season_matches', league_id=4335,
+                     season='2024-2025')
+
+        table = StandingsEngine.from_storage(storage, 4335, '2024-2025').table()['table']
+
+        assert [(row['idTeam'], row['intPoints']) for row in table] == [('1', 3), ('2', 0)]
@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import Mock, patch
+
+import requests
+
+from sports_api.config import Config
+from sports_api.metrics import MetricsRegistry
+from sports_api.services.base_service import BaseService
+from sports_api.services.raw_response import RawResponse
+
+
+@pytest.fixture
+def mock_config():
+    config = Mock(spec=Config)
+    config.get_credentials.return_value = ('test_api_key', 'http://test.com/api')
+    return config
+
+
+@pytest.fixture
+def mock_response():
+    response = Mock()
+    response.content = b'{"events": [{"idEvent": "1"}]}'
+    response.json.return_value = {'events': [{'idEvent': '1'}]}
+    return response
+
+
+class TestBaseService:
+    @patch('sports_api.services.base_service.requests.get')
+    def test_make_request_returns_parsed_json(self, mock_get, mock_config, mock_response):
+        mock_get.return_value = mock_response
+
+        result = BaseService(mock_config)._make_request('eventsround.php?id=4335&r=1&s=2024-2025')
+
+        mock_get.assert_called_once_with('http://test.com/api/test_api_key/eventsround.php?id=4335&r=1&s=2024-2025')
+        assert result == {'events': [{'idEvent': '1'}]}
+
+    @patch('sports_api.services.base_service.requests.get')
+    def test_make_request_raw_mode_skips_decoding(self, mock_get, mock_config, mock_response):
+        mock_get.return_value = mock_response
+
+        result = BaseService(mock_config, raw=True)._make_request('all_countries.php')
+
+        mock_response.json.assert_not_called()
+        assert isinstance(result, RawResponse)
+        assert result.content == b'{"events": [{"idEvent": "1"}]}'
+        assert result
+        assert result.get('events') == [{'idEvent': '1'}]
+
+    @patch('sports_api.services.base_service.requests.get')
+    def test_make_request_records_metrics(self, mock_get, mock_config, mock_response):
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+        metrics = MetricsRegistry()
+        service = BaseService(mock_config, metrics=metrics)
+
+        service._make_request('eventsround.php?id=4335&r=1&s=2024-2025')
+        mock_response.raise_for_status.side_effect = requests.HTTPError(response=Mock(status_code=429, content=b''))
+        with pytest.raises(requests.HTTPError):
+            service._make_request('eventsround.php?id=4335&r=2&s=2024-2025')
+
+        assert metrics.request_latency['eventsround.php'].count == 2
+        assert metrics.response_bytes['eventsround.php'] == len(mock_response.content)
+        assert metrics.responses == {('eventsround.php', '200'): 1, ('eventsround.php', '429'): 1}
+        assert metrics.errors == {('eventsround.php', 'HTTPError'): 1}
+
+    def test_raw_response_empty_body(self):
+        result = RawResponse(b'')
+
+        assert not result
+        assert result.get('events') is None
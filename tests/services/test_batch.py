@@ -0,0 +1,106 @@
+import threading
+import time
+
+from sports_api.services.batch import run_batch
+from sports_api.services.rate_limiter import BULK, INTERACTIVE, RateLimiter, current_priority, request_priority
+
+
+class TestRunBatch:
+    def test_results_are_keyed_by_unique_id(self):
+        calls = []
+
+        def lookup(player_id):
+            calls.append(player_id)
+            return {'players': [{'idPlayer': str(player_id)}]}
+
+        result = run_batch(lookup, [1, 2, 1, 3])
+
+        assert sorted(calls) == [1, 2, 3]
+        assert list(result['results']) == [1, 2, 3]
+        assert result['results'][2] == {'players': [{'idPlayer': '2'}]}
+        assert result['errors'] == {}
+
+    def test_failures_are_reported_per_id(self):
+        def lookup(venue_id):
+            if venue_id == 2:
+                raise ValueError('404 Client Error')
+            return {'venues': []}
+
+        result = run_batch(lookup, [1, 2, 3])
+
+        assert list(result['results']) == [1, 3]
+        assert result['errors'] == {2: '404 Client Error'}
+
+    def test_calls_keep_the_request_priority(self):
+        with request_priority(BULK):
+            result = run_batch(lambda item_id: current_priority(), [1, 2])
+
+        assert result['results'] == {1: BULK, 2: BULK}
+        assert current_priority() == INTERACTIVE
+
+    def test_empty_batch(self):
+        assert run_batch(lambda item_id: None, []) == {'results': {}, 'errors': {}}
+
+
+class TestRateLimiter:
+    def test_blocks_when_limit_is_reached(self):
+        rate_limiter = RateLimiter(max_requests=2, period=0.2)
+
+        start = time.monotonic()
+        for _ in range(3):
+            rate_limiter.acquire()
+
+        assert time.monotonic() - start >= 0.15
+
+    @staticmethod
+    def _acquire_in_order(rate_limiter, priorities, gap):
+        order = []
+        threads = []
+        for name, priority in priorities:
+            thread = threading.Thread(target=lambda name=name, priority=priority: (
+                rate_limiter.acquire(priority), order.append(name)))
+            thread.start()
+            threads.append(thread)
+            while rate_limiter.pending() < len(threads):
+                time.sleep(0.001)
+            time.sleep(gap)
+        for thread in threads:
+            thread.join()
+        return order
+
+    def test_interactive_requests_are_served_before_waiting_bulk_requests(self):
+        rate_limiter = RateLimiter(max_requests=1, period=0.2, aging=0)
+        rate_limiter.acquire()
+
+        order = self._acquire_in_order(rate_limiter, [('bulk 1', BULK), ('bulk 2', BULK), ('search', INTERACTIVE)], 0)
+
+        assert order == ['search', 'bulk 1', 'bulk 2']
+
+    def test_waiting_bulk_requests_age_into_interactive_priority(self):
+        rate_limiter = RateLimiter(max_requests=1, period=0.3, aging=0.05)
+        rate_limiter.acquire()
+
+        order = self._acquire_in_order(rate_limiter, [('bulk', BULK), ('search', INTERACTIVE)], 0.1)
+
+        assert order == ['bulk', 'search']
+
+    def test_priority_defaults_to_the_context(self):
+        rate_limiter = RateLimiter(max_requests=1, period=0.2, aging=0)
+        rate_limiter.acquire()
+        order = []
+
+        def scrape():
+            with request_priority(BULK):
+                rate_limiter.acquire()
+            order.append('scrape')
+
+        bulk = threading.Thread(target=scrape)
+        bulk.start()
+        while rate_limiter.pending() < 1:
+            time.sleep(0.001)
+        interactive = threading.Thread(target=lambda: (rate_limiter.acquire(), order.append('search')))
+        interactive.start()
+        bulk.join()
+        interactive.join()
+
+        assert order == ['search', 'scrape']
@@ -0,0 +1,79 @@
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from sports_api.config import Config
+from sports_api.metrics import MetricsRegistry
+from sports_api.services.base_service import BaseService
+from sports_api.services.hooks import HookRegistry
+
+
+@pytest.fixture
+def mock_config():
+    config = Mock(spec=Config)
+    config.get_credentials.return_value = ('test_api_key', 'http://test.com/api')
+    return config
+
+
+@pytest.fixture
+def mock_response():
+    response = Mock()
+    response.status_code = 200
+    response.content = b'{"events": []}'
+    response.json.return_value = {'events': []}
+    return response
+
+
+@pytest.fixture
+def hooks():
+    return HookRegistry()
+
+
+class TestHookRegistry:
+    def test_registry_is_inactive_until_a_hook_is_registered(self, hooks):
+        assert not hooks.active
+
+        callback = hooks.after_response(lambda context: None)
+        assert hooks.active
+
+        hooks.unregister('after_response', callback)
+        assert not hooks.active
+
+    def test_unknown_event_is_rejected(self, hooks):
+        with pytest.raises(ValueError):
+            hooks.register('on_retry', print)
+
+    @patch('sports_api.services.base_service.requests.get')
+    def test_hooks_see_endpoint_timings_and_size(self, mock_get, mock_config, mock_response, hooks):
+        mock_get.return_value = mock_response
+        seen = []
+
+        @hooks.before_request
+        def tag_request(context):
+            context.headers['X-Request-ID'] = 'abc'
+            context.tags['job'] = 'rounds'
+
+        hooks.after_response(seen.append)
+        BaseService(mock_config, metrics=MetricsRegistry(), hooks=hooks)._make_request('eventsround.php?id=4335&r=1')
+
+        mock_get.assert_called_once_with('http://test.com/api/test_api_key/eventsround.php?id=4335&r=1',
+                                         headers={'X-Request-ID': 'abc'})
+        context = seen[0]
+        assert (context.endpoint, context.path) == ('eventsround.php', 'eventsround.php?id=4335&r=1')
+        assert (context.status, context.size, context.retries) == (200, len(mock_response.content), 0)
+        assert context.elapsed >= 0
+        assert context.tags == {'job': 'rounds'}
+
+    @patch('sports_api.services.base_service.requests.get')
+    def test_on_error_hook_and_failing_hooks(self, mock_get, mock_config, mock_response, hooks):
+        mock_response.raise_for_status.side_effect = requests.HTTPError(response=Mock(status_code=429, content=b''))
+        mock_get.return_value = mock_response
+        errors = []
+        hooks.before_request(Mock(side_effect=RuntimeError('broken hook')))
+        hooks.on_error(errors.append)
+
+        with pytest.raises(requests.HTTPError):
+            BaseService(mock_config, metrics=MetricsRegistry(), hooks=hooks)._make_request('all_countries.php')
+
+        assert errors[0].status == 429
+        assert isinstance(errors[0].error, requests.HTTPError)
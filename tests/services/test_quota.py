@@ -0,0 +1,104 @@
+import multiprocessing
+
+import pytest
+from unittest.mock import Mock, patch
+
+from sports_api.config import Config
+from sports_api.services.base_service import BaseService
+from sports_api.services.decorators import PremiumRequiredError
+from sports_api.services.lookup_service import LookupService
+from sports_api.services.quota import QuotaTracker
+
+NOW = 1_700_000_000.0  # 22:13:20 UTC
+
+
+def record_many(file_path, count):
+    quota = QuotaTracker('3', file_path)
+    for _ in range(count):
+        quota.record(now=NOW)
+
+
+class TestQuotaTracker:
+    def test_counts_per_window(self):
+        quota = QuotaTracker('3', limits={'minute': 30, 'day': 100})
+
+        quota.record(now=NOW)
+        quota.record(2, now=NOW + 10)
+
+        assert quota.used('minute', now=NOW + 10) == 3
+        assert quota.used('minute', now=NOW + 60) == 0  # next minute
+        assert quota.used('day', now=NOW + 60) == 3
+        assert quota.remaining(now=NOW + 10) == 27
+        assert quota.remaining('day', now=NOW + 60) == 97
+        assert quota.remaining(now=NOW + 60) == 30
+        assert quota.remaining('hour', now=NOW) is None
+
+    def test_counters_are_shared_through_the_file(self, tmp_path):
+        file_path = str(tmp_path / 'quota.json')
+        QuotaTracker('3', file_path).record(now=NOW)
+        QuotaTracker('3', file_path).record(now=NOW)
+        QuotaTracker('secret-key', file_path).record(now=NOW)
+
+        assert QuotaTracker('3', file_path).used('day', now=NOW) == 2
+        assert 'secret-key' not in (tmp_path / 'quota.json').read_text()
+
+    def test_concurrent_processes_do_not_lose_counts(self, tmp_path):
+        file_path = str(tmp_path / 'quota.json')
+        processes = [multiprocessing.Process(target=record_many, args=(file_path, 100)) for _ in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+        assert QuotaTracker('3', file_path).used('day', now=NOW) == 400
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['quota.json', 'quota.json.lock']
+
+    def test_unknown_window_is_rejected(self):
+        with pytest.raises(ValueError):
+            QuotaTracker('3', limits={'week': 10})
+
+    def test_from_config(self, tmp_path):
+        config = Config(api_key='3', base_url='http://test.com/api')
+        assert QuotaTracker.from_config(config) is None
+
+        config.config_data = {'data': {'output_path': str(tmp_path)}, 'quota': {'enabled': True, 'day': 500}}
+        quota = QuotaTracker.from_config(config)
+        assert quota.file_path == str(tmp_path / 'quota.json')
+        assert quota.limits == {'day': 500}
+
+    @patch('sports_api.services.base_service.requests.get')
+    def test_requests_are_counted(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, content=b'{}', json=Mock(return_value={}))
+        quota = QuotaTracker('3')
+        service = BaseService(Config(api_key='3', base_url='http://test.com/api'), quota=quota)
+
+        service._make_request('all_leagues.php')
+
+        assert quota.used('minute') == 1
+
+
+class TestPremiumRequired:
+    @patch('sports_api.services.base_service.requests.get')
+    def test_free_key_is_refused_before_the_request(self, mock_get):
+        quota = QuotaTracker('3')
+        service = LookupService(Config(api_key='3', base_url='http://test.com/api'), quota=quota)
+
+        with pytest.raises(PremiumRequiredError):
+            service.get_team_details(133604)
+
+        mock_get.assert_not_called()
+        assert quota.used('minute') == 0
+        assert LookupService.get_team_details.is_premium
+
+    @pytest.mark.parametrize('api_key, config_data, premium', [
+        ('3', {}, False),
+        ('123', {}, False),
+        ('my-premium-key', {}, True),
+        ('my-key', {'api': {'premium': False}}, False),
+    ])
+    def test_is_premium(self, api_key, config_data, premium):
+        config = Config(api_key=api_key, base_url='http://test.com/api')
+        config.config_data = config_data
+
+        assert config.is_premium() is premium
@@ -0,0 +1,110 @@
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from sports_api.api_client import ApiClient
+from sports_api.config import Config
+from sports_api.metrics import MetricsRegistry
+from sports_api.services.base_service import BaseService
+from sports_api.services.raw_response import RawResponse
+from sports_api.services.replay import ReplayMissError, ReplayTransport
+from sports_api.storage.file_storage import FileStorage
+from sports_api.utils.league_resolver import LeagueResolver
+
+ROUND_ENDPOINT = 'eventsround.php?id=4335&r=1&s=2024-2025'
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = Config(api_key='secret-key', base_url='http://test.com/api')
+    config.config_data = {'data': {'output_path': str(tmp_path)}}
+    return config
+
+
+@pytest.fixture
+def cassette(tmp_path):
+    return str(tmp_path / 'cassette.jsonl')
+
+
+def live_response(body):
+    content = json.dumps(body).encode('utf-8')
+    return Mock(status_code=200, content=content, json=Mock(return_value=body))
+
+
+def make_service(config, transport, **kwargs):
+    return BaseService(config, metrics=MetricsRegistry(), transport=transport, **kwargs)
+
+
+class TestReplayTransport:
+    @patch('sports_api.services.base_service.requests.get')
+    def test_recorded_responses_are_replayed_without_requests(self, mock_get, config, cassette):
+        mock_get.return_value = live_response({'events': [{'idEvent': '1'}]})
+        recorded = make_service(config, ReplayTransport(cassette, mode='record'))._make_request(ROUND_ENDPOINT)
+
+        mock_get.reset_mock()
+        replayed = make_service(config, ReplayTransport(cassette))._make_request(ROUND_ENDPOINT)
+
+        assert replayed == recorded == {'events': [{'idEvent': '1'}]}
+        mock_get.assert_not_called()
+        with open(cassette, encoding='utf-8') as f:
+            assert 'secret-key' not in f.read()
+
+    @patch('sports_api.services.base_service.requests.get')
+    def test_missing_response_raises_in_replay_mode(self, mock_get, config, cassette):
+        rate_limiter = Mock()
+        service = make_service(config, ReplayTransport(cassette), rate_limiter=rate_limiter)
+
+        with pytest.raises(ReplayMissError):
+            service._make_request(ROUND_ENDPOINT)
+
+        mock_get.assert_not_called()
+        rate_limiter.acquire.assert_not_called()
+
+    @patch('sports_api.services.base_service.requests.get')
+    def test_auto_mode_records_misses_only(self, mock_get, config, cassette):
+        mock_get.return_value = live_response({'countries': [{'name_en': 'Spain'}]})
+        service = make_service(config, ReplayTransport(cassette, mode='auto'))
+
+        service._make_request('all_countries.php')
+        service._make_request('all_countries.php')
+
+        assert mock_get.call_count == 1
+
+    def test_stored_rounds_are_served_from_file_storage(self, config):
+        storage = FileStorage(config)
+        storage.save([{'idEvent': '1', 'intRound': '1'}], 'rounds', league_id=4335, season='2024-2025', round_num=1)
+        storage.save({'table': [{'intRank': '1'}]}, 'league_table', league_id=4335, season='2024-2025')
+        service = make_service(config, ReplayTransport(storage=storage), raw=True)
+
+        round_data = service._make_request(ROUND_ENDPOINT)
+        table = service._make_request('lookuptable.php?l=4335&s=2024-2025')
+
+        assert isinstance(round_data, RawResponse)
+        assert round_data['events'] == [{'idEvent': '1', 'intRound': '1'}]
+        assert table == {'table': [{'intRank': '1'}]}
+
+    def test_team_searches_are_resolved_to_stored_league_files(self, config):
+        resolver = LeagueResolver()
+        resolver.update([{'idLeague': '4335', 'strLeague': 'Spanish La Liga'}])
+        storage = FileStorage(config, league_resolver=resolver)
+        storage.save({'teams': [{'idTeam': '133739'}]}, 'teams', league_id=4335)
+        service = make_service(config, ReplayTransport(storage=storage))
+
+        assert service._make_request('search_all_teams.php?l=Spanish La Liga') == {'teams': [{'idTeam': '133739'}]}
+        with pytest.raises(ReplayMissError):
+            service._make_request('search_all_teams.php?s=Soccer&c=Spain')
+
+    def test_client_uses_the_configured_transport(self, config, cassette):
+        config.config_data['replay'] = {'mode': 'replay', 'cassette': cassette}
+        with open(cassette, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'endpoint': 'all_leagues.php', 'status': 200, 'body': '{"leagues": []}'}) + '\n')
+
+        client = ApiClient(config, metrics=MetricsRegistry())
+
+        assert client.get_all_leagues() == {'leagues': []}
+        assert ApiClient(Config(api_key='3', base_url='http://test.com/api')).transport is None
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError):
+            ReplayTransport(mode='offline')
@@ -0,0 +1,49 @@
+import pytest
+
+from sports_api.services.search_index import SearchIndex, normalize_name
+
+
+@pytest.fixture
+def search_index():
+    index = SearchIndex()
+    index.add_many('teams', [
+        {'idTeam': '133739', 'strTeam': 'Barcelona', 'strTeamAlternate': 'Barça, FC Barcelona', 'strTeamShort': 'BAR'},
+        {'idTeam': '133729', 'strTeam': 'Atlético Madrid', 'strTeamAlternate': 'Atleti'},
+        {'idTeam': '133738', 'strTeam': 'Real Madrid', 'strTeamAlternate': ''},
+    ])
+    return index
+
+
+class TestSearchIndex:
+    def test_normalize_name(self):
+        assert normalize_name('Atlético_Madrid') == 'atletico madrid'
+        assert normalize_name('  Barça ') == 'barca'
+
+    def test_exact_and_alternate_names(self, search_index):
+        assert search_index.search('teams', 'barcelona')[0]['idTeam'] == '133739'
+        assert search_index.search('teams', 'Barca')[0]['idTeam'] == '133739'
+        assert search_index.search('teams', 'bar')[0]['idTeam'] == '133739'
+
+    def test_accent_folding_and_underscores(self, search_index):
+        assert search_index.search('teams', 'Atletico_Madrid')[0]['idTeam'] == '133729'
+
+    def test_prefix_match(self, search_index):
+        assert [team['idTeam'] for team in search_index.search('teams', 'Real')] == ['133738']
+
+    def test_fuzzy_match(self, search_index):
+        assert search_index.search('teams', 'Barcelonaa')[0]['idTeam'] == '133739'
+
+    def test_exact_only(self, search_index):
+        assert search_index.search('teams', 'Atletico_Madrid', exact=True)[0]['idTeam'] == '133729'
+        assert search_index.search('teams', 'Real', exact=True) == []
+        assert search_index.search('teams', 'Barcelonaa', exact=True) == []
+
+    def test_miss(self, search_index):
+        assert search_index.search('teams', 'Arsenal') == []
+        assert search_index.search('venues', 'Camp Nou') == []
+
+    def test_update_replaces_names(self, search_index):
+        search_index.add('teams', {'idTeam': '133738', 'strTeam': 'Real Madrid CF'})
+
+        assert search_index.search('teams', 'real madrid cf')[0]['strTeam'] == 'Real Madrid CF'
+        assert len(search_index) == 3
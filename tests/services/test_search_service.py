@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import Mock, patch
 
 from sports_api.config import Config
+from sports_api.services.search_index import SearchIndex
 from sports_api.services.search_service import SearchService
 
 
@@ -80,3 +81,41 @@ class TestSearchService:
 
         mock_request.assert_called_once_with('searchplayers.php?t=Barcelona')
         assert result == {'players': [{'team': 'Barcelona'}]}
+
+    @patch.object(SearchService, '_make_request')
+    def test_search_team_by_name_uses_index(self, mock_request, mock_config):
+        search_index = SearchIndex()
+        search_service = SearchService(mock_config, search_index=search_index)
+        mock_request.return_value = {'teams': [{'idTeam': '133739', 'strTeam': 'Barcelona'}]}
+
+        first = search_service.search_team_by_name('Barcelona')
+        second = search_service.search_team_by_name('Barcelona')
+
+        mock_request.assert_called_once_with('searchteams.php?t=Barcelona')
+        assert first == second == {'teams': [{'idTeam': '133739', 'strTeam': 'Barcelona'}]}
+
+    @patch.object(SearchService, '_make_request')
+    def test_prefix_match_in_index_still_calls_api(self, mock_request, mock_config):
+        search_index = SearchIndex()
+        search_index.add('teams', {'idTeam': '133612', 'strTeam': 'Manchester United'})
+        search_service = SearchService(mock_config, search_index=search_index)
+        mock_request.return_value = {'teams': [{'idTeam': '133612', 'strTeam': 'Manchester United'},
+                                               {'idTeam': '133613', 'strTeam': 'Manchester City'}]}
+
+        result = search_service.search_team_by_name('Man')
+
+        mock_request.assert_called_once_with('searchteams.php?t=Man')
+        assert len(result['teams']) == 2
+        assert [team['strTeam'] for team in search_index.search('teams', 'Manchester City')] == ['Manchester City']
+
+    @patch.object(SearchService, '_make_request')
+    def test_search_venue_by_name_index_miss_calls_api(self, mock_request, mock_config):
+        search_index = SearchIndex()
+        search_index.add('venues', {'idVenue': '16163', 'strVenue': 'Camp Nou'})
+        search_service = SearchService(mock_config, search_index=search_index)
+        mock_request.return_value = {'venues': None}
+
+        result = search_service.search_venue_by_name('Wembley')
+
+        mock_request.assert_called_once_with('searchvenues.php?t=Wembley')
+        assert result == {'venues': None}
@@ -0,0 +1,130 @@
+from unittest.mock import MagicMock, patch
+
+import psycopg
+import pytest
+
+from sports_api.config import Config
+from sports_api.storage.db_storage import DatabaseStorage
+
+
+class FakeConnection:
+    """
+    Connection whose cursors run statements through a handler(sql, params) returning the fetched row.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.statements = []
+        self.closed = False
+        self.rollback = MagicMock()
+        self.commit = MagicMock()
+
+    def cursor(self):
+        connection = self
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+
+        def execute(sql, params=()):
+            connection.statements.append(' '.join(sql.split()))
+            cursor.row = connection.handler(' '.join(sql.split()), params)
+
+        cursor.execute.side_effect = execute
+        cursor.fetchone.side_effect = lambda: cursor.row
+        return cursor
+
+
+@pytest.fixture
+def make_storage():
+    def make(handler):
+        connection = FakeConnection(handler)
+        with patch('sports_api.storage.db_storage.DatabaseManager') as manager:
+            manager.return_value.get_connection.return_value = connection
+            storage = DatabaseStorage(Config(api_key='test_api_key', base_url='http://test.com/api'))
+        return storage, connection
+
+    return make
+
+
+def test_missing_content_hashes_table_disables_deduplication(make_storage):
+    def handler(sql, params):
+        if sql.startswith('CREATE TABLE'):
+            raise psycopg.errors.InsufficientPrivilege('permission denied for schema public')
+        return None
+
+    storage, connection = make_storage(handler)
+    data = {'countries': [{'name_en': 'Spain'}]}
+
+    assert storage.save(data, 'countries') == 'Saved 1 countries'
+    assert storage.save(data, 'countries') == 'Saved 1 countries'
+    assert not any('content_hashes' in sql for sql in connection.statements if not sql.startswith('CREATE'))
+    assert storage.skip_counts == {}
+
+
+def test_hash_is_not_recorded_when_rows_fail(make_storage):
+    hashes = {}
+
+    def handler(sql, params):
+        if sql.startswith('INSERT INTO matches') and params[0] == '2':
+            raise psycopg.errors.ForeignKeyViolation('unknown team')
+        if sql.startswith('INSERT INTO content_hashes'):
+            hashes[params[0]] = params[1]
+        if sql.startswith('SELECT hash FROM content_hashes'):
+            return {'hash': hashes[params[0]]} if params[0] in hashes else None
+        if sql.startswith('SELECT EXISTS'):
+            return {'saved': True}
+        return None
+
+    storage, connection = make_storage(handler)
+    events = [{'idEvent': '1'}, {'idEvent': '2'}]
+
+    assert storage.save(events, 'rounds', league_id=4328, season='2024-2025', round_num=1) == \
+        'Saved 1 matches, 1 failed'
+    assert hashes == {}
+    assert storage.save(events, 'rounds', league_id=4328, season='2024-2025', round_num=1) == \
+        'Saved 1 matches, 1 failed'
+    assert storage.skip_counts == {}
+
+
+def test_unchanged_saves_are_skipped_only_while_rows_exist(make_storage):
+    hashes = {}
+    stored = {'saved': True}
+
+    def handler(sql, params):
+        if sql.startswith('INSERT INTO content_hashes'):
+            hashes[params[0]] = params[1]
+        if sql.startswith('SELECT hash FROM content_hashes'):
+            return {'hash': hashes[params[0]]} if params[0] in hashes else None
+        if sql.startswith('SELECT EXISTS'):
+            return stored
+        return None
+
+    storage, connection = make_storage(handler)
+    events = [{'idEvent': '1'}]
+
+    storage.save(events, 'rounds', league_id=4328, season='2024-2025', round_num=1)
+    assert storage.save(events, 'rounds', league_id=4328, season='2024-2025', round_num=1) == \
+        'Skipped unchanged rounds'
+    assert 'SELECT EXISTS (SELECT 1 FROM matches WHERE league_id = %s AND season = %s AND round_number = %s) ' \
+           'AS saved' in connection.statements
+
+    stored['saved'] = False
+    assert storage.save(events, 'rounds', league_id=4328, season='2024-2025', round_num=1) == 'Saved 1 matches'
+
+
+def test_stored_matches_get_live_scores(make_storage):
+    rows = {}
+
+    def handler(sql, params):
+        if sql.startswith('SELECT id FROM matches'):
+            return {'id': params[0]} if params[0] in rows else None
+        if sql.startswith('INSERT INTO matches') and (params[0] not in rows or 'ON CONFLICT (id) DO UPDATE' in sql):
+            rows[params[0]] = {'home_score': params[6], 'away_score': params[7], 'status': params[9]}
+        return None
+
+    storage, connection = make_storage(handler)
+    storage.save([{'idEvent': '1', 'strStatus': 'Not Started'}], 'rounds', league_id=4328, season='2024-2025',
+                 round_num=1)
+    storage.save([{'idEvent': '1', 'intHomeScore': '2', 'intAwayScore': '1', 'strStatus': 'Match Finished'}],
+                 'rounds', league_id=4328, season='2024-2025', round_num=1)
+
+    assert rows == {'1': {'home_score': '2', 'away_score': '1', 'status': 'Match Finished'}}
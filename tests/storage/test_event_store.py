@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from sports_api.storage.event_store import EventStore
+
+
+@pytest.fixture
+def event_store(tmp_path):
+    store = EventStore(str(tmp_path / 'events'))
+    yield store
+    store.close()
+
+
+class TestEventStore:
+    def test_append_and_get(self, event_store):
+        appended = event_store.append([
+            {'idEvent': '1', 'strEvent': 'Barcelona vs Girona'},
+            {'idEvent': '2', 'strEvent': 'Real Madrid vs Sevilla'},
+        ])
+
+        assert appended == 2
+        assert event_store.get(2) == {'idEvent': '2', 'strEvent': 'Real Madrid vs Sevilla'}
+        assert event_store.get(3) is None
+        assert 1 in event_store
+
+    def test_latest_record_wins_and_identical_records_are_skipped(self, event_store):
+        event_store.append([{'idEvent': '1', 'intHomeScore': None}])
+
+        assert event_store.append([{'idEvent': '1', 'intHomeScore': None}]) == 0
+        assert event_store.append([{'idEvent': '1', 'intHomeScore': '2'}]) == 1
+        assert event_store.get('1') == {'idEvent': '1', 'intHomeScore': '2'}
+
+    def test_rolls_over_segments(self, tmp_path):
+        store = EventStore(str(tmp_path / 'events'), max_segment_size=64)
+        store.append([{'idEvent': str(i), 'strEvent': 'Barcelona vs Girona'} for i in range(5)])
+
+        assert len(os.listdir(tmp_path / 'events')) > 2
+        assert store.get('4') == {'idEvent': '4', 'strEvent': 'Barcelona vs Girona'}
+        store.close()
+
+    def test_index_is_rebuilt_from_segments(self, tmp_path, event_store):
+        event_store.append([{'idEvent': '1'}, {'idEvent': '2'}])
+        event_store.append([{'idEvent': '1', 'strStatus': 'Match Finished'}])
+        event_store.close()
+        os.remove(tmp_path / 'events' / EventStore.INDEX_FILE)
+
+        reopened = EventStore(str(tmp_path / 'events'))
+
+        assert len(reopened) == 2
+        assert reopened.get('1') == {'idEvent': '1', 'strStatus': 'Match Finished'}
+        reopened.close()
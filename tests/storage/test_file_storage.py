@@ -0,0 +1,138 @@
+import json
+import os
+
+import pytest
+from unittest.mock import Mock
+
+from sports_api.config import Config
+from sports_api.services.raw_response import RawResponse
+from sports_api.storage.event_store import EventStore
+from sports_api.storage.file_storage import FileStorage
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    config = Mock(spec=Config)
+    config.get_output_settings.return_value = {'output_path': str(tmp_path), 'default_file': 'data.json'}
+    return config
+
+
+@pytest.fixture
+def file_storage(mock_config):
+    return FileStorage(mock_config)
+
+
+class TestFileStorage:
+    def test_save_writes_raw_response_bytes(self, file_storage):
+        content = b'{"table":[{"strTeam":"Barcelona"}]}'
+
+        file_path = file_storage.save(RawResponse(content), 'league_table', league_id=4335, season='2024-2025')
+
+        with open(file_path, 'rb') as f:
+            assert f.read() == content
+
+    def test_save_records_manifest_entry(self, file_storage, tmp_path):
+        file_path = file_storage.save([{'idEvent': '1'}], 'rounds', league_id=4335, season='2024-2025', round_num=1)
+
+        entry = file_storage.manifest.get('rounds', 4335, '2024-2025', 1)
+        assert entry['path'] == file_path
+        assert entry['size'] == os.path.getsize(file_path)
+        assert len(entry['hash']) == 64
+        assert os.path.exists(os.path.join(tmp_path, 'manifest.log'))
+
+        file_storage.flush()
+        assert os.path.exists(os.path.join(tmp_path, 'manifest.json'))
+        assert not os.path.exists(os.path.join(tmp_path, 'manifest.log'))
+
+    def test_manifest_is_journaled_and_compacted(self, mock_config, tmp_path):
+        file_storage = FileStorage(mock_config)
+        file_storage.manifest.compact_every = 3
+        for round_num in (1, 2):
+            file_storage.save([{'idEvent': str(round_num)}], 'rounds', league_id=4335, season='2024-2025',
+                              round_num=round_num)
+        assert not os.path.exists(os.path.join(tmp_path, 'manifest.json'))
+        with open(os.path.join(tmp_path, 'manifest.log'), 'a', encoding='utf-8') as f:
+            f.write('{"path": "cut short')  # crash while a line was written
+
+        reopened = FileStorage(mock_config)
+        assert reopened.load('rounds', 4335, '2024-2025', 2) == [{'idEvent': '2'}]
+
+        reopened.manifest.compact_every = 3
+        reopened.save([{'idEvent': '3'}], 'rounds', league_id=4335, season='2024-2025', round_num=3)
+        assert os.path.exists(os.path.join(tmp_path, 'manifest.json'))
+        assert len(FileStorage(mock_config).query('rounds')) == 3
+
+    def test_round_ranges_are_kept_apart(self, file_storage, mock_config):
+        file_storage.save([{'idEvent': '1'}], 'rounds', league_id=4335, season='2024-2025', start_round=1,
+                          end_round=19)
+        file_storage.save([{'idEvent': '2'}], 'rounds', league_id=4335, season='2024-2025', start_round=20,
+                          end_round=38)
+
+        reopened = FileStorage(mock_config)
+        assert reopened.load('rounds', 4335, '2024-2025', start_round=1, end_round=19) == [{'idEvent': '1'}]
+        assert [reopened.load_entry(entry) for entry in reopened.query('rounds')] == [[{'idEvent': '1'}],
+                                                                                     [{'idEvent': '2'}]]
+
+    def test_load_returns_saved_data(self, file_storage, mock_config):
+        file_storage.save([{'idEvent': '1'}], 'rounds', league_id=4335, season='2024-2025', round_num=1)
+
+        reopened = FileStorage(mock_config)
+
+        assert reopened.load('rounds', 4335, '2024-2025', 1) == [{'idEvent': '1'}]
+        assert reopened.load('rounds', 4335, '2024-2025', 2) is None
+
+    def test_load_is_served_from_cache_and_invalidated_on_save(self, file_storage):
+        file_path = file_storage.save({'countries': []}, 'countries')
+        assert file_storage.load('countries') == {'countries': []}
+
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({'countries': ['modified outside storage']}, f)
+        assert file_storage.load('countries') == {'countries': []}
+
+        file_storage.save({'countries': [{'name_en': 'Spain'}]}, 'countries')
+        assert file_storage.load('countries') == {'countries': [{'name_en': 'Spain'}]}
+
+    def test_query_filters_entries(self, file_storage):
+        for round_num in (2, 1):
+            file_storage.save([], 'rounds', league_id=4335, season='2024-2025', round_num=round_num)
+        file_storage.save([], 'rounds', league_id=4328, season='2024-2025', round_num=1)
+
+        entries = file_storage.query('rounds', league_id=4335, season='2024-2025')
+
+        assert [entry['round_num'] for entry in entries] == [1, 2]
+
+    def test_unchanged_data_is_not_rewritten(self, file_storage):
+        file_path = file_storage.save([{'idEvent': '1'}], 'rounds', league_id=4335, season='2024-2025', round_num=1)
+        modified_time = os.path.getmtime(file_path)
+
+        result = file_storage.save([{'idEvent': '1'}], 'rounds', league_id=4335, season='2024-2025', round_num=1)
+
+        assert result == 'Skipped unchanged rounds'
+        assert os.path.getmtime(file_path) == modified_time
+        assert file_storage.skip_counts == {'rounds': 1}
+
+    def test_changed_or_deleted_data_is_written(self, file_storage):
+        file_path = file_storage.save({'table': []}, 'league_table', league_id=4335, season='2024-2025')
+
+        assert file_storage.save({'table': [{'intRank': '1'}]}, 'league_table', league_id=4335,
+                                 season='2024-2025') == file_path
+        os.remove(file_path)
+        assert file_storage.save({'table': [{'intRank': '1'}]}, 'league_table', league_id=4335,
+                                 season='2024-2025') == file_path
+        assert file_storage.skip_counts == {}
+
+    def test_skip_unchanged_writes_can_be_disabled(self, mock_config):
+        file_storage = FileStorage(mock_config, skip_unchanged_writes=False)
+        file_storage.save({'countries': []}, 'countries')
+
+        assert file_storage.save({'countries': []}, 'countries') != 'Skipped unchanged countries'
+
+    def test_saved_events_are_appended_to_event_store(self, mock_config, tmp_path):
+        event_store = EventStore(str(tmp_path / 'events'))
+        file_storage = FileStorage(mock_config, event_store=event_store)
+
+        file_storage.save({'events': [{'idEvent': '1', 'strEvent': 'Barcelona vs Girona'}]}, 'season_matches',
+                          league_id=4335, season='2024-2025')
+
+        assert file_storage.get_event(1) == {'idEvent': '1', 'strEvent': 'Barcelona vs Girona'}
+        event_store.close()
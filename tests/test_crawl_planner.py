@@ -0,0 +1,60 @@
+import pytest
+from unittest.mock import Mock
+
+from sports_api.crawl_planner import CrawlPlanner
+from sports_api.storage.storage_interface import StorageInterface
+
+EVENTS = [
+    {'idEvent': '1', 'idLeague': '4335', 'strLeague': 'Spanish La Liga', 'idHomeTeam': '133739',
+     'idAwayTeam': '133738', 'idVenue': '16163'},
+    {'idEvent': '2', 'idLeague': '4335', 'strLeague': 'Spanish La Liga', 'idHomeTeam': '133729',
+     'idAwayTeam': '133739', 'idVenue': '16239'},
+]
+
+
+@pytest.fixture
+def storage():
+    storage = Mock(spec=StorageInterface)
+    storage.existing_ids.side_effect = lambda entity_type, ids: {
+        'leagues': {4335}, 'teams': {133739}, 'venues': {16163},
+    }[entity_type] & set(ids)
+    storage.load.return_value = None
+    return storage
+
+
+@pytest.fixture
+def api_client():
+    client = Mock()
+    client.get_teams_in_league.return_value = {'teams': [
+        {'idTeam': '133739', 'strTeam': 'Barcelona', 'idVenue': '16163'},
+        {'idTeam': '133738', 'strTeam': 'Real Madrid', 'idVenue': '16239'},
+        {'idTeam': '133729', 'strTeam': 'Atletico Madrid', 'idVenue': '16240'},
+    ]}
+    client.get_venues_details_many.side_effect = lambda ids: {
+        'results': {venue_id: {'venues': [{'idVenue': str(venue_id)}]} for venue_id in ids}, 'errors': {}
+    }
+    return client
+
+
+class TestCrawlPlanner:
+    def test_collect_references(self):
+        references = CrawlPlanner.collect_references(EVENTS)
+
+        assert references['leagues'] == {4335: 'Spanish La Liga'}
+        assert references['teams'] == {133739: 4335, 133738: 4335, 133729: 4335}
+        assert set(references['venues']) == {16163, 16239}
+
+    def test_plan_returns_only_missing_entities(self, api_client, storage):
+        missing = CrawlPlanner(api_client, storage).plan(EVENTS)
+
+        assert missing == {'leagues': {}, 'teams': {133738: 4335, 133729: 4335}, 'venues': {16239: None}}
+
+    def test_crawl_fetches_missing_entities_in_foreign_key_order(self, api_client, storage):
+        summary = CrawlPlanner(api_client, storage).crawl(EVENTS)
+
+        api_client.get_all_leagues.assert_not_called()
+        api_client.get_teams_in_league.assert_called_once_with('Spanish La Liga')
+        api_client.get_venues_details_many.assert_called_once_with([16239, 16240])
+        assert [call.args[1] for call in storage.save.call_args_list] == ['venues', 'teams']
+        assert summary['requests'] == 3
+        assert summary['unresolved'] == {'leagues': [], 'teams': [], 'venues': []}
@@ -0,0 +1,272 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from sports_api.analytics.ratings import EloRatings
+from sports_api.config import Config
+from sports_api.data_scraper import DataScraper
+from sports_api.services.raw_response import RawResponse
+from sports_api.storage.file_storage import FileStorage
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = Config(api_key='test_api_key', base_url='http://test.com/api')
+    config.config_data = {'data': {'output_path': str(tmp_path)}}
+    return config
+
+
+@pytest.fixture
+def api_client():
+    client = Mock()
+    client.max_workers = 4
+    client.get_all_countries.return_value = {'countries': [{'name_en': 'Spain'}]}
+    return client
+
+
+@pytest.fixture
+def scraper(config, api_client):
+    return DataScraper(config, api_client=api_client, storage=FileStorage(config))
+
+
+class TestDataScraper:
+    def test_fresh_data_is_served_from_storage(self, scraper, api_client):
+        first = scraper.scrape_countries()
+        second = scraper.scrape_countries()
+
+        api_client.get_all_countries.assert_called_once_with()
+        assert first == second == {'countries': [{'name_en': 'Spain'}]}
+
+    def test_force_refresh_calls_api(self, scraper, api_client):
+        scraper.scrape_countries()
+        scraper.scrape_countries(force_refresh=True)
+
+        assert api_client.get_all_countries.call_count == 2
+
+    def test_stale_data_is_scraped_again(self, scraper, api_client):
+        scraper.scrape_countries()
+        scraper.freshness.mark_scraped('countries|||', now=1.0)
+
+        scraper.scrape_countries()
+
+        assert api_client.get_all_countries.call_count == 2
+
+    def test_unsaved_data_is_not_marked_fresh(self, scraper, api_client):
+        scraper.scrape_countries(save_data=False)
+        scraper.scrape_countries(save_data=False)
+
+        assert api_client.get_all_countries.call_count == 2
+
+    def test_empty_response_is_not_marked_fresh(self, scraper, api_client):
+        api_client.get_all_countries.return_value = {'countries': None}
+        scraper.scrape_countries()
+        api_client.get_all_countries.return_value = {'countries': [{'name_en': 'Spain'}]}
+
+        assert scraper.scrape_countries() == {'countries': [{'name_en': 'Spain'}]}
+        assert api_client.get_all_countries.call_count == 2
+
+    def test_raw_responses_are_marked_fresh_without_decoding(self, scraper, api_client):
+        api_client.get_all_countries.return_value = RawResponse(b'{"countries": null}')
+        scraper.scrape_countries()
+        api_client.get_all_countries.return_value = RawResponse(b'{"countries": [{"name_en": "Spain"}]}')
+
+        data = scraper.scrape_countries()
+        scraper.scrape_countries()
+
+        assert api_client.get_all_countries.call_count == 2
+        assert not data._decoded
+
+    def test_freshness_is_disabled_for_storages_that_cannot_load(self, config, api_client):
+        storage = Mock(supports_load=False)
+
+        scraper = DataScraper(config, api_client=api_client, storage=storage)
+        scraper.scrape_countries()
+        scraper.scrape_countries()
+
+        assert scraper.freshness is None
+        assert api_client.get_all_countries.call_count == 2
+
+    def test_data_types_without_ttl_always_call_api(self, scraper, api_client):
+        api_client.get_league_table.return_value = {'table': []}
+
+        scraper.scrape_league_table(4335, '2024-2025', save_data=True)
+        scraper.scrape_league_table(4335, '2024-2025', save_data=True)
+
+        assert api_client.get_league_table.call_count == 2
+
+    def test_raw_responses_are_not_decoded_for_the_league_resolver(self, scraper, api_client):
+        api_client.get_all_leagues.return_value = RawResponse(b'{"leagues": [{"idLeague": "4337"}]}')
+
+        data = scraper.scrape_leagues(save_data=False)
+
+        assert not data._decoded
+
+    def test_scrape_teams_uses_resolved_league_name(self, scraper, api_client):
+        api_client.get_all_leagues.return_value = {'leagues': [{'idLeague': '4337', 'strLeague': 'Dutch Eredivisie'}]}
+        api_client.get_teams_in_league.return_value = {'teams': [{'idTeam': '133776', 'strTeam': 'Ajax'}]}
+
+        scraper.scrape_leagues()
+        scraper.scrape_teams_by_league(4337)
+
+        api_client.get_teams_in_league.assert_called_once_with('Dutch Eredivisie')
+        assert scraper.storage.query('teams', league_id=4337)[0]['path'].endswith('teams_dutch_eredivisie_.json')
+
+
+def events_by_round(last_round, last_played=None):
+    last_played = last_round if last_played is None else last_played
+    return lambda league_id, round_num, season: {
+        'events': [{'idEvent': str(round_num), 'intRound': str(round_num),
+                    'strStatus': 'Match Finished' if round_num <= last_played else 'Not Started'}]
+        if round_num <= last_round else None
+    }
+
+
+@patch('sports_api.data_scraper.sleep')
+class TestRoundDiscovery:
+    def test_discovery_stops_after_empty_rounds_and_is_cached(self, mock_sleep, scraper, api_client):
+        api_client.get_events_by_round.side_effect = events_by_round(34)
+
+        first = scraper.scrape_all_rounds(4331, '2024-2025', save_all_rounds=True)
+
+        assert len(first) == 34
+        assert api_client.get_events_by_round.call_count == 36
+        assert scraper.round_ranges.get(4331, '2024-2025') == list(range(1, 35))
+        assert scraper.storage.query('rounds', league_id=4331)[0]['path'].endswith('rounds_1_to_34.json')
+
+        api_client.get_events_by_round.reset_mock()
+        second = scraper.scrape_all_rounds(4331, '2024-2025')
+
+        assert len(second) == 34
+        assert api_client.get_events_by_round.call_count == 34
+
+    def test_rounds_are_taken_from_stored_season_overview(self, mock_sleep, scraper, api_client):
+        scraper.storage.save({'events': [{'idEvent': '1', 'intRound': '1'}, {'idEvent': '2', 'intRound': '2'}]},
+                             'season_matches', league_id=4335, season='2024-2025')
+        api_client.get_events_by_round.side_effect = events_by_round(2)
+
+        scraper.scrape_all_rounds(4335, '2024-2025')
+
+        assert [call.args[1] for call in api_client.get_events_by_round.call_args_list] == [1, 2]
+
+    def test_special_rounds_are_probed_on_request(self, mock_sleep, scraper, api_client):
+        api_client.get_events_by_round.side_effect = lambda league_id, round_num, season: {
+            'events': [{'idEvent': str(round_num), 'intRound': str(round_num), 'strStatus': 'FT'}]
+            if round_num in (1, 2, 200) else None
+        }
+
+        data = scraper.scrape_all_rounds(4480, '2024-2025', include_special_rounds=True)
+
+        assert [match['intRound'] for match in data] == ['1', '2', '200']
+        assert scraper.round_ranges.get(4480, '2024-2025') == [1, 2, 200]
+
+    def test_discovery_stops_when_every_round_fails(self, mock_sleep, scraper, api_client):
+        api_client.get_events_by_round.side_effect = ConnectionError('API unavailable')
+
+        data = scraper.scrape_all_rounds(4331, '2024-2025', max_errors=3)
+
+        assert data == []
+        assert api_client.get_events_by_round.call_count == 3
+        assert scraper.round_ranges.get(4331, '2024-2025') is None
+
+    def test_season_in_progress_is_discovered_again(self, mock_sleep, scraper, api_client):
+        # Only the first 10 rounds are scheduled yet and round 10 is still to be played
+        api_client.get_events_by_round.side_effect = events_by_round(10, last_played=9)
+        scraper.scrape_all_rounds(4331, '2024-2025')
+
+        assert scraper.round_ranges.get(4331, '2024-2025') is None
+
+        api_client.get_events_by_round.side_effect = events_by_round(20, last_played=10)
+        data = scraper.scrape_all_rounds(4331, '2024-2025')
+
+        assert len(data) == 20
+
+    def test_explicit_end_round_is_not_cached(self, mock_sleep, scraper, api_client):
+        api_client.get_events_by_round.side_effect = events_by_round(38)
+
+        scraper.scrape_all_rounds(4335, '2024-2025', start_round=1, end_round=3)
+
+        assert api_client.get_events_by_round.call_count == 3
+        assert scraper.round_ranges.get(4335, '2024-2025') is None
+
+
+def season_events(rounds, teams=20):
+    events = []
+    for round_num in rounds:
+        for match in range(teams // 2):
+            events.append({'idEvent': f'{round_num}-{match}', 'intRound': str(round_num),
+                           'idHomeTeam': str(2 * match), 'idAwayTeam': str(2 * match + 1),
+                           'strTimestamp': f'2024-08-{match + 10:02d}T19:00:00', 'strStatus': 'Match Finished'})
+    return events
+
+
+class TestSeasonMatches:
+    def test_uncapped_season_is_returned_as_is(self, scraper, api_client):
+        api_client.get_events_in_league_by_season.return_value = {'events': season_events([1, 2])}
+
+        data = scraper.scrape_season_matches(4335, '2024-2025', save_data=False)
+
+        assert len(data['events']) == 20
+        api_client.get_events_by_round.assert_not_called()
+
+    def test_capped_season_is_completed_from_rounds(self, scraper, api_client):
+        capped = season_events(range(1, 11))
+        api_client.get_events_in_league_by_season.return_value = {'events': capped}
+        api_client.get_events_by_round.side_effect = lambda league_id, round_num, season: {
+            'events': season_events([round_num])
+        }
+
+        data = scraper.scrape_season_matches(4335, '2024-2025', save_data=False)
+
+        fetched_rounds = sorted(call.args[1] for call in api_client.get_events_by_round.call_args_list)
+        assert fetched_rounds == list(range(11, 39))
+        assert len(data['events']) == 380
+        assert len({event['idEvent'] for event in data['events']}) == 380
+        assert [event['intRound'] for event in data['events']][::10] == [str(r) for r in range(1, 39)]
+        assert scraper.round_ranges.get(4335, '2024-2025') == list(range(1, 39))
+
+
+class TestLeagueTable:
+    def test_table_is_computed_from_stored_matches_and_updated_incrementally(self, scraper, api_client):
+        first_round = [{'idEvent': '1', 'intRound': '1', 'idHomeTeam': '1', 'idAwayTeam': '2',
+                        'intHomeScore': '2', 'intAwayScore': '1', 'strStatus': 'Match Finished'}]
+        scraper.storage.save(first_round, 'rounds', league_id=4335, season='2024-2025', round_num=1)
+
+        table = scraper.compute_league_table(4335, '2024-2025')['table']
+
+        assert [(row['idTeam'], row['intPoints']) for row in table] == [('1', 3), ('2', 0)]
+        api_client.get_league_table.assert_not_called()
+
+        api_client.get_events_in_league_by_season.return_value = {'events': [
+            {'idEvent': '2', 'intRound': '2', 'idHomeTeam': '2', 'idAwayTeam': '1',
+             'intHomeScore': '3', 'intAwayScore': '0', 'strStatus': 'Match Finished'}]}
+        scraper.scrape_season_matches(4335, '2024-2025', save_data=False)
+
+        table = scraper.compute_league_table(4335, '2024-2025')['table']
+        assert [(row['idTeam'], row['intPoints']) for row in table] == [('2', 3), ('1', 3)]
+
+
+FINISHED_EVENTS = {'events': [
+    {'idEvent': '1', 'idLeague': '4335', 'intRound': '1', 'strTimestamp': '2024-08-15T19:00:00',
+     'idHomeTeam': '1', 'idAwayTeam': '2', 'intHomeScore': '2', 'intAwayScore': '0', 'strStatus': 'Match Finished'}]}
+
+
+class TestRatings:
+    def test_saved_events_update_ratings_once(self, config, api_client):
+        scraper = DataScraper(config, api_client=api_client, storage=FileStorage(config),
+                              ratings=EloRatings.from_config(config))
+        api_client.get_events_in_league_by_season.return_value = FINISHED_EVENTS
+
+        scraper.scrape_season_matches(4335, '2024-2025')
+        rating = scraper.ratings.rating(1)
+        scraper.scrape_season_matches(4335, '2024-2025')
+
+        assert rating > 1500
+        assert scraper.ratings.rating(1) == rating
+        assert scraper.ratings.matches_played['1'] == 1
+
+    def test_ratings_are_off_by_default(self, scraper, api_client, tmp_path):
+        api_client.get_events_in_league_by_season.return_value = FINISHED_EVENTS
+
+        scraper.scrape_season_matches(4335, '2024-2025')
+
+        assert scraper.ratings is None
+        assert not (tmp_path / EloRatings.FILE_NAME).exists()
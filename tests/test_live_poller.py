@@ -0,0 +1,138 @@
+import datetime
+from unittest.mock import Mock, patch
+
+from sports_api.config import Config
+from sports_api.data_scraper import DataScraper
+from sports_api.live_poller import LivePoller, parse_kickoff, parse_match_day
+from sports_api.storage.file_storage import FileStorage
+
+KICKOFF = datetime.datetime(2024, 8, 17, 14, 0, tzinfo=datetime.timezone.utc).timestamp()
+
+
+def event(event_id, round_num=1, kickoff=KICKOFF, home=None, away=None, status='Not Started'):
+    return {'idEvent': str(event_id), 'intRound': str(round_num), 'intHomeScore': home, 'intAwayScore': away,
+            'strStatus': status,
+            'strTimestamp': datetime.datetime.fromtimestamp(kickoff, datetime.timezone.utc).isoformat()}
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_parse_kickoff():
+    assert parse_kickoff({'strTimestamp': '2024-08-17T14:00:00'}) == KICKOFF
+    assert parse_kickoff({'strTimestamp': '2024-08-17T16:00:00+02:00'}) == KICKOFF
+    assert parse_kickoff({'dateEvent': '2024-08-17', 'strTime': '14:00:00'}) == KICKOFF
+    assert parse_kickoff({'dateEvent': '2024-08-17'}) is None  # no kickoff time, not midnight
+    assert parse_kickoff({'dateEvent': 'unknown'}) is None
+    assert parse_match_day({'dateEvent': '2024-08-17'}) == KICKOFF - 14 * 3600
+    assert parse_kickoff({}) is None
+
+
+class TestLivePoller:
+    def test_next_delay_follows_match_windows(self):
+        poller = LivePoller(Mock(), 4328, '2024-2025', [event(1), event(2, round_num=2, kickoff=KICKOFF + 86400)],
+                            interval=30, idle_interval=3600, before=600, after=7200)
+
+        assert poller.next_delay(KICKOFF - 2 * 86400) == 3600
+        assert poller.next_delay(KICKOFF - 700) == 100
+        assert poller.next_delay(KICKOFF + 60) == 30
+        assert poller.active_rounds(KICKOFF + 60) == [1]
+        assert poller.next_delay(KICKOFF + 7200) == 3600
+        assert poller.active_rounds(KICKOFF + 86400) == [2]
+        assert poller.next_delay(KICKOFF + 86400 + 7200) is None
+
+    def test_finished_and_postponed_matches_have_no_window(self):
+        poller = LivePoller(Mock(), 4328, '2024-2025', [event(1, home=2, away=1, status='Match Finished'),
+                                                        event(2, status='Match Postponed')])
+
+        assert poller.active_rounds(KICKOFF) == []
+        assert poller.next_delay(KICKOFF) is None
+
+    def test_database_rows_without_kickoff_time_are_polled_on_match_day(self):
+        evening = KICKOFF + 6 * 3600  # 20:00
+        row = {'idEvent': 1, 'intRound': 1, 'dateEvent': '2024-08-17', 'intHomeScore': None, 'intAwayScore': None,
+               'strStatus': 'Not Started'}
+        storage = Mock(spec=['matches_dao'])
+        storage.matches_dao.get_matches.return_value = [row]
+        api_client = Mock()
+        api_client.get_events_by_round.return_value = {'events': [event(1, kickoff=evening)]}
+        poller = LivePoller.from_storage(api_client, storage, 4328, '2024-2025', before=600, after=7200)
+
+        assert poller.active_rounds(evening) == [1]
+        assert poller.next_delay(KICKOFF - 86400) == 3600
+
+        assert poller.poll(KICKOFF) == []
+        # The polled event has its kickoff time, so the window narrows to the match
+        assert poller.active_rounds(KICKOFF) == []
+        assert poller.next_delay(KICKOFF) == 3600
+        assert poller.active_rounds(evening) == [1]
+
+    def test_poll_returns_only_changed_events(self):
+        api_client = Mock()
+        poller = LivePoller(api_client, 4328, '2024-2025', [event(1), event(2)])
+        api_client.get_events_by_round.return_value = {'events': [event(1, home='1', away='0', status='1H'),
+                                                                  event(2)]}
+
+        changed = poller.poll(KICKOFF + 600)
+
+        assert [item['idEvent'] for item in changed] == ['1']
+        api_client.get_events_by_round.assert_called_once_with(4328, 1, '2024-2025')
+        assert poller.poll(KICKOFF + 660) == []
+
+    def test_stored_integer_scores_match_api_strings(self):
+        poller = LivePoller(Mock(), 4328, '2024-2025', [event(1, home=1, away=0, status='2H')])
+
+        assert poller.update([event(1, home='1', away='0', status='2H')]) == []
+
+    def test_run_sleeps_until_kickoff_and_stops_after_the_final_whistle(self):
+        clock = FakeClock(KICKOFF - 3600)
+        api_client = Mock()
+        responses = iter([[event(1, home='0', away='0', status='1H')],
+                          [event(1, home='0', away='0', status='1H')],
+                          [event(1, home='1', away='0', status='Match Finished')]])
+        api_client.get_events_by_round.side_effect = lambda *args: {'events': next(responses)}
+        poller = LivePoller(api_client, 4328, '2024-2025', [event(1)], interval=60, before=600,
+                            clock=clock, sleep=clock.sleep)
+
+        batches = list(poller.run())
+
+        assert [[(item['intHomeScore'], item['strStatus']) for item in batch] for batch in batches] == [
+            [('0', '1H')], [('1', 'Match Finished')]]
+        assert poller.polls == 3
+        assert clock.now == KICKOFF - 600 + 2 * 60
+
+    def test_run_stops_after_max_polls(self):
+        clock = FakeClock(KICKOFF)
+        api_client = Mock()
+        api_client.get_events_by_round.return_value = {'events': [event(1)]}
+        poller = LivePoller(api_client, 4328, '2024-2025', [event(1)], clock=clock, sleep=clock.sleep)
+
+        assert list(poller.run(max_polls=2)) == []
+        assert api_client.get_events_by_round.call_count == 2
+
+
+@patch('sports_api.data_scraper.sleep')
+def test_poll_live_saves_changed_rounds(mock_sleep, tmp_path):
+    config = Config(api_key='test_api_key', base_url='http://test.com/api')
+    config.config_data = {'data': {'output_path': str(tmp_path)}}
+    storage = FileStorage(config)
+    storage.save([event(1), event(2)], 'rounds', league_id=4328, season='2024-2025', round_num=1)
+    api_client = Mock()
+    api_client.quota = None
+    api_client.get_events_by_round.return_value = {
+        'events': [event(1, home='2', away='0', status='Match Finished'), event(2)]}
+    scraper = DataScraper(config, api_client=api_client, storage=storage)
+
+    batches = list(scraper.poll_live(4328, '2024-2025', max_polls=1, clock=lambda: KICKOFF + 3600))
+
+    assert [[item['idEvent'] for item in batch] for batch in batches] == [['1']]
+    saved = FileStorage(config).load('rounds', league_id=4328, season='2024-2025', round_num=1)
+    assert [(item['idEvent'], item['intHomeScore']) for item in saved] == [('1', '2'), ('2', None)]
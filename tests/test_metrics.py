@@ -0,0 +1,57 @@
+import urllib.request
+
+import pytest
+
+from sports_api.config import Config
+from sports_api.metrics import MetricsRegistry, endpoint_name
+from sports_api.storage.file_storage import FileStorage
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+class TestMetricsRegistry:
+    def test_endpoint_name_drops_query(self):
+        assert endpoint_name('eventsround.php?id=4328&r=38&s=2024-2025') == 'eventsround.php'
+
+    def test_request_metrics_are_rendered_per_endpoint(self, metrics):
+        metrics.record_request('eventsround.php', 0.2, status=200, size=1000)
+        metrics.record_request('eventsround.php', 3.0, status=429, size=10, error='HTTPError')
+
+        text = metrics.render()
+
+        assert 'sportsdb_request_duration_seconds_bucket{endpoint="eventsround.php",le="0.25"} 1' in text
+        assert 'sportsdb_request_duration_seconds_bucket{endpoint="eventsround.php",le="5.0"} 2' in text
+        assert 'sportsdb_request_duration_seconds_bucket{endpoint="eventsround.php",le="+Inf"} 2' in text
+        assert 'sportsdb_request_duration_seconds_count{endpoint="eventsround.php"} 2' in text
+        assert 'sportsdb_response_bytes_total{endpoint="eventsround.php"} 1010' in text
+        assert 'sportsdb_responses_total{endpoint="eventsround.php",status="429"} 1' in text
+        assert 'sportsdb_request_errors_total{endpoint="eventsround.php",error="HTTPError"} 1' in text
+
+    def test_storage_saves_are_timed_per_data_type(self, tmp_path, metrics):
+        config = Config(api_key='test_api_key', base_url='http://test.com/api')
+        config.config_data = {'data': {'output_path': str(tmp_path)}}
+        storage = FileStorage(config, metrics=metrics)
+
+        storage.save({'countries': [{'name_en': 'Spain'}]}, 'countries')
+        storage.save({'countries': [{'name_en': 'Spain'}]}, 'countries')
+
+        assert 'sportsdb_storage_save_duration_seconds_count{data_type="countries"} 2' in metrics.render()
+
+    def test_write_and_serve(self, tmp_path, metrics):
+        metrics.record_request('all_countries.php', 0.1, status=200, size=5)
+
+        path = metrics.write(str(tmp_path / 'metrics' / 'sportsdb.prom'))
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == metrics.render()
+
+        server = metrics.serve(port=0)
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{server.server_address[1]}/metrics') as response:
+                assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+                assert b'sportsdb_responses_total{endpoint="all_countries.php",status="200"} 1' in response.read()
+        finally:
+            server.shutdown()
+            server.server_close()
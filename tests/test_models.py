@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+import pytest
+
+from sports_api.api_client import ApiClient
+from sports_api.models import Event, Player, Team, iter_records
+from sports_api.services.schedule_service import ScheduleService
+
+
+@pytest.fixture
+def api_event():
+    return {'idEvent': '2076036', 'idLeague': '4335', 'strSeason': '2024-2025', 'strEvent': 'Athletic vs Getafe',
+            'idHomeTeam': '133939', 'idAwayTeam': '134221', 'strTimestamp': '2024-08-15T17:00:00',
+            'intHomeScore': '1', 'intAwayScore': '1', 'intRound': '1', 'strStatus': 'Match Finished',
+            'strThumb': 'https://example.com/thumb.jpg', 'strVideo': '', 'intSpectators': None}
+
+
+class TestRecords:
+    def test_from_api_keeps_typed_stored_fields(self, api_event):
+        event = Event.from_api(api_event)
+
+        assert event.id == 2076036
+        assert event.home_score == 1
+        assert event.round_number == 1
+        assert event.status == 'Match Finished'
+        assert not hasattr(event, '__dict__')
+        with pytest.raises(AttributeError):
+            event.strThumb = 'x'
+
+    def test_missing_and_invalid_values_become_none(self):
+        player = Player.from_api({'idPlayer': '34145937', 'strPlayer': 'Danny Welbeck', 'strNumber': '',
+                                  'dateBorn': '1990-11-26'})
+
+        assert player.jersey_number is None
+        assert player.birth_date == '1990-11-26'
+        assert Player.from_api({'idPlayer': '1', 'strNumber': 'N/A'}).jersey_number is None
+
+    def test_get_and_to_api_use_api_field_names(self, api_event):
+        event = Event.from_api(api_event)
+
+        assert event.get('idHomeTeam') == 133939
+        assert event.get('strThumb', 'default') == 'default'
+        assert Event.from_api(event.to_api()) == event
+
+    def test_iter_records_finds_response_key(self, api_event):
+        assert list(iter_records({'events': [api_event]}, Event)) == [Event.from_api(api_event)]
+        assert list(iter_records({'teams': None}, Team)) == []
+        assert list(iter_records([{'idTeam': '1', 'strTeam': 'A'}], Team))[0].name == 'A'
+
+
+class TestApiClientProjection:
+    @patch.object(ScheduleService, 'get_events_by_round')
+    def test_as_records_is_opt_in(self, mock_round, api_event):
+        mock_round.return_value = {'events': [api_event]}
+        client = ApiClient(api_key='test_api_key', base_url='http://test.com/api')
+
+        assert client.get_events_by_round(4335, 1, '2024-2025') == {'events': [api_event]}
+        assert client.get_events_by_round(4335, 1, '2024-2025', as_records=True) == [Event.from_api(api_event)]
@@ -0,0 +1,128 @@
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sports_api.config import Config
+from sports_api.data_scraper import DataScraper
+from sports_api.profiling import ScrapeProfiler
+from sports_api.services.hooks import HookRegistry, RequestContext
+from sports_api.storage.file_storage import FileStorage
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = Config(api_key='test_api_key', base_url='http://test.com/api')
+    config.config_data = {'data': {'output_path': str(tmp_path)}}
+    return config
+
+
+class TestScrapeProfiler:
+    def test_disabled_by_default(self, config):
+        assert ScrapeProfiler.from_config(config, 'job') is None
+
+    def test_request_is_split_into_fetch_and_decode(self, tmp_path):
+        hooks = HookRegistry()
+        profiler = ScrapeProfiler('job', str(tmp_path))
+        profiler.attach(Mock(hooks=hooks))
+
+        def api_call():
+            context = RequestContext('eventsround.php', 'eventsround.php?id=1')
+            context.elapsed = 0.01
+            hooks.run('after_response', context)
+            time.sleep(0.02)
+
+        with profiler.request('round 1'):
+            api_call()
+
+        timings = profiler.timings['round 1']
+        assert timings['fetch'] == pytest.approx(0.01)
+        assert timings['decode'] >= 0.005
+
+    def test_finish_writes_report_collapsed_stacks_and_profiles(self, tmp_path):
+        profiler = ScrapeProfiler('scrape_all_rounds', str(tmp_path / 'profiles'), use_cprofile=True,
+                                  use_tracemalloc=True)
+        profiler.start()
+        with profiler.stage('save', 'round 1'):
+            json.dumps([{'idEvent': str(i)} for i in range(1000)])
+
+        paths = profiler.finish()
+
+        with open(paths['report'], encoding='utf-8') as f:
+            report = json.load(f)
+        assert report['job'] == 'scrape_all_rounds'
+        assert report['labels']['round 1']['save'] > 0
+        assert set(report['stages']) >= {'fetch', 'decode', 'transform', 'save'}
+        assert report['cprofile_top']
+        assert report['memory']['peak_bytes'] > 0
+        with open(paths['collapsed'], encoding='utf-8') as f:
+            assert f.read().startswith('scrape_all_rounds;round 1;save ')
+        assert paths['cprofile'].endswith('.prof')
+
+
+class TestScraperProfiling:
+    @patch('sports_api.data_scraper.sleep')
+    def test_rounds_are_profiled_per_stage(self, mock_sleep, config, tmp_path):
+        api_client = Mock(hooks=HookRegistry())
+        api_client.get_events_by_round.return_value = {'events': [{'idEvent': '1', 'intRound': '1'}]}
+        profiler = ScrapeProfiler('scrape_all_rounds', str(tmp_path))
+        scraper = DataScraper(config, api_client=api_client, storage=FileStorage(config), profiler=profiler)
+
+        scraper.scrape_all_rounds(4335, '2024-2025', start_round=1, end_round=2, save_all_rounds=True,
+                                  save_individual_rounds=True)
+
+        assert set(profiler.timings['round 1']) == {'fetch', 'decode', 'transform', 'save'}
+        assert set(profiler.timings['round 2']) == {'fetch', 'decode', 'transform', 'save'}
+        assert 'save' in profiler.timings['rounds']
+
+    @patch('sports_api.data_scraper.sleep')
+    def test_stage_totals_do_not_exceed_wall_time(self, mock_sleep, config, tmp_path):
+        hooks = HookRegistry()
+
+        def get_events_by_round(league_id, round_num, season):
+            time.sleep(0.05)
+            context = RequestContext('eventsround.php', f'eventsround.php?r={round_num}')
+            context.elapsed = 0.05
+            hooks.run('after_response', context)
+            return {'events': [{'idEvent': str(round_num), 'intRound': str(round_num)}]}
+
+        api_client = Mock(hooks=hooks)
+        api_client.get_events_by_round.side_effect = get_events_by_round
+        profiler = ScrapeProfiler('scrape_all_rounds', str(tmp_path))
+        scraper = DataScraper(config, api_client=api_client, storage=FileStorage(config), profiler=profiler)
+
+        start = time.perf_counter()
+        scraper.scrape_all_rounds(4335, '2024-2025', start_round=1, end_round=4, save_individual_rounds=True)
+        wall_time = time.perf_counter() - start
+
+        stages = profiler.report()['stages']
+        assert sum(stages.values()) <= wall_time
+        assert stages['fetch'] == pytest.approx(0.2)
+        assert 'fetch' not in profiler.timings.get('rounds', {})
+
+    def test_concurrent_round_fetches_are_booked_as_fetch(self, config, tmp_path):
+        hooks = HookRegistry()
+
+        def api_call(endpoint, events):
+            time.sleep(0.02)
+            context = RequestContext(endpoint, endpoint)
+            context.elapsed = 0.02
+            hooks.run('after_response', context)
+            return {'events': events}
+
+        capped = [{'idEvent': f'{round_num}-{match}', 'intRound': str(round_num), 'idHomeTeam': str(2 * match),
+                   'idAwayTeam': str(2 * match + 1)} for round_num in range(1, 11) for match in range(10)]
+        api_client = Mock(hooks=hooks, max_workers=4)
+        api_client.get_events_in_league_by_season.side_effect = lambda *args: api_call('eventsseason.php', capped)
+        api_client.get_events_by_round.side_effect = lambda league_id, round_num, season: api_call(
+            'eventsround.php', [{'idEvent': f'{round_num}-0', 'intRound': str(round_num), 'idHomeTeam': '0',
+                                 'idAwayTeam': '1'}])
+        profiler = ScrapeProfiler('scrape_season_matches', str(tmp_path))
+        scraper = DataScraper(config, api_client=api_client, storage=FileStorage(config), profiler=profiler)
+
+        scraper.scrape_season_matches(4335, '2024-2025', save_data=False)
+
+        assert profiler.timings['season_matches']['fetch'] == pytest.approx(0.02)
+        assert profiler.timings['round 11']['fetch'] == pytest.approx(0.02)
+        assert profiler.report()['stages']['fetch'] == pytest.approx(0.02 * 29)
@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+import urllib.request
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from sports_api.config import Config
+from sports_api.metrics import MetricsRegistry
+from sports_api.proxy import CachingProxy, load_config
+
+
+def upstream_response(body=b'{"events": []}', status_code=200):
+    return Mock(status_code=status_code, content=body)
+
+
+@pytest.fixture
+def proxy():
+    return CachingProxy('http://upstream.test/api/v1/json', ttls={'eventsround.php': 60}, metrics=MetricsRegistry())
+
+
+@patch('sports_api.proxy.requests.get')
+class TestCachingProxy:
+    def test_responses_are_cached_per_endpoint(self, mock_get, proxy):
+        mock_get.return_value = upstream_response()
+
+        assert proxy.fetch('3', 'eventsround.php?id=4328&r=1') == (200, b'{"events": []}', 'MISS')
+        assert proxy.fetch('3', 'eventsround.php?id=4328&r=1')[2] == 'HIT'
+        assert proxy.fetch('3', 'eventsround.php?id=4328&r=2')[2] == 'MISS'
+
+        mock_get.assert_any_call('http://upstream.test/api/v1/json/3/eventsround.php?id=4328&r=1', timeout=30.0)
+        assert mock_get.call_count == 2
+
+    def test_expired_and_uncached_endpoints_go_upstream(self, mock_get, proxy):
+        mock_get.return_value = upstream_response()
+
+        proxy.fetch('3', 'livescore.php')
+        proxy.fetch('3', 'livescore.php')
+        proxy.fetch('3', 'eventsround.php?id=4328&r=1')
+        with patch('sports_api.proxy.time.time', return_value=time.time() + 61):
+            proxy.fetch('3', 'eventsround.php?id=4328&r=1')
+
+        assert mock_get.call_count == 4
+
+    def test_errors_are_not_cached_and_stale_data_is_served(self, mock_get, proxy):
+        mock_get.return_value = upstream_response(b'', 429)
+        assert proxy.fetch('3', 'eventsround.php?id=4328&r=1')[0] == 429
+
+        mock_get.return_value = upstream_response()
+        proxy.fetch('3', 'eventsround.php?id=4328&r=1')
+
+        mock_get.side_effect = requests.ConnectionError('down')
+        with patch('sports_api.proxy.time.time', return_value=time.time() + 61):
+            assert proxy.fetch('3', 'eventsround.php?id=4328&r=1') == (200, b'{"events": []}', 'STALE')
+        assert proxy.fetch('3', 'eventsround.php?id=4328&r=2')[0] == 502
+
+    def test_concurrent_misses_share_one_upstream_request(self, mock_get, proxy):
+        def slow_get(url, timeout):
+            time.sleep(0.1)
+            return upstream_response()
+
+        mock_get.side_effect = slow_get
+        states = []
+        threads = [threading.Thread(target=lambda: states.append(proxy.fetch('3', 'all_leagues.php')[2]))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_get.call_count == 1
+        assert sorted(states) == ['MISS'] + ['SHARED'] * 4
+
+    def test_unexpected_errors_are_shared_as_bad_gateway(self, mock_get, proxy):
+        def failing_get(url, timeout):
+            time.sleep(0.1)
+            raise ValueError('unexpected')
+
+        mock_get.side_effect = failing_get
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(proxy.fetch('3', 'all_leagues.php')))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_get.call_count == 1
+        assert sorted(results) == [(502, b'Bad Gateway', 'MISS')] + [(502, b'Bad Gateway', 'SHARED')] * 2
+
+    def test_serves_the_api_url_scheme(self, mock_get, proxy):
+        mock_get.return_value = upstream_response(b'{"leagues": []}')
+        server = proxy.start(port=0)
+        try:
+            host, port = server.server_address[:2]
+            # requests.get is patched, so the proxy is called with urllib
+            with urllib.request.urlopen(f'http://{host}:{port}/api/v1/json/3/all_leagues.php') as response:
+                body, cache_state = json.loads(response.read()), response.headers['X-Cache']
+        finally:
+            proxy.stop()
+
+        assert body == {'leagues': []}
+        assert cache_state == 'MISS'
+        mock_get.assert_called_once_with('http://upstream.test/api/v1/json/3/all_leagues.php', timeout=30.0)
+
+
+def test_config_pointing_at_the_proxy_is_loaded_without_verification(tmp_path):
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text('api:\n  key: "3"\n  base_url: http://127.0.0.1:8089/api/v1/json\n'
+                           'proxy:\n  port: 9000\n  ttl:\n    lookuptable.php: 60\n')
+
+    config = load_config(str(config_path))
+    proxy = CachingProxy.from_config(config)
+
+    assert isinstance(config, Config)
+    assert config.get_proxy_settings()['port'] == 9000
+    assert proxy.ttl('lookuptable.php?l=4328&s=2024-2025') == 60
+    assert proxy.ttl('all_countries.php') == 86400
+    assert proxy.upstream == 'https://www.thesportsdb.com/api/v1/json'
@@ -0,0 +1,65 @@
+from unittest.mock import Mock, patch
+
+from sports_api.config import Config
+from sports_api.data_scraper import DataScraper
+from sports_api.request_planner import RequestPlanner, ScrapeTask
+from sports_api.services.quota import QuotaTracker
+from sports_api.storage.file_storage import FileStorage
+
+
+def known_rounds(league_id, season):
+    return list(range(1, 35)) if league_id == 4331 else None
+
+
+class TestRequestPlanner:
+    def test_estimates(self):
+        planner = RequestPlanner(round_lookup=known_rounds)
+
+        assert planner.estimate(ScrapeTask(4328, '2024-2025', end_round=10)) == 10
+        assert planner.estimate(ScrapeTask(4331, '2024-2025', start_round=5)) == 30
+        assert planner.estimate(ScrapeTask(4328, '2024-2025')) == 38 + 2
+
+    def test_tasks_are_ordered_by_priority_and_deferred_when_over_budget(self):
+        planner = RequestPlanner(round_lookup=known_rounds)
+        low = ScrapeTask(4328, '2023-2024', end_round=10)
+        big = ScrapeTask(4328, '2024-2025', priority=1)
+        high = ScrapeTask(4331, '2024-2025', priority=2)
+
+        plan = planner.plan([low, big, high], budget=50)
+
+        assert plan['scheduled'] == [high, low]
+        assert plan['deferred'] == [big]
+        assert plan['estimated_calls'] == 44
+
+    def test_budget_defaults_to_the_remaining_quota(self):
+        quota = QuotaTracker('3', limits={'day': 45})
+        quota.record(10)
+        planner = RequestPlanner(quota)
+
+        plan = planner.plan([ScrapeTask(4328, '2024-2025'), ScrapeTask(4329, '2024-2025', end_round=5)])
+
+        assert plan['budget'] == 35
+        assert [task.league_id for task in plan['scheduled']] == [4329]
+
+    def test_no_limit_schedules_everything(self):
+        plan = RequestPlanner().plan([ScrapeTask(4328, '2024-2025'), ScrapeTask(4329, '2024-2025')])
+
+        assert len(plan['scheduled']) == 2 and plan['budget'] is None
+
+
+@patch('sports_api.data_scraper.sleep')
+def test_scrape_planned_runs_scheduled_tasks_only(mock_sleep, tmp_path):
+    config = Config(api_key='test_api_key', base_url='http://test.com/api')
+    config.config_data = {'data': {'output_path': str(tmp_path)}}
+    api_client = Mock()
+    api_client.quota = None
+    api_client.get_events_by_round.side_effect = lambda league_id, round_num, season: {
+        'events': [{'idEvent': f'{league_id}{round_num}', 'intRound': str(round_num)}]}
+    scraper = DataScraper(config, api_client=api_client, storage=FileStorage(config))
+
+    plan = scraper.scrape_planned([ScrapeTask(4328, '2024-2025', end_round=3),
+                                   ScrapeTask(4329, '2024-2025', end_round=3, priority=1)], budget=4)
+
+    assert [task.league_id for task in plan['scheduled']] == [4329]
+    assert plan['matches'] == [3]
+    assert api_client.get_events_by_round.call_count == 3
@@ -0,0 +1,45 @@
+from sports_api.utils.league_resolver import LeagueResolver, slugify
+
+
+class TestLeagueResolver:
+    def test_slugify(self):
+        assert slugify('Spanish La Liga') == 'spanish_la_liga'
+        assert slugify('Süper Lig') == 'super_lig'
+
+    def test_resolves_from_all_leagues_response(self):
+        resolver = LeagueResolver()
+
+        changed = resolver.update_from_response({'leagues': [
+            {'idLeague': '4335', 'strLeague': 'Spanish La Liga', 'strLeagueAlternate': 'LaLiga Santander'},
+            {'idLeague': '4337', 'strLeague': 'Dutch Eredivisie'},
+        ]})
+
+        assert changed == 2
+        assert resolver.name(4335) == 'Spanish La Liga'
+        assert resolver.slug(4335) == 'laliga'
+        assert resolver.slug(4337) == 'dutch_eredivisie'
+        assert resolver.resolve_id('dutch_eredivisie') == 4337
+        assert resolver.resolve_id('LaLiga Santander') == 4335
+
+    def test_resolves_from_search_all_leagues_response(self):
+        resolver = LeagueResolver()
+
+        resolver.update_from_response({'countries': [{'idLeague': '4338', 'strLeague': 'Belgian Pro League'}]})
+
+        assert resolver.name('4338') == 'Belgian Pro League'
+
+    def test_unknown_league(self):
+        resolver = LeagueResolver()
+
+        assert resolver.name(9999) is None
+        assert resolver.slug(9999) == 'league_9999'
+        assert resolver.slug(4328) == 'premier_league'
+
+    def test_index_is_persisted(self, tmp_path):
+        file_path = str(tmp_path / LeagueResolver.FILE_NAME)
+        LeagueResolver(file_path).update([{'idLeague': '4337', 'strLeague': 'Dutch Eredivisie'}])
+
+        resolver = LeagueResolver(file_path)
+
+        assert resolver.name(4337) == 'Dutch Eredivisie'
+        assert resolver.update([{'idLeague': '4337', 'strLeague': 'Dutch Eredivisie'}]) == 0
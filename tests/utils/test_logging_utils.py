@@ -0,0 +1,72 @@
+import json
+import logging
+
+import pytest
+
+from sports_api.utils.logging_utils import (RateLimitFilter, StructuredFormatter, configure_logging,
+                                             stop_logging)
+
+
+def make_record(message='Round %s: retrieved %s matches.', args=(1, 10), level=logging.INFO, **extra):
+    record = logging.LogRecord('sports_api.data_scraper', level, __file__, 1, message, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestStructuredFormatter:
+    def test_text_format_includes_extra_fields(self):
+        line = StructuredFormatter().format(make_record(league_id=4335, season='2024-2025'))
+
+        assert line.endswith('INFO    sports_api.data_scraper: Round 1: retrieved 10 matches. '
+                             'league_id=4335 season=2024-2025')
+
+    def test_json_format(self):
+        entry = json.loads(StructuredFormatter(json_lines=True).format(make_record(league_id=4335)))
+
+        assert entry['level'] == 'INFO'
+        assert entry['message'] == 'Round 1: retrieved 10 matches.'
+        assert entry['league_id'] == 4335
+
+
+class TestRateLimitFilter:
+    def test_repeated_templates_are_limited_and_counted(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr('sports_api.utils.logging_utils.time.monotonic', lambda: now[0])
+        rate_limit = RateLimitFilter(burst=2, interval=60)
+
+        allowed = [rate_limit.filter(make_record(args=(round_num, 10))) for round_num in range(5)]
+        assert allowed == [True, True, False, False, False]
+        assert rate_limit.filter(make_record(message='Other message', args=()))
+
+        now[0] = 61.0
+        record = make_record(args=(6, 10))
+        assert rate_limit.filter(record)
+        assert record.suppressed == 3
+
+    def test_errors_are_never_limited(self):
+        rate_limit = RateLimitFilter(burst=1, interval=60)
+
+        assert all(rate_limit.filter(make_record(level=logging.ERROR)) for _ in range(5))
+
+
+class TestConfigureLogging:
+    @pytest.fixture(autouse=True)
+    def restore_package_logger(self):
+        logger = logging.getLogger('sports_api')
+        handlers, level, propagate = list(logger.handlers), logger.level, logger.propagate
+        yield
+        logger.handlers, logger.level, logger.propagate = handlers, level, propagate
+
+    def test_records_are_written_by_the_queue_listener(self, capsys):
+        configure_logging('INFO', burst=1)
+        logger = logging.getLogger('sports_api.database.dao.matches_dao')
+
+        logger.debug('Match %s already exists.', 1)
+        logger.info('Saved %s matches', 10)
+        logger.info('Saved %s matches', 20)
+        stop_logging()
+
+        output = capsys.readouterr().err
+        assert 'already exists' not in output
+        assert 'Saved 10 matches' in output
+        assert 'Saved 20 matches' not in output